@@ -0,0 +1,13 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Benchmarks of the hooks on synthetic repositories.
+
+Run with ``python -m benchmarks``.
+"""
@@ -0,0 +1,17 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+import sys
+
+from benchmarks.hook_benchmarks import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
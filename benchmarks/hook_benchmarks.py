@@ -0,0 +1,451 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+"""Timing of the hooks on synthetic repositories of several scales, with baselines to
+detect regressions.
+
+Each benchmark is run several times on a warm file system cache, and its minimum and
+median durations are reported. Results saved with ``--output`` serve as baseline
+of a later run with ``--baseline``: benchmarks whose median is slower than the
+baseline by more than the threshold ratio (and than a minimum delta, to ignore the
+noise of the fastest ones) are flagged, and the run exits with an error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from benchmarks.synthetic_repo import (
+    SCALES,
+    RepoScale,
+    SyntheticRepo,
+    checkout_branch,
+    create_synthetic_repo,
+    end_rebase,
+    simulate_rebase,
+)
+from mirageoscience.hooks import __version__, git_message_hook
+from mirageoscience.hooks.check_copyright import check_files
+from mirageoscience.hooks.copyright_cache import CopyrightCache
+from mirageoscience.hooks.jira_patterns import (
+    DEFAULT_JIRA_PROJECT_KEYS,
+    compile_patterns,
+)
+
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_SCALES = ["small", "medium"]
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_MIN_DELTA = 0.005  # seconds
+_COMMIT_MESSAGE = (
+    "Some change to the synthetic content\n\n"
+    "With a body explaining the change.\n\n"
+    + "# Please enter the commit message for your changes.\n"
+    * 20
+)
+
+
+class Benchmark(NamedTuple):
+    """A timed call, with what must be prepared before each call, untimed."""
+
+    name: str
+    call: Callable[[], Any]
+    setup: Callable[[], Any] | None = None
+
+
+class Regression(NamedTuple):
+    """A benchmark slower than its baseline."""
+
+    scale: str
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """The ratio of the current median duration to the one of the baseline."""
+        return self.current / self.baseline
+
+
+@contextlib.contextmanager
+def _in_directory(path: Path) -> Iterator[None]:
+    """Runs the enclosed block in the given directory, as the hooks run at the root
+    of the repository."""
+    saved = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(saved)
+
+
+def _reset_message(repo: SyntheticRepo) -> None:
+    repo.message_file.write_text(_COMMIT_MESSAGE, encoding="utf-8")
+    # as in a new process: only the branch cache of the git directory remains
+    git_message_hook._branch_jira_ids.clear()  # pylint: disable=protected-access
+
+
+def copyright_benchmarks(repo: SyntheticRepo, cache_path: Path) -> list[Benchmark]:
+    """:return: the benchmarks of the copyright check."""
+    cache = CopyrightCache(cache_path)
+    jobs = os.cpu_count() or 1
+    return [
+        Benchmark("check_files", lambda: check_files(repo.source_files)),
+        Benchmark(
+            "check_files.parallel",
+            lambda: check_files(repo.source_files, jobs=jobs),
+        ),
+        Benchmark(
+            "check_files.warm_cache",
+            lambda: check_files(repo.source_files, cache=cache),
+            # the first call fills the cache, the next ones only check it
+            lambda: check_files(repo.source_files, cache=cache),
+        ),
+        Benchmark("check_files.huge_line", lambda: check_files([repo.huge_line_file])),
+        Benchmark(
+            "check_files.full_scan_readme",
+            lambda: check_files([repo.readme], full_scan_files=[repo.readme]),
+        ),
+    ]
+
+
+def branch_benchmarks(repo: SyntheticRepo, state: str) -> list[Benchmark]:
+    """:return: the benchmarks of the commit message hooks, in the given state of
+    the repository: on a branch, in a rebase, or with a detached HEAD."""
+    message_path = str(repo.message_file)
+    return [
+        Benchmark(f"get_branch_name.{state}", git_message_hook.get_branch_name),
+        Benchmark(
+            f"check_commit_message.{state}",
+            lambda: git_message_hook.check_commit_message(message_path),
+            lambda: _reset_message(repo),
+        ),
+        Benchmark(
+            f"prepare_commit_msg.{state}",
+            lambda: git_message_hook.prepare_commit_msg(message_path),
+            lambda: _reset_message(repo),
+        ),
+    ]
+
+
+def pattern_benchmarks(size: int) -> list[Benchmark]:
+    """:return: the benchmarks of the matchers of the commit messages and branch
+    descriptions, on adversarial inputs of the given number of characters, such as
+    pasted logs, that would make a backtracking pattern quadratic."""
+    patterns = compile_patterns(DEFAULT_JIRA_PROJECT_KEYS)
+    spaces = "fixup!" + " " * size + "x"
+    word = "a" * size + "!"
+    words = "(" + "a " * (size // 2)
+    return [
+        Benchmark("jira_id.spaces", functools.partial(patterns.jira_id, spaces)),
+        Benchmark("prefix_bang.word", functools.partial(patterns.prefix_bang, word)),
+        Benchmark(
+            "rebased_branch.words", functools.partial(patterns.rebased_branch, words)
+        ),
+    ]
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> dict[str, float | int]:
+    """Runs the benchmark the given number of times, after a warm-up run.
+
+    Returns:
+        dict: the minimum and median durations in seconds, and the number of runs.
+    """
+    durations = []
+    for run in range(repeat + 1):
+        if benchmark.setup is not None:
+            benchmark.setup()
+        start = time.perf_counter()
+        benchmark.call()
+        duration = time.perf_counter() - start
+        if run > 0:
+            durations.append(duration)
+    return {
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "runs": len(durations),
+    }
+
+
+def prepare_repo(workdir: Path, scale_name: str, seed: int = 0) -> SyntheticRepo:
+    """Generates the repository of the given scale in the working directory, or
+    reuses the one generated by a previous run with the same parameters."""
+    scale = SCALES[scale_name]
+    root = workdir / scale_name
+    marker = workdir / f"{scale_name}.json"
+    parameters = {"scale": scale._asdict(), "seed": seed, "version": __version__}
+    try:
+        description = json.loads(marker.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        description = None
+    if description is not None and description.get("parameters") == parameters:
+        checkout_branch(root)
+        return SyntheticRepo(
+            root,
+            description["source_files"],
+            description["placements"],
+            description["huge_line_file"],
+            description["readme"],
+            Path(description["message_file"]),
+        )
+
+    if root.exists():
+        shutil.rmtree(root)
+    repo = create_synthetic_repo(root, scale, seed)
+    description = {
+        "parameters": parameters,
+        "source_files": repo.source_files,
+        "placements": repo.placements,
+        "huge_line_file": repo.huge_line_file,
+        "readme": repo.readme,
+        "message_file": str(repo.message_file),
+    }
+    marker.write_text(json.dumps(description), encoding="utf-8")
+    return repo
+
+
+def run_scale(
+    repo: SyntheticRepo,
+    scale: RepoScale,
+    repeat: int,
+    report: Callable[[str, dict[str, float | int]], None],
+) -> dict[str, dict[str, float | int]]:
+    """Runs all the benchmarks on the given repository.
+
+    The commit message hooks are timed on the branch, during a rebase, and with a
+    detached HEAD, where the branch is found among all the local ones. Their
+    matchers are timed on adversarial messages as long as the huge line.
+
+    Args:
+        repo: the repository, on its branch.
+        scale: the size of the repository.
+        repeat: the number of timed runs of each benchmark.
+        report: called with the name and the timings of each benchmark, when done.
+
+    Returns:
+        dict: the timings of each benchmark.
+    """
+    results: dict[str, dict[str, float | int]] = {}
+
+    def run_all(benchmarks: list[Benchmark]) -> None:
+        for benchmark in benchmarks:
+            # the hooks report the issues of the synthetic files: not the point here
+            with (
+                contextlib.redirect_stdout(io.StringIO()),
+                contextlib.redirect_stderr(io.StringIO()),
+            ):
+                timings = time_benchmark(benchmark, repeat)
+            results[benchmark.name] = timings
+            report(benchmark.name, timings)
+
+    with _in_directory(repo.root), tempfile.TemporaryDirectory() as cache_dir:
+        run_all(copyright_benchmarks(repo, Path(cache_dir) / "cache.json"))
+        run_all(pattern_benchmarks(scale.huge_line_bytes))
+        try:
+            checkout_branch(repo.root)
+            run_all(branch_benchmarks(repo, "branch"))
+            simulate_rebase(repo.root, scale.rebase_steps)
+            run_all(branch_benchmarks(repo, "rebase"))
+            end_rebase(repo.root)
+            run_all(branch_benchmarks(repo, "detached"))
+        finally:
+            checkout_branch(repo.root)
+    return results
+
+
+def environment(scales: list[str], repeat: int) -> dict[str, Any]:
+    """:return: the description of the run, saved along with its results."""
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "scales": {name: SCALES[name]._asdict() for name in scales},
+        "repeat": repeat,
+    }
+
+
+def find_regressions(
+    results: dict[str, dict[str, dict[str, float | int]]],
+    baseline: dict[str, dict[str, dict[str, float | int]]],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> list[Regression]:
+    """Compares the median durations of the benchmarks to the ones of a baseline.
+
+    Benchmarks missing from the baseline, as new ones, are not compared.
+
+    Args:
+        results: the timings of each benchmark, by scale.
+        baseline: the timings of a previous run, in the same format.
+        threshold: the ratio of the durations beyond which a benchmark regressed.
+        min_delta: the difference of durations in seconds below which a benchmark
+            did not regress, whatever the ratio.
+
+    Returns:
+        list[Regression]: the benchmarks that regressed.
+    """
+    regressions = []
+    for scale, timings in results.items():
+        for name, current in timings.items():
+            base = baseline.get(scale, {}).get(name)
+            if base is None:
+                continue
+            if (
+                current["median"] > base["median"] * threshold
+                and current["median"] - base["median"] > min_delta
+            ):
+                regressions.append(
+                    Regression(scale, name, base["median"], current["median"])
+                )
+    return regressions
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Loads results saved with ``--output``.
+
+    Raises:
+        OSError: if the file cannot be read.
+        ValueError: if the file does not hold results of this format.
+    """
+    with open(path, encoding="utf-8") as file:
+        content = json.load(file)
+    if not isinstance(content, dict) or content.get("format") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"{path} does not hold benchmark results")
+    return content
+
+
+def _report(scale: str, name: str, timings: dict[str, float | int]) -> None:
+    print(
+        f"{scale:>8} {name:<36} "
+        f"min {timings['min'] * 1000:10.2f} ms   "
+        f"median {timings['median'] * 1000:10.2f} ms"
+    )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Times the hooks on synthetic repositories, and flags the "
+        "regressions against a baseline.",
+    )
+    parser.add_argument(
+        "--scale",
+        action="append",
+        choices=list(SCALES),
+        help=f"Scale of the repositories, repeatable (default: {DEFAULT_SCALES}).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Number of timed runs of each benchmark (default: {DEFAULT_REPEAT}).",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed of the synthetic repositories."
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        help="Directory where to keep the repositories, to reuse them in later runs "
+        "(default: a temporary directory).",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="File where to save the results, as a baseline."
+    )
+    parser.add_argument(
+        "--baseline", type=Path, help="Results of a previous run to compare with."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Ratio of the median durations beyond which a benchmark regressed "
+        f"(default: {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA,
+        help="Slow-down in seconds below which a benchmark did not regress "
+        f"(default: {DEFAULT_MIN_DELTA}).",
+    )
+    args = parser.parse_args(argv)
+    args.scale = list(dict.fromkeys(args.scale or DEFAULT_SCALES))
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.baseline is not None:
+        try:
+            args.baseline_results = load_results(args.baseline)["results"]
+        except (OSError, ValueError) as error:
+            parser.error(f"cannot load the baseline: {error}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the benchmarks.
+
+    Returns:
+        int: 1 if a benchmark regressed from the baseline, else 0.
+    """
+    args = _parse_args(argv)
+    results: dict[str, dict[str, dict[str, float | int]]] = {}
+    with contextlib.ExitStack() as stack:
+        workdir = args.workdir or Path(
+            stack.enter_context(tempfile.TemporaryDirectory())
+        )
+        workdir.mkdir(parents=True, exist_ok=True)
+        for scale in args.scale:
+            print(f"preparing the {scale} repository in {workdir}", file=sys.stderr)
+            repo = prepare_repo(workdir, scale, args.seed)
+            results[scale] = run_scale(
+                repo,
+                SCALES[scale],
+                args.repeat,
+                functools.partial(_report, scale),
+            )
+
+    if args.output is not None:
+        content = {
+            "format": RESULTS_FORMAT_VERSION,
+            "environment": environment(args.scale, args.repeat),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(content, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline is None:
+        return 0
+    regressions = find_regressions(
+        results, args.baseline_results, args.threshold, args.min_delta
+    )
+    for regression in regressions:
+        print(
+            f"regression: {regression.scale} {regression.name} "
+            f"{regression.baseline * 1000:.2f} ms -> {regression.current * 1000:.2f} ms "
+            f"(x{regression.ratio:.2f})"
+        )
+    if not regressions:
+        print(f"no regression from {args.baseline}")
+    return 1 if regressions else 0
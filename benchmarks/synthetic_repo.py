@@ -0,0 +1,279 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Generation of synthetic git repositories, shaped after the worst cases the hooks
+meet: many files, huge single-line files, big READMEs to scan entirely, many
+branches, and long rebase sequences."""
+
+from __future__ import annotations
+
+import os
+import random
+import subprocess
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple
+
+from mirageoscience.hooks.copyright_scan import MAX_TOP_LINES
+
+
+class RepoScale(NamedTuple):
+    """The size of a synthetic repository.
+
+    Attributes:
+        files: the number of source files.
+        branches: the number of local branches.
+        rebase_steps: the number of commits of the rebase in progress.
+        huge_line_bytes: the size of the file made of a single line.
+        readme_bytes: the size of the README that is scanned entirely.
+    """
+
+    files: int
+    branches: int
+    rebase_steps: int
+    huge_line_bytes: int
+    readme_bytes: int
+
+
+SCALES = {
+    "tiny": RepoScale(50, 20, 10, 1024 * 1024, 1024 * 1024),
+    "small": RepoScale(2_000, 500, 100, 8 * 1024 * 1024, 4 * 1024 * 1024),
+    "medium": RepoScale(10_000, 2_000, 1_000, 32 * 1024 * 1024, 16 * 1024 * 1024),
+    "large": RepoScale(50_000, 10_000, 5_000, 128 * 1024 * 1024, 64 * 1024 * 1024),
+}
+
+# where the copyright statement of the source files is, with the share of files
+HEADER_PLACEMENTS = {
+    # in a framed header on top of the file
+    "top": 0.85,
+    # after a shebang and a long module docstring, still within the top lines
+    "late": 0.05,
+    # too far down to be found
+    "beyond": 0.03,
+    # on top, for a past year
+    "outdated": 0.04,
+    # none at all
+    "missing": 0.03,
+}
+BRANCH_NAME = "GEOPY-1234-synthetic-work"
+_BODY_LINE = (
+    "    value = compute(value, {index}, {line})  # some code of average length\n"
+)
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Benchmark",
+    "GIT_AUTHOR_EMAIL": "benchmark@example.com",
+    "GIT_COMMITTER_NAME": "Benchmark",
+    "GIT_COMMITTER_EMAIL": "benchmark@example.com",
+}
+
+
+class SyntheticRepo(NamedTuple):
+    """A generated repository.
+
+    Attributes:
+        root: the working tree.
+        source_files: the paths of the source files, relative to the root.
+        placements: the header placement of each source file.
+        huge_line_file: the path of the file made of a single line.
+        readme: the path of the README to scan entirely.
+        message_file: the path of a commit message file, in the git directory.
+    """
+
+    root: Path
+    source_files: list[str]
+    placements: list[str]
+    huge_line_file: str
+    readme: str
+    message_file: Path
+
+
+def _git(root: Path, *args: str, stdin: str | None = None) -> str:
+    """:return: the output of the git command run in the given repository."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=root,
+        input=stdin,
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+        env={**os.environ, **_GIT_ENV},
+    ).stdout
+
+
+def header(year: int) -> str:
+    """:return: a framed copyright header for the given year."""
+    frame = "# " + "'" * 83 + "\n"
+    return (
+        frame
+        + f"#  Copyright (c) {year} Synthetic Ltd.".ljust(84)
+        + "'\n"
+        + "#".ljust(84)
+        + "'\n"
+        + "#  This file is generated for benchmarks.".ljust(84)
+        + "'\n"
+        + frame
+    )
+
+
+def source_content(placement: str, index: int, body_lines: int) -> str:
+    """:return: the content of a source file with the given header placement."""
+    year = date.today().year
+    body = "".join(
+        _BODY_LINE.format(index=index, line=line) for line in range(body_lines)
+    )
+    if placement == "top":
+        return header(year) + "\n" + body
+    if placement == "late":
+        prelude = "#!/usr/bin/env python3\n" + '"""\n' * (MAX_TOP_LINES - 4)
+        return prelude + f"# Copyright (c) {year} Synthetic Ltd.\n" + body
+    if placement == "beyond":
+        # whatever the length of the body, past the lines that are scanned
+        padding = "\n" * max(MAX_TOP_LINES - body_lines, 0)
+        return body + padding + f"# Copyright (c) {year} Synthetic Ltd.\n"
+    if placement == "outdated":
+        return header(year - 3) + "\n" + body
+    return body
+
+
+def generate_source_files(
+    root: Path,
+    count: int,
+    placements: dict[str, float] | None = None,
+    seed: int = 0,
+) -> tuple[list[str], list[str]]:
+    """Writes source files spread in nested directories, of various lengths.
+
+    Args:
+        root: the directory where to write the files.
+        count: the number of files.
+        placements: the share of files for each header placement. Defaults to
+            ``HEADER_PLACEMENTS``.
+        seed: the seed of the random choices, for reproducible repositories.
+
+    Returns:
+        tuple[list[str], list[str]]: the paths of the files relative to the root,
+            and the header placement of each.
+    """
+    placements = placements or HEADER_PLACEMENTS
+    generator = random.Random(seed)
+    chosen = generator.choices(
+        list(placements), weights=list(placements.values()), k=count
+    )
+    names = []
+    for index, placement in enumerate(chosen):
+        name = f"src/package_{index // 500}/module_{index // 50 % 10}/file_{index}.py"
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body_lines = generator.randint(5, 200)
+        path.write_text(source_content(placement, index, body_lines), "utf-8")
+        names.append(name)
+    return names, chosen
+
+
+def write_huge_single_line_file(path: Path, size: int) -> None:
+    """Writes a file of the given size in a single line with no copyright, as
+    minified or generated files are."""
+    chunk = ('{"key": "value", "number": 12345},' * 1024).encode()
+    with open(path, "wb") as file:
+        written = 0
+        while written < size:
+            data = chunk[: size - written]
+            file.write(data)
+            written += len(data)
+
+
+def write_full_scan_readme(path: Path, size: int) -> None:
+    """Writes a README of about the given size, with its copyright statement at the
+    very end, as the worst case of the files scanned entirely."""
+    paragraph = "Some documentation text, to be scanned entirely for a statement.\n"
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(size // len(paragraph)):
+            file.write(paragraph)
+        file.write(f"Copyright (c) {date.today().year} Synthetic Ltd.\n")
+
+
+def create_branches(root: Path, count: int) -> None:
+    """Creates local branches on HEAD, in a single git call."""
+    head = _git(root, "rev-parse", "HEAD").strip()
+    commands = "".join(
+        f"create refs/heads/GEOPY-{index}-branch-{index} {head}\n"
+        for index in range(count)
+    )
+    _git(root, "update-ref", "--stdin", stdin=commands)
+
+
+def simulate_rebase(root: Path, steps: int, done: int | None = None) -> None:
+    """Puts the repository in the state of an interactive rebase in progress of the
+    branch ``BRANCH_NAME``: HEAD is detached, and the rebase state lists the steps.
+
+    Args:
+        root: the working tree.
+        steps: the number of commits to rebase.
+        done: the number of steps already done. Defaults to half of them.
+    """
+    done = steps // 2 if done is None else done
+    head = _git(root, "rev-parse", "HEAD").strip()
+    git_dir = Path(_git(root, "rev-parse", "--absolute-git-dir").strip())
+    state = git_dir / "rebase-merge"
+    state.mkdir(exist_ok=True)
+    todo = [f"pick {head[:12]} [GEOPY-1234] Step {index}\n" for index in range(steps)]
+    (state / "head-name").write_text(f"refs/heads/{BRANCH_NAME}\n", "utf-8")
+    (state / "onto").write_text(f"{head}\n", "utf-8")
+    (state / "orig-head").write_text(f"{head}\n", "utf-8")
+    (state / "interactive").write_text("", "utf-8")
+    (state / "done").write_text("".join(todo[:done]), "utf-8")
+    (state / "git-rebase-todo").write_text("".join(todo[done:]), "utf-8")
+    (state / "msgnum").write_text(f"{done}\n", "utf-8")
+    (state / "end").write_text(f"{steps}\n", "utf-8")
+    (git_dir / "HEAD").write_text(f"{head}\n", "utf-8")
+
+
+def end_rebase(root: Path) -> None:
+    """Leaves the rebase state of `simulate_rebase`, if any: HEAD stays detached."""
+    state = Path(_git(root, "rev-parse", "--absolute-git-dir").strip()) / "rebase-merge"
+    if state.is_dir():
+        for state_file in state.iterdir():
+            state_file.unlink()
+        state.rmdir()
+
+
+def checkout_branch(root: Path) -> None:
+    """Leaves any rebase state, and points HEAD to the ``BRANCH_NAME`` branch."""
+    end_rebase(root)
+    _git(root, "symbolic-ref", "HEAD", f"refs/heads/{BRANCH_NAME}")
+
+
+def create_synthetic_repo(root: Path, scale: RepoScale, seed: int = 0) -> SyntheticRepo:
+    """Generates a git repository of the given scale, on the ``BRANCH_NAME`` branch.
+
+    Args:
+        root: the directory of the repository, created if needed.
+        scale: the size of the repository.
+        seed: the seed of the random choices, for reproducible repositories.
+
+    Returns:
+        SyntheticRepo: the repository, with no rebase in progress.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    _git(root, "init", "-q", "-b", BRANCH_NAME)
+    source_files, placements = generate_source_files(root, scale.files, seed=seed)
+    huge_line_file = "assets/data.min.json"
+    (root / huge_line_file).parent.mkdir(parents=True, exist_ok=True)
+    write_huge_single_line_file(root / huge_line_file, scale.huge_line_bytes)
+    readme = "README.rst"
+    write_full_scan_readme(root / readme, scale.readme_bytes)
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "[GEOPY-1234] Synthetic content")
+    create_branches(root, scale.branches)
+
+    git_dir = Path(_git(root, "rev-parse", "--absolute-git-dir").strip())
+    message_file = git_dir / "COMMIT_EDITMSG"
+    return SyntheticRepo(
+        root, source_files, placements, huge_line_file, readme, message_file
+    )
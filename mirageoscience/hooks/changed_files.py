@@ -0,0 +1,127 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Files changed in a given year, according to git."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+
+_CACHE_DIR_NAME = "mira-hooks"
+
+
+def _git_paths(*git_args: str) -> set[Path]:
+    """:return: the paths listed by the given NUL-terminated git command."""
+    git_proc = subprocess.run(["git", *git_args], stdout=subprocess.PIPE, check=True)
+    return {Path(os.fsdecode(name)) for name in git_proc.stdout.split(b"\0") if name}
+
+
+def _committed_this_year(year: int) -> set[Path]:
+    """:return: the paths of the files changed by the commits of the given year."""
+    return _git_paths(
+        "log",
+        f"--since={year}-01-01T00:00:00",
+        "--name-only",
+        "--relative",
+        "--format=",
+        "-z",
+    )
+
+
+def _cache_location() -> tuple[Path, str, str]:
+    """:return: the directory of the cache in the git dir, the path of the current
+    directory in the work tree, and the SHA of HEAD (empty if there is no commit yet).
+
+    :raises subprocess.CalledProcessError: if not in a git repository.
+    """
+    git_proc = subprocess.run(
+        [
+            "git",
+            "rev-parse",
+            "--show-prefix",
+            "--git-path",
+            _CACHE_DIR_NAME,
+            "--verify",
+            "-q",
+            "HEAD",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    # the prefix (an empty line at the top) and the git path are told even without
+    # commits, for which only HEAD fails
+    lines = git_proc.stdout.split("\n")
+    if len(lines) < 3:
+        raise subprocess.CalledProcessError(git_proc.returncode, git_proc.args)
+    return Path(lines[1]), lines[0], lines[2]
+
+
+def _load_cached(cache_path: Path, head: str, prefix: str) -> set[Path] | None:
+    """:return: the cached paths if they were computed for the given HEAD, relative
+    to the given directory of the work tree."""
+    try:
+        with open(cache_path, encoding="utf-8") as file:
+            content = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(content, dict) or content.get("head") != head:
+        return None
+    if content.get("prefix") != prefix:
+        return None
+    return {Path(name) for name in content.get("files", [])}
+
+
+def _save_cached(cache_path: Path, head: str, prefix: str, files: set[Path]) -> None:
+    """Writes the paths computed for the given HEAD, relative to the given directory
+    of the work tree, to the cache, ignoring failures."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            content = {"head": head, "prefix": prefix, "files": sorted(map(str, files))}
+            json.dump(content, file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+
+def files_changed_in_year(year: int) -> set[Path]:
+    """Lists the files changed since the 1st of January of the given year.
+
+    The files changed by the commits of the year are listed by a single
+    `git log --name-only` call, cached in the git dir per year, per HEAD and per
+    current directory. Files
+    with uncommitted changes are added, as they are about to be committed this year.
+
+    Args:
+        year: the year of interest, usually the current one.
+
+    Returns:
+        set[Path]: the paths of the changed files, relative to the current directory.
+
+    Raises:
+        subprocess.CalledProcessError: if git fails, e.g. out of a git repository.
+    """
+    cache_dir, prefix, head = _cache_location()
+    if not head:
+        # no commit yet: any file is about to be committed
+        return _git_paths("ls-files", "-z", "--cached", "--others")
+
+    cache_path = cache_dir / f"changed-files-{year}.json"
+    committed = _load_cached(cache_path, head, prefix)
+    if committed is None:
+        committed = _committed_this_year(year)
+        _save_cached(cache_path, head, prefix, committed)
+
+    return committed | _git_paths("diff", "HEAD", "--name-only", "--relative", "-z")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 # '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
-#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                     '
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                     '
 #                                                                                   '
 #  This file is part of mirageoscience.pre-commit-hooks package.                    '
 #                                                                                   '
@@ -12,65 +12,374 @@
 from __future__ import annotations
 
 import argparse
-import re
+import itertools
+import os
 import sys
+import time
+from collections.abc import Callable, Container, Generator, Iterable, Iterator
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
 
+from mirageoscience.hooks.copyright_scan import (
+    MAX_TOP_LINES,
+    CopyrightScanner,
+    FileStatus,
+    ScanResult,
+    ordered_map,
+)
+from mirageoscience.hooks.hook_client import PROFILE_ENV
+from mirageoscience.hooks.profiling import active_profiler, profiling, span
 
-MAX_TOP_LINES = 10
+
+if TYPE_CHECKING:
+    from mirageoscience.hooks.copyright_cache import CopyrightCache
+    from mirageoscience.hooks.regex_rules import RuleMatch, RuleSet
+
+# the modules needed by some options only are imported when used, to start faster
+# pylint: disable=import-outside-toplevel
+
+
+# the maximum number of entries of the copyright cache, unless told otherwise
+DEFAULT_MAX_ENTRIES = 100_000
+# the formats of the report, written by mirageoscience.hooks.report_formats
+REPORT_FORMATS = ("text", "json", "sarif")
 _FULL_SCAN_FILE_NAMES = ["README.rst", "README-dev.rst", "package.rst"]
+_FILE_LIST_CHUNK_SIZE = 64 * 1024
+
+_REPORT_MESSAGES = {
+    FileStatus.MISSING: "No copyright or invalid year",
+    FileStatus.OUTDATED: "No copyright or invalid year",
+    FileStatus.BINARY: "Binary file, cannot hold a copyright statement",
+    FileStatus.OVERSIZE: "File too large to be scanned",
+}
+
+
+class ScanPolicy(NamedTuple):
+    """Which files must hold a copyright statement, how to handle the files that
+    cannot hold one, which other rules the files must follow, and whether to go on
+    after a failure.
+
+    Attributes:
+        max_file_size: files larger than this number of bytes are not read at all.
+        report_unscannable: if True, binary and oversize files are reported as
+            failures, else they are skipped.
+        current_year_files: the only files required to have a copyright statement
+            for the current year, while others just need a statement for any year.
+            If None, all files require the current year.
+        rules: regular expression rules checked in the same read of each file,
+            such as the ones of relint.
+        fail_on_warnings: if True, violations of the rules that are not errors
+            are failures too, else they are only reported.
+        fail_fast: if True, stop checking files at the first failure.
+    """
+
+    max_file_size: int | None = None
+    report_unscannable: bool = False
+    current_year_files: Container[Path] | None = None
+    rules: RuleSet | None = None
+    fail_on_warnings: bool = False
+    fail_fast: bool = False
+
+    def is_failure(self, file_path: Path, status: FileStatus) -> bool:
+        """:return: True if the file with the given status must be reported."""
+        if status == FileStatus.OUTDATED:
+            current_year_files = self.current_year_files
+            # pylint: disable-next=unsupported-membership-test  # not None here
+            return current_year_files is None or file_path in current_year_files
+        if status in (FileStatus.BINARY, FileStatus.OVERSIZE):
+            return self.report_unscannable
+        return status == FileStatus.MISSING
+
+    def is_violation_failure(self, violation: RuleMatch) -> bool:
+        """:return: True if the violation of a rule fails the check."""
+        return violation.rule.error or self.fail_on_warnings
+
+
+class FileResult(NamedTuple):
+    """Result of the check of a file, as yielded by `iter_check_results`.
+
+    Attributes:
+        path: the checked file.
+        status: the outcome of the copyright check.
+        year: the last year of the copyright statement found, if any.
+        line: the number of the line of the statement found, from 1.
+        offset: the byte offset of the statement found in the file content.
+        violations: the violations of the rules of the policy.
+        failed: True if the file fails the check, according to the policy.
+        bytes_read: the number of bytes of content read, 0 for a cached verdict.
+        scan_time: the time spent checking the file, in seconds.
+    """
+
+    path: Path
+    status: FileStatus
+    year: int | None
+    line: int | None
+    offset: int | None
+    violations: list[RuleMatch]
+    failed: bool
+    bytes_read: int = 0
+    scan_time: float = 0.0
+
+
+def _violation_report(file_path: Path, violation: RuleMatch) -> str:
+    """:return: the report of the violation of a rule, with its hint if any."""
+    rule = violation.rule
+    kind = "error" if rule.error else "warning"
+    report = f"{file_path}:{violation.line}: {kind}: {rule.name}\n"
+    return report + "".join(f"    {line}\n" for line in rule.hint.splitlines())
+
+
+def iter_file_list(stream: BinaryIO, separator: bytes = b"\n") -> Iterator[str]:
+    """Reads a list of file names from a stream, lazily.
+
+    Args:
+        stream: the stream to read the file names from.
+        separator: the separator between file names, such as a line feed or a NUL
+            byte. Empty names are ignored.
+
+    Returns:
+        Iterator[str]: an iterator of the file names, as they are read.
+    """
+    remainder = b""
+    while chunk := stream.read(_FILE_LIST_CHUNK_SIZE):
+        names = (remainder + chunk).split(separator)
+        remainder = names.pop()
+        for name in names:
+            if separator == b"\n":
+                name = name.rstrip(b"\r")
+            if name:
+                yield os.fsdecode(name)
+    if remainder:
+        yield os.fsdecode(remainder)
+
+
+def _profiled_per_file(
+    report: Callable[..., tuple[ScanResult, list[RuleMatch]]],
+) -> Callable[..., tuple[ScanResult, list[RuleMatch]]]:
+    """:return: the given report function of the scanner, profiling each file."""
+
+    def profiled_report(file_path: Path, *args) -> tuple[ScanResult, list[RuleMatch]]:
+        with span("check_copyright.scan_file", path=str(file_path)) as details:
+            result, violations = report(file_path, *args)
+            details["status"] = result.status.value
+            details["violations"] = len(violations)
+            details["bytes_read"] = result.bytes_read
+        return result, violations
+
+    return profiled_report
+
+
+def _timed_per_file(
+    report: Callable[..., tuple[ScanResult, list[RuleMatch]]],
+) -> Callable[..., tuple[ScanResult, list[RuleMatch], float]]:
+    """:return: the given report function of the scanner, also returning the time
+    spent on each file, in seconds."""
+
+    def timed_report(
+        file_path: Path, *args
+    ) -> tuple[ScanResult, list[RuleMatch], float]:
+        start = time.perf_counter()
+        result, violations = report(file_path, *args)
+        return result, violations, time.perf_counter() - start
+
+    return timed_report
+
+
+def _iter_reports(
+    scanner: CopyrightScanner, file_paths: Iterable[Path], jobs: int, staged: bool
+) -> Generator[tuple[Path, tuple[ScanResult, list[RuleMatch], float]], None, None]:
+    """:return: a generator of the files with their scan result, violations and scan
+    time, to close for the reading of files to stop."""
+    file_report, blob_report = scanner.file_report, scanner.blob_report
+    if active_profiler() is not None:
+        file_report = _profiled_per_file(file_report)
+        blob_report = _profiled_per_file(blob_report)
+    # timed in the thread that scans the file, without the wait for its turn
+    timed_file_report = _timed_per_file(file_report)
+    timed_blob_report = _timed_per_file(blob_report)
+    if staged:
+        from mirageoscience.hooks.staged_files import iter_staged_blobs
+
+        # blobs come through a single pipe, in order: no point in parallel scans
+        return (
+            (f, timed_blob_report(f, blob)) for f, blob in iter_staged_blobs(file_paths)
+        )
+    return ordered_map(timed_file_report, file_paths, jobs)
+
+
+def iter_check_results(
+    files: Iterable[str],
+    full_scan_files: list[str] | None = None,
+    *,
+    jobs: int = 1,
+    cache: CopyrightCache | None = None,
+    policy: ScanPolicy | None = None,
+    staged: bool = False,
+) -> Iterator[FileResult]:
+    """Checks the copyright statements of the given files, yielding the result of
+    each file as soon as it is checked.
+
+    The rules of the policy, if any, are checked in the same read of each file.
+    Files are read only as the results are requested: when the iteration stops
+    early, no further file is read (the scans in progress with ``jobs`` > 1 are
+    completed, the others are cancelled). The cache, if any, is saved when the
+    iteration ends, either way.
+
+    Args:
+        files: the names of the files to check, consumed lazily.
+        full_scan_files: names of the files to be scanned entirely, instead of
+            checking only the top lines.
+        jobs: the number of files to scan concurrently. Results are yielded in the
+            order of the given files regardless.
+        cache: a cache of the verdicts from previous runs, updated with the verdicts
+            of this run.
+        policy: which files fail the check, and whether to stop at the first failed
+            one. See `check_files` for the defaults.
+        staged: if True, check the content staged in the git index rather than the
+            working tree, for files that are staged.
+
+    Returns:
+        Iterator[FileResult]: the results, in the order of the given files.
+    """
+    if policy is None:
+        policy = ScanPolicy()
+    file_paths = (Path(f) for f in files)
+    scanner = CopyrightScanner(
+        date.today().year,
+        full_scan_files or [],
+        policy.max_file_size,
+        cache,
+        policy.rules,
+    )
+    if cache is not None:
+        with span("check_copyright.load_cache"):
+            cache.load(scanner.parameters)
+
+    reports = _iter_reports(scanner, file_paths, jobs, staged)
+    try:
+        for f, (result, violations, scan_time) in reports:
+            failed = policy.is_failure(f, result.status) or any(
+                policy.is_violation_failure(violation) for violation in violations
+            )
+            yield FileResult(
+                f,
+                result.status,
+                result.year,
+                result.line,
+                result.offset,
+                violations,
+                failed,
+                result.bytes_read,
+                scan_time,
+            )
+            if failed and policy.fail_fast:
+                break
+    finally:
+        # stops the reading of files (and the git processes) right away
+        reports.close()
+        if cache is not None:
+            with span("check_copyright.save_cache"):
+                cache.save()
 
 
 def check_files(
-    files: list[str] | None = None, full_scan_files: list[str] | None = None
+    files: Iterable[str] | None = None,
+    full_scan_files: list[str] | None = None,
+    *,
+    jobs: int = 1,
+    cache: CopyrightCache | None = None,
+    policy: ScanPolicy | None = None,
+    staged: bool = False,
 ) -> bool:
     """Checks for valid copyright statements in given files.
 
     This function scans the specified files for copyright notices and reports
     any files that either lack a copyright statement or have an invalid year.
+    The rules of the policy, if any, are checked in the same read of each file,
+    and their violations are reported along. See `iter_check_results` to get the
+    results of the files instead.
 
     Args:
-        files (list, optional): A list of filenames to be checked. Defaults to
-            `sys.argv[1:]` if not provided.
+        files (iterable, optional): The filenames to be checked. Defaults to
+            `sys.argv[1:]` if not provided. It is consumed lazily, and each
+            failure is reported as soon as the file is checked.
         full_scan_files (list, optional): A list of filenames to be scanned
             entirely, instead of checking only the top lines.
+        jobs (int, optional): The number of files to scan concurrently.
+            Reports are written in the order of the given files regardless.
+        cache (CopyrightCache, optional): A cache of the verdicts from previous
+            runs, updated with the verdicts of this run.
+        policy (ScanPolicy, optional): Which files require the current year, how
+            to handle binary and oversize files, which rules to check, and whether
+            to stop at the first failure. Defaults to requiring the current year
+            everywhere, to skipping unscannable files with no size limit, to no
+            other rule, and to checking all files.
+        staged (bool, optional): If True, check the content staged in the git
+            index rather than the working tree, for files that are staged.
 
     Returns:
-        bool: True if all files have valid copyright statements,
-            False otherwise.
+        bool: True if all files have valid copyright statements and violate no
+            rule, False otherwise.
     """
-    current_year = date.today().year
-    copyright_re = re.compile(
-        rf"\bcopyright \(c\) (:?\d{{4}}-|)\b{current_year}\b", re.IGNORECASE
-    )
-    if full_scan_files is None:
-        full_scan_files = []
+    if policy is None:
+        policy = ScanPolicy()
     if files is None:
         files = sys.argv[1:]
-    file_paths = [Path(f) for f in files]
-    report_files = []
-    for f in file_paths:
-        with open(f, encoding="utf-8") as file:
-            count = 0
-            has_dated_copyright = False
-            for line in file:
-                count += 1
-                if count >= MAX_TOP_LINES and f.name not in full_scan_files:
-                    break
-                if re.search(copyright_re, line):
-                    has_dated_copyright = True
-                    break
-
-            if not has_dated_copyright:
-                report_files.append(f)
-
-    if len(report_files) == 0:
-        return True
-
-    for f in report_files:
-        sys.stderr.write(f"{f}: No copyright or invalid year\n")
-    return False
+
+    all_valid = True
+    with span("check_copyright.check_files") as details:
+        for result in iter_check_results(
+            files, full_scan_files, jobs=jobs, cache=cache, policy=policy, staged=staged
+        ):
+            if policy.is_failure(result.path, result.status):
+                sys.stderr.write(f"{result.path}: {_REPORT_MESSAGES[result.status]}\n")
+            for violation in result.violations:
+                sys.stderr.write(_violation_report(result.path, violation))
+            all_valid = all_valid and not result.failed
+        details["valid"] = all_valid
+    return all_valid
+
+
+def _parse_jobs(value: str) -> int:
+    """Parses the value of the --jobs option: a positive integer, or 'auto'."""
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected a positive integer or 'auto', got {value!r}"
+        )
+    return jobs
+
+
+def _parse_cache_size(value: str) -> int:
+    """Parses the value of the --cache-size option: a positive integer."""
+    try:
+        cache_size = int(value)
+    except ValueError:
+        cache_size = 0
+    if cache_size < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return cache_size
+
+
+def _load_rule_set(parser: argparse.ArgumentParser, rules_path: Path) -> RuleSet:
+    """Loads the rules of the --rules option, exiting with a usage error if invalid."""
+    from mirageoscience.hooks.regex_rules import RuleSet, load_rules
+
+    rules = []
+    try:
+        with span("check_copyright.load_rules"):
+            rules = load_rules(rules_path)
+    except ImportError:
+        parser.error("--rules requires PyYAML to be installed")
+    except (OSError, ValueError) as error:
+        parser.error(f"cannot load the rules of {rules_path}: {error}")
+    return RuleSet(rules)
 
 
 def main():
@@ -81,7 +390,20 @@ def main():
     """
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("files", nargs="+", help="list of files to scan")
+    parser.add_argument("files", nargs="*", help="list of files to scan")
+    parser.add_argument(
+        "--files-from",
+        type=argparse.FileType("rb"),
+        help="read the list of files to scan from a file, or from stdin with '-'",
+        metavar="PATH|-",
+        default=None,
+    )
+    parser.add_argument(
+        "-z",
+        "--null",
+        action="store_true",
+        help="file names read with --files-from are separated by NUL characters",
+    )
     parser.add_argument(
         "--full-scan-files",
         type=lambda s: s.split(","),
@@ -93,12 +415,352 @@ def main():
         default=[],
         required=False,
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help=(
+            "scan all the files tracked by git, except those with the -copyright "
+            "or linguist-generated attributes"
+        ),
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        help="with --all, only scan the files matching this glob (repeatable)",
+        metavar="GLOB",
+        default=[],
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        help="with --all, skip the files matching this glob (repeatable)",
+        metavar="GLOB",
+        default=[],
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_parse_jobs,
+        help="number of files to scan in parallel, or 'auto' for one per CPU",
+        metavar="N|auto",
+        default=1,
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help=(
+            "file where to persist the verdicts across runs, keyed by file content "
+            "(discarded when the year or the scan parameters change)"
+        ),
+        metavar="PATH",
+        default=None,
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=_parse_cache_size,
+        help=f"maximum number of entries in the cache (default: {DEFAULT_MAX_ENTRIES})",
+        metavar="N",
+        default=DEFAULT_MAX_ENTRIES,
+    )
+    parser.add_argument(
+        "--max-file-size",
+        type=int,
+        help="size in bytes beyond which files are not scanned at all",
+        metavar="BYTES",
+        default=None,
+    )
+    parser.add_argument(
+        "--unscannable",
+        choices=["skip", "report"],
+        help=(
+            "whether to skip binary and oversize files, or report them as "
+            "failures (default: skip)"
+        ),
+        default="skip",
+    )
+    parser.add_argument(
+        "--current-year-for",
+        choices=["all", "changed"],
+        help=(
+            "require the current year in all files, or only in files changed since "
+            "January 1st according to git, while other files just need a copyright "
+            "for any year (default: all)"
+        ),
+        default="all",
+    )
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help=(
+            "check the content staged in the git index rather than in the working "
+            "tree, for files that are staged"
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "check the files, then keep watching them and report the changes of "
+            "their status, checking again only the files that changed (until "
+            "interrupted)"
+        ),
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop at the first failure, without reading any further file",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        help=(
+            "file where to append the timings of the phases and of each file, as a Chrome "
+            "trace if named *.json, else as JSON lines "
+            f"(default: ${PROFILE_ENV})"
+        ),
+        metavar="PATH",
+        default=os.environ.get(PROFILE_ENV) or None,
+    )
+    parser.add_argument(
+        "--format",
+        choices=REPORT_FORMATS,
+        help=(
+            "how to report the results: as text on stderr, or on stdout as a JSON "
+            "record per file and per line, with its metrics, or as a SARIF log of "
+            "the failures (default: text)"
+        ),
+        default="text",
+    )
+    parser.add_argument(
+        "--rules",
+        type=Path,
+        help=(
+            "relint configuration file with regular expression rules to check in "
+            "the same read of each file, such as .relint.yml (requires PyYAML)"
+        ),
+        metavar="PATH",
+        default=None,
+    )
+    parser.add_argument(
+        "-W",
+        "--fail-on-warnings",
+        action="store_true",
+        help="with --rules, fail on the violations of rules that are not errors too",
+    )
+
+    parser.add_argument(
+        "--fix",
+        action="store_true",
+        help=(
+            "update outdated copyright years in place, to the current year "
+            "(exits with an error if any file was fixed)"
+        ),
+    )
+    parser.add_argument(
+        "--fix-header",
+        type=Path,
+        help=(
+            "with --fix, file with the header to insert in files with no copyright, "
+            "where {year} stands for the current year"
+        ),
+        metavar="PATH",
+        default=None,
+    )
 
     args = parser.parse_args()
-    if not check_files(args.files, _FULL_SCAN_FILE_NAMES + args.full_scan_files):
+    with profiling(args.profile):
+        _run(parser, args)
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Checks, fixes or watches the files as told by the parsed command line
+    arguments.
+
+    Raises:
+        SystemExit: If any file is invalid, or was fixed.
+    """
+    _check_args(parser, args)
+    rules = None
+    if args.rules is not None:
+        rules = _load_rule_set(parser, args.rules)
+
+    files: Iterable[str] = args.files
+    if args.files_from is not None:
+        files = itertools.chain(
+            files, iter_file_list(args.files_from, b"\0" if args.null else b"\n")
+        )
+    if args.all:
+        files = itertools.chain(files, _iter_tracked_files(parser, args))
+    if args.fix:
+        _fix(parser, files, args)
+        return
+    if args.watch:
+        _watch(parser, files, args, rules)
+        return
+
+    cache = None
+    if args.cache is not None:
+        from mirageoscience.hooks.copyright_cache import shared_cache
+
+        cache = shared_cache(args.cache, args.cache_size)
+    policy = _scan_policy(parser, args, rules, date.today().year)
+    full_scan_files = _FULL_SCAN_FILE_NAMES + args.full_scan_files
+    if args.format != "text":
+        from mirageoscience.hooks.report_formats import write_report
+
+        results = iter_check_results(
+            files,
+            full_scan_files,
+            jobs=args.jobs,
+            cache=cache,
+            policy=policy,
+            staged=args.staged,
+        )
+        with span("check_copyright.write_report", format=args.format) as details:
+            valid = write_report(results, args.format, policy, sys.stdout)
+            details["valid"] = valid
+    else:
+        valid = check_files(
+            files,
+            full_scan_files,
+            jobs=args.jobs,
+            cache=cache,
+            policy=policy,
+            staged=args.staged,
+        )
+    if not valid:
         sys.exit(1)
 
 
+def _iter_tracked_files(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> Iterator[str]:
+    """Lists the files tracked by git, selected by the ``--include`` and
+    ``--exclude`` arguments.
+
+    Raises:
+        SystemExit: If git cannot list the files, e.g. out of a git repository.
+    """
+    import subprocess
+
+    from mirageoscience.hooks.tracked_files import iter_tracked_files
+
+    try:
+        yield from iter_tracked_files(args.include, args.exclude)
+    except subprocess.CalledProcessError as error:
+        parser.error(f"--all cannot list the files tracked by git: {error}")
+
+
+def _check_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Exits with a usage error if the parsed command line arguments conflict."""
+    if not args.files and args.files_from is None and not args.all:
+        parser.error("either files, --files-from or --all is required")
+    if args.fix and args.staged:
+        parser.error("--fix only applies to the working tree, not with --staged")
+    if args.fix and args.rules is not None:
+        parser.error("--fix only fixes copyright statements, not with --rules")
+    if args.fix and args.format != "text":
+        parser.error("--fix only reports as text, not with --format")
+    if args.watch and (args.fix or args.staged or args.fail_fast):
+        parser.error(
+            "--watch checks the working tree: not with --fix, --staged, or --fail-fast"
+        )
+    if args.watch and args.format != "text":
+        parser.error("--watch only reports as text, not with --format")
+
+
+def _fix(
+    parser: argparse.ArgumentParser, files: Iterable[str], args: argparse.Namespace
+) -> None:
+    """Fixes the files as told by the parsed command line arguments.
+
+    With ``--current-year-for changed``, the outdated statements of the files that
+    did not change this year are left as they are, as the check accepts them.
+
+    Raises:
+        SystemExit: If any file was fixed, or could not be.
+    """
+    from mirageoscience.hooks.copyright_fix import fix_files
+
+    header_template = None
+    if args.fix_header is not None:
+        header_template = args.fix_header.read_bytes()
+    if not fix_files(
+        files,
+        _FULL_SCAN_FILE_NAMES + args.full_scan_files,
+        jobs=args.jobs,
+        header_template=header_template,
+        current_year_files=_current_year_files(parser, args, date.today().year),
+    ):
+        sys.exit(1)
+
+
+def _watch(
+    parser: argparse.ArgumentParser,
+    files: Iterable[str],
+    args: argparse.Namespace,
+    rules: RuleSet | None,
+) -> None:
+    """Watches the files as told by the parsed command line arguments, until
+    interrupted."""
+    from mirageoscience.hooks.copyright_watch import HeaderIndex, watch
+
+    full_scan_files = _FULL_SCAN_FILE_NAMES + args.full_scan_files
+
+    def check(checked_files: list[str], policy: ScanPolicy) -> Iterator[FileResult]:
+        return iter_check_results(
+            checked_files, full_scan_files, jobs=args.jobs, policy=policy
+        )
+
+    index = HeaderIndex(
+        files, check, lambda year: _scan_policy(parser, args, rules, year)
+    )
+    watch(index)
+
+
+def _current_year_files(
+    parser: argparse.ArgumentParser, args: argparse.Namespace, year: int
+) -> set[Path] | None:
+    """:return: the only files required to have a statement for the given year, as
+    told by the parsed command line arguments, or None for all of them.
+
+    Raises:
+        SystemExit: If git cannot list the changed files.
+    """
+    if args.current_year_for != "changed":
+        return None
+
+    import subprocess
+
+    from mirageoscience.hooks.changed_files import files_changed_in_year
+
+    current_year_files = None
+    try:
+        with span("check_copyright.changed_files"):
+            current_year_files = files_changed_in_year(year)
+    except subprocess.CalledProcessError as error:
+        parser.error(f"--current-year-for changed requires a git repository: {error}")
+    return current_year_files
+
+
+def _scan_policy(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    rules: RuleSet | None,
+    year: int,
+) -> ScanPolicy:
+    """:return: the policy set by the parsed command line arguments, for the given
+    year."""
+    return ScanPolicy(
+        args.max_file_size,
+        args.unscannable == "report",
+        _current_year_files(parser, args, year),
+        rules,
+        args.fail_on_warnings,
+        args.fail_fast,
+    )
+
+
 # Note: a simpler bash script for this task would be:
 # ----------------------------
 # readonly CURRENT_YEAR=$(date +"%Y")
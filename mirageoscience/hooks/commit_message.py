@@ -0,0 +1,211 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Single-pass parsing of the commit message files, and in-place patching."""
+
+from __future__ import annotations
+
+import io
+import re
+from typing import BinaryIO
+
+from mirageoscience.hooks.jira_patterns import message_patterns
+
+
+COMMENT_PREFIX = b"#"
+# what follows this line is ignored by git, as for `git commit --verbose`
+SCISSORS_LINE = b"# ------------------------ >8 ------------------------"
+_TRAILER_RE = re.compile(rb"([A-Za-z0-9][A-Za-z0-9-]*)[ \t]*:[ \t]*(.*?)\s*")
+_SHIFT_CHUNK_SIZE = 1024 * 1024
+
+
+class CommitMessage:
+    """The structure of a commit message, located by byte offsets in the file.
+
+    Offsets are None for the parts that are missing from the message. Ranges are
+    half-open: ``(start, end)`` covers the bytes from ``start`` up to ``end``
+    excluded, line terminators included.
+    """
+
+    __slots__ = (
+        "body_end",
+        "body_start",
+        "comments",
+        "first_line_end",
+        "first_line_start",
+        "jira_id",
+        "prefix_bang",
+        "subject",
+        "subject_end",
+        "subject_start",
+        "trailers",
+    )
+
+    def __init__(self):
+        self.first_line_start: int | None = None
+        """Start of the first non-comment line, even if blank."""
+        self.first_line_end: int | None = None
+        self.subject_start: int | None = None
+        """Start of the first non-comment line that is not blank."""
+        self.subject_end: int | None = None
+        self.prefix_bang = ""
+        """Standard prefix of the subject line, such as 'fixup! '."""
+        self.subject = ""
+        """The subject line, stripped, without its prefix bang."""
+        self.jira_id = ""
+        """The JIRA ID at the beginning of the subject, if any."""
+        self.body_start: int | None = None
+        """Start of the first non-blank line after the subject."""
+        self.body_end: int | None = None
+        """End of the last non-blank line after the subject."""
+        self.trailers: list[tuple[str, str]] = []
+        """Key and value of the trailers (e.g. 'Signed-off-by'), if the last
+        paragraph consists of trailers only."""
+        self.comments: list[tuple[int, int]] = []
+        """Ranges of the consecutive comment lines."""
+
+    @property
+    def has_subject(self) -> bool:
+        """Whether the message has any line that is neither a comment nor blank."""
+        return self.subject_start is not None
+
+
+def _parse_subject(message: CommitMessage, line: bytes, start: int) -> None:
+    """Parses the given subject line, found at the given offset, into the message."""
+    message.subject_start = start
+    message.subject_end = start + len(line)
+    patterns = message_patterns()
+    subject = line.decode("utf-8", errors="surrogateescape").strip()
+    message.prefix_bang = patterns.prefix_bang(subject)
+    message.subject = subject[len(message.prefix_bang) :].strip()
+    message.jira_id = patterns.jira_id(message.subject)
+
+
+def parse_subject_line(line: str) -> CommitMessage:
+    """:return: the message with the given subject line only, at offset 0."""
+    message = CommitMessage()
+    encoded = line.encode("utf-8", errors="surrogateescape")
+    message.first_line_start = 0
+    message.first_line_end = len(encoded)
+    _parse_subject(message, encoded, 0)
+    return message
+
+
+def _add_comment(message: CommitMessage, start: int, end: int) -> None:
+    """Adds a comment line, merged with the previous one if consecutive."""
+    if message.comments and message.comments[-1][1] == start:
+        message.comments[-1] = (message.comments[-1][0], end)
+    else:
+        message.comments.append((start, end))
+
+
+def _parse_trailer(line: bytes, trailers: list[tuple[str, str]] | None):
+    """Adds the trailer of the given line, or continues the value of the last one.
+
+    :return: the trailers so far, or None if the line is not a trailer.
+    """
+    if trailers is None:
+        return None
+    if trailers and line[:1] in (b" ", b"\t"):
+        key, value = trailers[-1]
+        trailers[-1] = (key, f"{value} {line.strip().decode(errors='replace')}")
+        return trailers
+    match = _TRAILER_RE.fullmatch(line.rstrip(b"\r\n"))
+    if match is None:
+        return None
+    trailers.append((match.group(1).decode(), match.group(2).decode(errors="replace")))
+    return trailers
+
+
+def parse_commit_message(stream: BinaryIO, subject_only: bool = False) -> CommitMessage:
+    """Parses a commit message in a single pass over its lines.
+
+    Lines starting with ``#`` are comments. Parsing stops at the scissors line of
+    verbose commits, since git ignores what follows, or right after the subject
+    line if requested.
+
+    Args:
+        stream: the binary stream of the commit message, at its beginning.
+        subject_only: if True, stop reading after the subject line.
+
+    Returns:
+        CommitMessage: the structure of the message.
+    """
+    message = CommitMessage()
+    trailers: list[tuple[str, str]] | None = None
+    previous_blank = True
+    offset = 0
+    for line in stream:
+        start, offset = offset, offset + len(line)
+        if line.startswith(COMMENT_PREFIX):
+            if line.rstrip(b"\r\n") == SCISSORS_LINE:
+                _add_comment(message, start, stream.seek(0, io.SEEK_END))
+                break
+            _add_comment(message, start, offset)
+            continue
+
+        if message.first_line_start is None:
+            message.first_line_start = start
+            message.first_line_end = offset
+        is_blank = not line.strip()
+        if message.subject_start is None:
+            if not is_blank:
+                _parse_subject(message, line, start)
+                if subject_only:
+                    break
+            continue
+
+        if not is_blank:
+            if message.body_start is None:
+                message.body_start = start
+            message.body_end = offset
+            # trailers are in the last paragraph: start over with each paragraph
+            trailers = _parse_trailer(line, [] if previous_blank else trailers)
+        previous_blank = is_blank
+
+    message.trailers = trailers or []
+    return message
+
+
+def patch_range(file: BinaryIO, start: int, end: int, replacement: bytes) -> None:
+    """Replaces a range of bytes of a file opened for update, in place.
+
+    Only the bytes from the start of the range are written: what follows the range
+    is shifted chunk by chunk if the replacement has another length, and nothing
+    before the range is rewritten.
+
+    Args:
+        file: the file, opened in binary mode for reading and writing.
+        start: the start of the range to replace.
+        end: the end of the range to replace, excluded.
+        replacement: the bytes to write instead.
+    """
+    size = file.seek(0, io.SEEK_END)
+    shift = len(replacement) - (end - start)
+    if shift > 0:
+        # move the rest of the file from its end, not to overwrite what is to move
+        position = size
+        while position > end:
+            chunk_start = max(end, position - _SHIFT_CHUNK_SIZE)
+            file.seek(chunk_start)
+            chunk = file.read(position - chunk_start)
+            file.seek(chunk_start + shift)
+            file.write(chunk)
+            position = chunk_start
+    elif shift < 0:
+        position = end
+        while position < size:
+            file.seek(position)
+            chunk = file.read(_SHIFT_CHUNK_SIZE)
+            file.seek(position + shift)
+            file.write(chunk)
+            position += len(chunk)
+        file.truncate(size + shift)
+    file.seek(start)
+    file.write(replacement)
@@ -0,0 +1,233 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Persistent cache for the verdicts of the copyright check."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from mirageoscience.hooks.check_copyright import DEFAULT_MAX_ENTRIES
+
+
+CACHE_FORMAT_VERSION = 4
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def git_blob_sha(file_path: Path, size: int | None = None) -> str:
+    """Computes the git blob SHA of the given file, as `git hash-object` would.
+
+    Args:
+        file_path: the file to hash.
+        size: the size of the file in bytes, if already known.
+
+    Returns:
+        str: the hexadecimal SHA-1 of the git blob object for the file content.
+    """
+    if size is None:
+        size = file_path.stat().st_size
+    sha = hashlib.sha1(f"blob {size}\0".encode(), usedforsecurity=False)
+    with open(file_path, "rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class CopyrightCache:
+    """On-disk cache of the copyright verdicts, keyed by the content of the files.
+
+    Verdicts are indexed by the git blob SHA of the file content, so that a cache
+    file restored on another machine (e.g. on CI) remains valid. A secondary index
+    maps each path to its last known stat signature and SHA, so that unchanged files
+    are not even read to be hashed.
+
+    The whole cache is discarded when the scan parameters it was built with (such
+    as the current year) differ from the ones of the current run. The number of
+    entries is bounded: the least recently used ones are evicted first.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._parameters: dict[str, Any] = {}
+        self._verdicts: dict[str, str] = {}
+        self._signatures: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self._modified = False
+        # stat signature of the file when last loaded or saved, if it was
+        self._file_signature: tuple[int, int] | None = None
+
+    def _stat_file(self) -> tuple[int, int] | None:
+        """:return: the size and modification time of the cache file, if any."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def load(self, parameters: dict[str, Any]) -> None:
+        """Loads the cache file, discarding its content if it was built with other
+        scan parameters, or if it cannot be read.
+
+        The content already in memory is kept if the file did not change since it was
+        last loaded or saved, and the parameters are the same, as for a long-running
+        process checking several times.
+
+        Args:
+            parameters: the parameters of the current scan, as a JSON-serializable
+                dictionary.
+        """
+        file_signature = self._stat_file()
+        if (
+            file_signature is not None
+            and file_signature == self._file_signature
+            and parameters == self._parameters
+        ):
+            return
+
+        self._parameters = parameters
+        self._file_signature = None
+        self._verdicts = {}
+        self._signatures = {}
+        self._modified = False
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                content = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != CACHE_FORMAT_VERSION
+            or content.get("parameters") != parameters
+        ):
+            self._modified = True
+            return
+
+        self._verdicts = dict(content.get("verdicts", {}))
+        self._signatures = {
+            path: tuple(signature)  # type: ignore[misc]
+            for path, signature in content.get("signatures", {}).items()
+        }
+        self._file_signature = file_signature
+
+    def save(self) -> None:
+        """Writes the cache file, if anything changed since it was loaded.
+
+        The file is replaced atomically, so that concurrent runs never read a
+        partially written cache.
+        """
+        if not self._modified:
+            return
+
+        content = {
+            "version": CACHE_FORMAT_VERSION,
+            "parameters": self._parameters,
+            "verdicts": self._verdicts,
+            "signatures": self._signatures,
+        }
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(content, file, separators=(",", ":"))
+            os.replace(temp_name, self.path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self._modified = False
+        self._file_signature = self._stat_file()
+
+    def content_key(self, file_path: Path, variant: str = "") -> str:
+        """Returns the key identifying the content of the given file.
+
+        The file is hashed only if its stat signature changed since it was last seen.
+
+        Args:
+            file_path: the file to identify.
+            variant: a suffix distinguishing the ways a same content can be scanned.
+
+        Returns:
+            str: the key to use with :meth:`get` and :meth:`put`.
+        """
+        stat = file_path.stat()
+        path_key = str(file_path)
+        with self._lock:
+            signature = self._signatures.get(path_key)
+        if (
+            signature is not None
+            and signature[0] == stat.st_size
+            and signature[1] == stat.st_mtime_ns
+        ):
+            sha = signature[2]
+        else:
+            sha = git_blob_sha(file_path, stat.st_size)
+            with self._lock:
+                self._signatures.pop(path_key, None)
+                self._signatures[path_key] = (stat.st_size, stat.st_mtime_ns, sha)
+                self._evict(self._signatures)
+                self._modified = True
+        return sha + variant
+
+    def get(self, key: str) -> str | None:
+        """:return: the cached verdict for the given content key, if any."""
+        with self._lock:
+            verdict = self._verdicts.pop(key, None)
+            if verdict is not None:
+                # re-insert to keep the most recently used entries last
+                # (only persisted along with other changes, to spare writes on hits)
+                self._verdicts[key] = verdict
+        return verdict
+
+    def put(self, key: str, verdict: str) -> None:
+        """Stores the verdict for the given content key."""
+        with self._lock:
+            self._verdicts.pop(key, None)
+            self._verdicts[key] = verdict
+            self._evict(self._verdicts)
+            self._modified = True
+
+    def _evict(self, entries: dict) -> None:
+        """Drops the least recently used entries beyond the maximum cache size."""
+        while len(entries) > self.max_entries:
+            del entries[next(iter(entries))]
+
+
+_shared_caches: dict[Path, CopyrightCache] = {}
+
+
+def shared_cache(path: Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> CopyrightCache:
+    """Returns the cache for the given file, shared by all the checks of the process.
+
+    A long-running process (see :mod:`mirageoscience.hooks.hook_daemon`) thus keeps
+    the verdicts in memory from one check to the next, as long as the file is not
+    changed by another process.
+
+    Args:
+        path: the cache file.
+        max_entries: the maximum number of entries of the cache.
+
+    Returns:
+        CopyrightCache: the cache, not loaded yet if just created.
+    """
+    path = path.absolute()
+    cache = _shared_caches.get(path)
+    if cache is None:
+        cache = _shared_caches[path] = CopyrightCache(path, max_entries)
+    cache.max_entries = max_entries
+    return cache
@@ -0,0 +1,240 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""In-place fixing of the copyright statements."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import shutil
+import sys
+import tempfile
+from collections.abc import Container, Iterable
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO
+
+from mirageoscience.hooks.copyright_scan import (
+    ANY_YEAR_COPYRIGHT_RE,
+    MAX_TOP_BYTES,
+    FileStatus,
+    bom_encoding,
+    dated_copyright_pattern,
+    header_end,
+    ordered_map,
+    scan_file,
+)
+
+
+# how far to look after a statement for the padding of a framed header
+_MAX_TRAILING_BYTES = 256
+_PADDING_RE = re.compile(rb"  +")
+
+
+class FixOutcome(Enum):
+    """Outcome of the fix of a file."""
+
+    UNCHANGED = "unchanged"
+    FIXED = "fixed"
+    SKIPPED = "skipped"
+    UNFIXABLE = "unfixable"
+
+
+def _updated_years(match: re.Match[bytes], current_year: int) -> bytes:
+    """:return: the years of the matched statement, extended to the current year."""
+    first_year = match.group(1) or match.group(2)
+    if int(first_year) >= current_year:
+        return b"%d" % current_year
+    return b"%s-%d" % (first_year, current_year)
+
+
+def _absorb_padding(trailing: bytes, growth: int) -> bytes:
+    """Removes as many spaces from the first padding of the given rest of the line,
+    so that framed headers stay aligned. Keeps at least one space.
+
+    :return: the rest of the line, with less padding if any.
+    """
+    padding = _PADDING_RE.search(trailing)
+    if growth <= 0 or padding is None:
+        return trailing
+    removed = min(growth, len(padding.group()) - 1)
+    return trailing[: padding.start()] + trailing[padding.start() + removed :]
+
+
+def _find_statement(
+    file: BinaryIO, header: bytes, full_scan: bool
+) -> tuple[re.Match[bytes] | None, int]:
+    """Finds the first copyright statement of the file.
+
+    :return: the match, if any, and the offset in the file of the matched bytes. These
+        bytes include the rest of the line of the match.
+    """
+    match = ANY_YEAR_COPYRIGHT_RE.search(header, 0, header_end(header))
+    if match is not None or not full_scan:
+        return match, 0
+
+    try:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            match = ANY_YEAR_COPYRIGHT_RE.search(buffer)  # type: ignore[call-overload]
+            if match is None:
+                return None, 0
+            # the match cannot outlive the map: match again in a copy of its line
+            line_start = buffer.rfind(b"\n", 0, match.start()) + 1
+            line = buffer[line_start : match.end() + _MAX_TRAILING_BYTES]
+            return ANY_YEAR_COPYRIGHT_RE.search(line), line_start
+    except ValueError:
+        # empty files cannot be mapped
+        return None, 0
+
+
+def _replace_range(file_path: Path, start: int, end: int, replacement: bytes) -> None:
+    """Replaces a range of bytes in the file, streaming the rest of its content to a
+    temporary file that then atomically replaces the original one."""
+    fd, temp_name = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as output, open(file_path, "rb") as source:
+            output.write(source.read(start))
+            output.write(replacement)
+            source.seek(end)
+            shutil.copyfileobj(source, output)
+        shutil.copymode(file_path, temp_name)
+        os.replace(temp_name, file_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _insertion_offset(header: bytes) -> int:
+    """:return: where to insert a header: after the shebang line, if any."""
+    if header.startswith(b"#!"):
+        return header.find(b"\n") + 1 or len(header)
+    return 0
+
+
+def fix_file(
+    file_path: Path,
+    full_scan: bool,
+    current_year: int,
+    header_template: bytes | None = None,
+    update_outdated: bool = True,
+) -> FixOutcome:
+    """Updates the copyright statement of the file to the current year, in place.
+
+    A statement such as ``Copyright (c) YYYY`` becomes ``Copyright (c) YYYY-<current>``,
+    and ``Copyright (c) YYYY-ZZZZ`` becomes ``Copyright (c) YYYY-<current>``. Padding
+    spaces that follow on the same line are reduced accordingly, so that framed
+    headers stay aligned. Only the statement is rewritten: the rest of the file is
+    streamed unchanged to a temporary file, renamed over the original one.
+
+    Args:
+        file_path: the file to fix.
+        full_scan: if True, look for the statement in the whole file instead of only
+            the top lines.
+        current_year: the year the statement must be valid for.
+        header_template: the header to insert when there is no statement at all,
+            where ``{year}`` is replaced by the current year.
+        update_outdated: if False, a statement for a past year is left as it is:
+            only a missing statement is fixed.
+
+    Returns:
+        FixOutcome: whether the file was fixed, did not need to, or could not be.
+    """
+    status = scan_file(file_path, dated_copyright_pattern(current_year), full_scan)
+    if status == FileStatus.VALID or (
+        status == FileStatus.OUTDATED and not update_outdated
+    ):
+        return FixOutcome.UNCHANGED
+    if status == FileStatus.BINARY:
+        return FixOutcome.SKIPPED
+
+    with open(file_path, "rb") as file:
+        header = file.read(MAX_TOP_BYTES)
+        if bom_encoding(header) is not None:
+            return FixOutcome.UNFIXABLE
+        match, offset = _find_statement(file, header, full_scan)
+
+    if match is None:
+        if header_template is None:
+            return FixOutcome.UNFIXABLE
+        insertion = header_template.replace(b"{year}", b"%d" % current_year)
+        if not insertion.endswith(b"\n"):
+            insertion += b"\n"
+        position = _insertion_offset(header)
+        _replace_range(file_path, position, position, insertion)
+        return FixOutcome.FIXED
+
+    _replace_years(file_path, match, offset, current_year)
+    return FixOutcome.FIXED
+
+
+def _replace_years(
+    file_path: Path, match: re.Match[bytes], offset: int, current_year: int
+) -> None:
+    """Extends the years of the matched statement, found at the given offset of the
+    file, to the current year."""
+    years_start = match.start(1) if match.group(1) else match.start(2)
+    years = _updated_years(match, current_year)
+    trailing = match.string[match.end() :].split(b"\n", 1)[0]
+    growth = len(years) - (match.end() - years_start)
+    _replace_range(
+        file_path,
+        offset + years_start,
+        offset + match.end() + len(trailing),
+        years + _absorb_padding(trailing, growth),
+    )
+
+
+def fix_files(
+    files: Iterable[str],
+    full_scan_files: list[str] | None = None,
+    jobs: int = 1,
+    header_template: bytes | None = None,
+    current_year_files: Container[Path] | None = None,
+) -> bool:
+    """Fixes the copyright statements of the given files, in place.
+
+    Args:
+        files: the names of the files to fix.
+        full_scan_files: names of the files to be scanned entirely, instead of
+            checking only the top lines.
+        jobs: the number of files to fix concurrently.
+        header_template: the header to insert in files with no statement at all,
+            where ``{year}`` is replaced by the current year.
+        current_year_files: the only files whose statement is updated to the
+            current year, as for :class:`~mirageoscience.hooks.check_copyright.ScanPolicy`.
+            Others only get a statement if they have none. If None, all files
+            are updated.
+
+    Returns:
+        bool: True if no file had to be fixed, False if some were fixed, or could
+            not be.
+    """
+    current_year = date.today().year
+    full_scan_names = set(full_scan_files or [])
+
+    def fix(f: Path) -> FixOutcome:
+        update_outdated = current_year_files is None or f in current_year_files
+        return fix_file(
+            f, f.name in full_scan_names, current_year, header_template, update_outdated
+        )
+
+    all_valid = True
+    for f, outcome in ordered_map(fix, (Path(f) for f in files), jobs):
+        if outcome == FixOutcome.FIXED:
+            sys.stderr.write(f"Fixing {f}\n")
+            all_valid = False
+        elif outcome == FixOutcome.UNFIXABLE:
+            sys.stderr.write(f"{f}: No copyright or invalid year\n")
+            all_valid = False
+    return all_valid
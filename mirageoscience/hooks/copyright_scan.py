@@ -0,0 +1,480 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Scanning of the copyright statements of files."""
+
+from __future__ import annotations
+
+import codecs
+import io
+import mmap
+import re
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, TypeVar
+
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from mirageoscience.hooks.copyright_cache import CopyrightCache
+    from mirageoscience.hooks.regex_rules import RuleMatch, RuleSet
+    from mirageoscience.hooks.staged_files import StagedBlob
+
+
+MAX_TOP_LINES = 10
+MAX_TOP_BYTES = 8 * 1024
+_STREAM_CHUNK_SIZE = 1024 * 1024
+# longer than any copyright statement, for matches across streamed chunks
+_STREAM_CHUNK_OVERLAP = 256
+# number of items submitted ahead of the one being yielded, per job
+_PENDING_ITEMS_PER_JOB = 4
+
+# any copyright statement, capturing its first year (if a range) and its last year
+ANY_YEAR_COPYRIGHT_RE = re.compile(
+    rb"\bcopyright \(c\) (?:(\d{4})-)?(\d{4})\b", re.IGNORECASE
+)
+
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+# BOMs of the encodings that are not ASCII-compatible, longest first
+_TRANSCODED_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+class FileStatus(str, Enum):
+    """Outcome of the copyright check for a file."""
+
+    VALID = "valid"
+    OUTDATED = "outdated"
+    MISSING = "missing"
+    BINARY = "binary"
+    OVERSIZE = "oversize"
+
+
+class ScanResult(NamedTuple):
+    """Outcome of the copyright check for a file, with the statement found if any.
+
+    Attributes:
+        status: the outcome of the check.
+        year: the last year of the statement found, if any.
+        line: the number of the line of the statement found, from 1.
+        offset: the byte offset of the statement found, in the content of the file
+            (as transcoded to UTF-8 for content with a UTF-16 or UTF-32 BOM).
+        bytes_read: the number of bytes of content read to scan the file, 0 for a
+            cached verdict. Not part of the verdict.
+    """
+
+    status: FileStatus
+    year: int | None = None
+    line: int | None = None
+    offset: int | None = None
+    bytes_read: int = 0
+
+    @property
+    def verdict(self) -> str:
+        """The result as a string, as stored in the cache."""
+        if self.year is None:
+            return self.status.value
+        return f"{self.status.value}:{self.year}:{self.line}:{self.offset}"
+
+    @classmethod
+    def from_verdict(cls, verdict: str) -> ScanResult:
+        """:return: the result stored in the cache as the given string."""
+        status, *location = verdict.split(":")
+        return cls(FileStatus(status), *map(int, location))
+
+
+# statuses for the index of the first pattern found by a search
+_SEARCH_STATUSES = {
+    0: FileStatus.VALID,
+    1: FileStatus.OUTDATED,
+}
+
+
+@lru_cache
+def dated_copyright_pattern(year: int) -> re.Pattern[bytes]:
+    """:return: the compiled pattern of a copyright statement valid for the given year."""
+    return re.compile(rb"\bcopyright \(c\) (:?\d{4}-|)\b%d\b" % year, re.IGNORECASE)
+
+
+def header_end(header: bytes) -> int:
+    """:return: the end offset of the top lines to scan in the given header bytes."""
+    end = 0
+    # the line that reaches MAX_TOP_LINES is not scanned
+    for _ in range(MAX_TOP_LINES - 1):
+        end = header.find(b"\n", end) + 1
+        if end == 0:
+            return len(header)
+    return end
+
+
+def _found(index: int, match: re.Match[bytes], line: int, offset: int) -> ScanResult:
+    """:return: the result for the match of the pattern of the given index, at the
+    given line and offset of the content."""
+    # both patterns end with the last year of the statement
+    return ScanResult(_SEARCH_STATUSES[index], int(match.group()[-4:]), line, offset)
+
+
+def _search_stream(
+    file: BinaryIO, head: bytes, patterns: tuple[re.Pattern[bytes], ...]
+) -> ScanResult:
+    """Searches the patterns in the given head bytes, then in the rest of the file
+    read by chunks from its current position.
+
+    :return: the result for the first of the patterns that is found, if any.
+    """
+    result = ScanResult(FileStatus.MISSING)
+    found = None
+    buffer = head
+    bytes_read = len(head)
+    # offset and number of lines of the content before the buffer
+    start = lines = 0
+    while True:
+        for index, pattern in enumerate(patterns[:found]):
+            match = pattern.search(buffer)
+            if match:
+                found = index
+                line = lines + buffer.count(b"\n", 0, match.start()) + 1
+                result = _found(index, match, line, start + match.start())
+                break
+        if found == 0:
+            return result._replace(bytes_read=bytes_read)
+        chunk = file.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            return result._replace(bytes_read=bytes_read)
+        bytes_read += len(chunk)
+        dropped = max(len(buffer) - _STREAM_CHUNK_OVERLAP, 0)
+        lines += buffer.count(b"\n", 0, dropped)
+        start += dropped
+        buffer = buffer[dropped:] + chunk
+
+
+def _count_newlines(buffer: mmap.mmap, end: int) -> int:
+    """:return: the number of line feeds in the buffer before the given offset,
+    counted in slices of bounded size, rather than in a copy of all of it."""
+    return sum(
+        buffer[offset : min(offset + _STREAM_CHUNK_SIZE, end)].count(b"\n")
+        for offset in range(0, end, _STREAM_CHUNK_SIZE)
+    )
+
+
+def _search_full(
+    file: BinaryIO, head: bytes, patterns: tuple[re.Pattern[bytes], ...]
+) -> ScanResult:
+    """Searches the patterns in the whole file, of which the head bytes were read.
+
+    The file is memory-mapped so that the patterns run over its content without
+    copying it. Files that cannot be mapped (e.g. empty files or pipes) are
+    streamed instead.
+
+    :return: the result for the first of the patterns that is found, if any.
+    """
+    try:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for index, pattern in enumerate(patterns):
+                match = pattern.search(buffer)  # type: ignore[call-overload]
+                if match:
+                    line = _count_newlines(buffer, match.start()) + 1
+                    # the first pattern stops at its match, the others follow it
+                    scanned = match.end() if index == 0 else len(buffer)
+                    return _found(index, match, line, match.start())._replace(
+                        bytes_read=max(len(head), scanned)
+                    )
+            return ScanResult(FileStatus.MISSING, bytes_read=len(buffer))
+    except (OSError, ValueError):
+        return _search_stream(file, head, patterns)
+
+
+def bom_encoding(header: bytes) -> str | None:
+    """:return: the encoding given by the BOM of the header, if not ASCII-compatible."""
+    for bom, encoding in _TRANSCODED_BOMS:
+        if header.startswith(bom):
+            return encoding
+    return None
+
+
+def scan_stream_result(
+    file: BinaryIO, copyright_re: re.Pattern[bytes], full_scan: bool
+) -> ScanResult:
+    """Checks the copyright statement in the content of the given binary stream.
+
+    The first block of the content tells whether it is text at all: content with
+    NUL bytes is classified as binary without reading further. Content starting
+    with a UTF-16 or UTF-32 BOM is transcoded to UTF-8 before matching. Unless
+    scanning the whole content, at most ``MAX_TOP_BYTES`` are read, so that files
+    with huge lines (minified or generated files) cost no more than others.
+
+    Args:
+        file: the stream to read, positioned at the beginning of the content.
+        copyright_re: the compiled copyright pattern to search for.
+        full_scan: if True, scan the whole content instead of only the top lines.
+
+    Returns:
+        ScanResult: the status, VALID if a matching copyright statement was found,
+            OUTDATED if only statements for other years were found, MISSING if none
+            was found, or BINARY; with the year and location of the first matching
+            statement, if any, else of the first statement found; and the number of
+            bytes read.
+    """
+    header = file.read(MAX_TOP_BYTES)
+    bytes_read = len(header)
+    encoding = bom_encoding(header)
+    if encoding is None and b"\0" in header:
+        return ScanResult(FileStatus.BINARY, bytes_read=bytes_read)
+
+    patterns = (copyright_re, ANY_YEAR_COPYRIGHT_RE)
+    if encoding is not None:
+        if full_scan:
+            header += file.read()
+            bytes_read = len(header)
+        header = header.decode(encoding, errors="replace").encode()
+    elif full_scan:
+        return _search_full(file, header, patterns)
+
+    end = len(header) if full_scan else header_end(header)
+    for index, pattern in enumerate(patterns):
+        match = pattern.search(header, 0, end)
+        if match:
+            line = header.count(b"\n", 0, match.start()) + 1
+            return _found(index, match, line, match.start())._replace(
+                bytes_read=bytes_read
+            )
+    return ScanResult(FileStatus.MISSING, bytes_read=bytes_read)
+
+
+def scan_stream(
+    file: BinaryIO, copyright_re: re.Pattern[bytes], full_scan: bool
+) -> FileStatus:
+    """Checks the copyright statement in the content of the given binary stream.
+    See `scan_stream_result`.
+
+    :return: the status of the content.
+    """
+    return scan_stream_result(file, copyright_re, full_scan).status
+
+
+def scan_file_result(
+    file_path: Path, copyright_re: re.Pattern[bytes], full_scan: bool
+) -> ScanResult:
+    """Checks the copyright statement of the given file. See `scan_stream_result`."""
+    with open(file_path, "rb") as file:
+        return scan_stream_result(file, copyright_re, full_scan)
+
+
+def scan_file(
+    file_path: Path, copyright_re: re.Pattern[bytes], full_scan: bool
+) -> FileStatus:
+    """Checks the copyright statement of the given file. See `scan_stream`."""
+    return scan_file_result(file_path, copyright_re, full_scan).status
+
+
+def ordered_map(
+    func: Callable[[_Item], _Result], items: Iterable[_Item], jobs: int
+) -> Generator[tuple[_Item, _Result], None, None]:
+    """Applies the function to the items with the given number of threads.
+
+    Results are yielded in the order of the items, as soon as available. Items are
+    consumed lazily, with a bounded number of them in flight.
+
+    :return: a generator of each item with its result, to close for the items not
+        started yet to be dropped.
+    """
+    if jobs <= 1:
+        yield from ((item, func(item)) for item in items)
+        return
+
+    # not imported at the top, for a faster start of sequential runs
+    from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+        ThreadPoolExecutor,
+    )
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending: deque[tuple[_Item, Future[_Result]]] = deque()
+        try:
+            for item in items:
+                pending.append((item, executor.submit(func, item)))
+                if len(pending) >= jobs * _PENDING_ITEMS_PER_JOB:
+                    item, future = pending.popleft()
+                    yield item, future.result()
+            while pending:
+                item, future = pending.popleft()
+                yield item, future.result()
+        finally:
+            # if the iteration stops early, the items not started yet are dropped
+            for _, future in pending:
+                future.cancel()
+
+
+class CopyrightScanner:
+    """Checks the copyright statement of files, with the given scan parameters.
+
+    Args:
+        year: the year the copyright statements must be valid for.
+        full_scan_files: names of the files to be scanned entirely, instead of
+            checking only the top lines.
+        max_file_size: files larger than this number of bytes are not read at all.
+        cache: a cache of the statuses from previous runs, updated with new ones.
+        rules: other rules to check in the same read of each file, if any.
+    """
+
+    def __init__(
+        self,
+        year: int,
+        full_scan_files: Iterable[str] = (),
+        max_file_size: int | None = None,
+        cache: CopyrightCache | None = None,
+        rules: RuleSet | None = None,
+    ):
+        self.year = year
+        self.copyright_re = dated_copyright_pattern(year)
+        self.full_scan_names = set(full_scan_files)
+        self.max_file_size = max_file_size
+        self.cache = cache
+        self.rules = rules
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        """The parameters the statuses depend on, for the cache to be discarded when
+        they change."""
+        return {
+            "year": self.year,
+            "max_top_lines": MAX_TOP_LINES,
+            "max_top_bytes": MAX_TOP_BYTES,
+            "full_scan_files": sorted(self.full_scan_names),
+        }
+
+    def _is_oversize(self, size: int) -> bool:
+        return self.max_file_size is not None and size > self.max_file_size
+
+    def file_result(self, file_path: Path) -> ScanResult:
+        """:return: the result for the file in the working tree."""
+        if self._is_oversize(file_path.stat().st_size):
+            return ScanResult(FileStatus.OVERSIZE)
+
+        full_scan = file_path.name in self.full_scan_names
+        if self.cache is None:
+            return scan_file_result(file_path, self.copyright_re, full_scan)
+
+        key = self.cache.content_key(file_path, "*" if full_scan else "")
+        verdict = self.cache.get(key)
+        if verdict is not None:
+            return ScanResult.from_verdict(verdict)
+        result = scan_file_result(file_path, self.copyright_re, full_scan)
+        self.cache.put(key, result.verdict)
+        return result
+
+    def blob_result(self, file_path: Path, blob: StagedBlob | None) -> ScanResult:
+        """:return: the result for the staged blob of the file, or for the file in
+        the working tree if it is not staged."""
+        if blob is None:
+            return self.file_result(file_path)
+        if self._is_oversize(blob.size):
+            return ScanResult(FileStatus.OVERSIZE)
+
+        full_scan = file_path.name in self.full_scan_names
+        # the blob SHA is readily a content key
+        key = blob.sha + ("*" if full_scan else "")
+        verdict = self.cache.get(key) if self.cache is not None else None
+        if verdict is not None:
+            return ScanResult.from_verdict(verdict)
+        result = scan_stream_result(blob.stream, self.copyright_re, full_scan)
+        if self.cache is not None:
+            self.cache.put(key, result.verdict)
+        return result
+
+    def _rules_for(self, file_path: Path) -> tuple[int, ...]:
+        """:return: the indices of the rules that apply to the file, if any."""
+        return self.rules.rules_for(file_path) if self.rules else ()
+
+    def _rules_variant(self, file_path: Path, indices: tuple[int, ...]) -> str:
+        """:return: the suffix of the content key of a file checked for the given
+        rules, as the verdict depends on them."""
+        assert self.rules is not None
+        full_scan = "*" if file_path.name in self.full_scan_names else ""
+        return f"{full_scan}+{self.rules.fingerprint}:{','.join(map(str, indices))}"
+
+    def _content_report(
+        self,
+        file_path: Path,
+        content: bytes,
+        indices: tuple[int, ...],
+        key: str | None,
+    ) -> tuple[ScanResult, list[RuleMatch]]:
+        """Checks the copyright statement and the rules in the content of a file,
+        read once for both.
+
+        Verdicts are cached only for content that violates no rule, as violations
+        are reported with their location.
+        """
+        assert self.rules is not None
+        full_scan = file_path.name in self.full_scan_names
+        result = scan_stream_result(io.BytesIO(content), self.copyright_re, full_scan)
+        # the whole content is read for the rules
+        result = result._replace(bytes_read=len(content))
+        violations = []
+        if result.status != FileStatus.BINARY:
+            encoding = bom_encoding(content[:4]) or "utf-8-sig"
+            text = content.decode(encoding, errors="replace")
+            violations = self.rules.scan(text, indices)
+        if key is not None and not violations:
+            assert self.cache is not None
+            self.cache.put(key, result.verdict)
+        return result, violations
+
+    def file_report(self, file_path: Path) -> tuple[ScanResult, list[RuleMatch]]:
+        """:return: the result for the file in the working tree, and its violations
+        of the rules that apply to it."""
+        indices = self._rules_for(file_path)
+        if not indices:
+            return self.file_result(file_path), []
+        if self._is_oversize(file_path.stat().st_size):
+            return ScanResult(FileStatus.OVERSIZE), []
+
+        key = None
+        if self.cache is not None:
+            key = self.cache.content_key(
+                file_path, self._rules_variant(file_path, indices)
+            )
+            verdict = self.cache.get(key)
+            if verdict is not None:
+                return ScanResult.from_verdict(verdict), []
+        with open(file_path, "rb") as file:
+            content = file.read()
+        return self._content_report(file_path, content, indices, key)
+
+    def blob_report(
+        self, file_path: Path, blob: StagedBlob | None
+    ) -> tuple[ScanResult, list[RuleMatch]]:
+        """:return: the result for the staged blob of the file, or for the file in
+        the working tree if it is not staged, and its violations of the rules that
+        apply to it."""
+        if blob is None:
+            return self.file_report(file_path)
+        indices = self._rules_for(file_path)
+        if not indices:
+            return self.blob_result(file_path, blob), []
+        if self._is_oversize(blob.size):
+            return ScanResult(FileStatus.OVERSIZE), []
+
+        key = None
+        if self.cache is not None:
+            key = blob.sha + self._rules_variant(file_path, indices)
+            verdict = self.cache.get(key)
+            if verdict is not None:
+                return ScanResult.from_verdict(verdict), []
+        return self._content_report(file_path, blob.stream.read(), indices, key)
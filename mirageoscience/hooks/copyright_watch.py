@@ -0,0 +1,381 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+"""Continuous copyright check of files, re-checking each file only when it changes.
+
+The status of each file is kept in an in-memory index, along with the stat signature
+of the file when it was checked. Changes are detected with inotify on Linux, and by
+polling the stat signatures elsewhere: only the files whose signature changed are
+checked again. The index is rebuilt when the year changes, as the statements valid
+for the past year are now outdated.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable, Container, Iterable
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TextIO
+
+
+if TYPE_CHECKING:
+    from mirageoscience.hooks.check_copyright import FileResult, ScanPolicy
+
+
+POLL_INTERVAL = 1.0  # seconds
+# longest wait for changes, for the year and the stop event to be checked
+_MAX_WAIT = 1.0  # seconds
+
+# inotify constants, from <sys/inotify.h>
+_IN_MODIFY = 0x2
+_IN_ATTRIB = 0x4
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_IN_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_INOTIFY_EVENT = struct.Struct("iIII")
+_INOTIFY_READ_SIZE = 64 * 1024
+
+
+class StatusChange(NamedTuple):
+    """A change of the result of a file.
+
+    Attributes:
+        path: the file, as given to the index.
+        previous: the previous result, None if the file was not indexed yet or
+            did not exist.
+        current: the new result, None if the file does not exist anymore.
+    """
+
+    path: Path
+    previous: FileResult | None
+    current: FileResult | None
+
+
+class _ChangedFiles:
+    """Files due for a statement of the current year: the given ones, and the ones
+    changed since indexed, as any file with uncommitted changes."""
+
+    def __init__(self, files: Container[Path], changed: set[Path]):
+        self.files = files
+        self.changed = changed
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.changed or item in self.files
+
+
+class _Entry(NamedTuple):
+    signature: tuple[int, int] | None
+    result: FileResult | None
+
+
+def _stat_signature(file_path: Path) -> tuple[int, int] | None:
+    """:return: the size and modification time of the file, None if missing."""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _label(result: FileResult | None) -> str:
+    """:return: what is reported of the result of a file, to tell whether it
+    changed."""
+    if result is None:
+        return "deleted"
+    if not result.violations:
+        return result.status.value
+    return f"{result.status.value} with {len(result.violations)} violation(s)"
+
+
+class HeaderIndex:
+    """In-memory index of the copyright results of a fixed set of files.
+
+    Args:
+        files: the files to index.
+        check: checks the given files with the given policy, yielding their results,
+            such as `iter_check_results` with the other scan parameters set.
+        policy_for_year: gives the policy to check the files with, for a given year.
+            Called again when the year changes.
+    """
+
+    def __init__(
+        self,
+        files: Iterable[str],
+        check: Callable[[list[str], ScanPolicy], Iterable[FileResult]],
+        policy_for_year: Callable[[int], ScanPolicy],
+    ):
+        self.paths = [Path(f) for f in files]
+        self.check = check
+        self.policy_for_year = policy_for_year
+        self.year = 0
+        self.policy: ScanPolicy | None = None
+        self._entries: dict[Path, _Entry] = {}
+        self._changed: set[Path] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def result(self, file_path: Path) -> FileResult | None:
+        """:return: the last result of the given file, if indexed and existing."""
+        entry = self._entries.get(file_path)
+        return entry.result if entry is not None else None
+
+    def build(self) -> list[StatusChange]:
+        """Checks all the files, for the current year.
+
+        Returns:
+            list[StatusChange]: the changes of the results of the files, from the
+                previous ones if the index was already built.
+        """
+        self.year = date.today().year
+        policy = self.policy_for_year(self.year)
+        self._changed.clear()
+        if policy.current_year_files is not None:
+            policy = policy._replace(
+                current_year_files=_ChangedFiles(
+                    policy.current_year_files, self._changed
+                )
+            )
+        self.policy = policy
+        return self._check(
+            self.paths, {path: _stat_signature(path) for path in self.paths}
+        )
+
+    def refresh(self, candidates: Iterable[Path] | None = None) -> list[StatusChange]:
+        """Checks again the files whose stat signature changed, or all of them in a
+        new year.
+
+        Args:
+            candidates: the files that may have changed, as given to the index,
+                or None for all the files.
+
+        Returns:
+            list[StatusChange]: the changes of the results of the files.
+        """
+        if date.today().year != self.year:
+            return self.build()
+
+        signatures = {}
+        for path in self.paths if candidates is None else candidates:
+            entry = self._entries.get(path)
+            if entry is None:
+                continue
+            signature = _stat_signature(path)
+            if signature != entry.signature:
+                signatures[path] = signature
+        self._changed.update(signatures)
+        return self._check(list(signatures), signatures)
+
+    def _check(
+        self,
+        paths: list[Path],
+        signatures: dict[Path, tuple[int, int] | None],
+    ) -> list[StatusChange]:
+        """Checks the given files, updating their entries with their new results."""
+        existing = [str(path) for path in paths if signatures[path] is not None]
+        results: dict[Path, FileResult | None] = dict.fromkeys(paths)
+        assert self.policy is not None
+        for checked in self.check(existing, self.policy):
+            results[checked.path] = checked
+
+        changes = []
+        for path, result in results.items():
+            entry = self._entries.get(path)
+            previous = entry.result if entry is not None else None
+            self._entries[path] = _Entry(signatures[path], result)
+            if entry is None or _label(previous) != _label(result):
+                changes.append(StatusChange(path, previous, result))
+        return changes
+
+
+class Inotify:
+    """Watches directories for changes of their files, with the inotify API of
+    Linux, called through ctypes.
+
+    Args:
+        directories: the directories to watch.
+
+    Raises:
+        OSError: if inotify is not available, or a directory cannot be watched.
+    """
+
+    def __init__(self, directories: Iterable[Path]):
+        import ctypes  # pylint: disable=import-outside-toplevel
+
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            init, add_watch = libc.inotify_init1, libc.inotify_add_watch
+        except (AttributeError, OSError) as error:
+            raise OSError(f"inotify is not available: {error}") from error
+
+        self._fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "cannot initialize inotify")
+        self._directories: dict[int, Path] = {}
+        try:
+            for directory in directories:
+                descriptor = add_watch(self._fd, os.fsencode(directory), _IN_WATCH_MASK)
+                if descriptor < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, os.strerror(errno), str(directory))
+                self._directories[descriptor] = directory
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stops watching, releasing the inotify instance."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> Inotify:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def read(self, timeout: float) -> set[Path] | None:
+        """Waits for changes, and reads all the pending ones.
+
+        Args:
+            timeout: the longest time to wait for a change, in seconds.
+
+        Returns:
+            set[Path] | None: the paths of the changed files, in the watched
+                directories (empty if none changed in time), or None if events
+                were lost and any file may have changed.
+        """
+        changed: set[Path] | None = set()
+        while select.select([self._fd], [], [], timeout)[0]:
+            try:
+                data = os.read(self._fd, _INOTIFY_READ_SIZE)
+            except BlockingIOError:
+                break
+            changed = self._parse(data, changed)
+            # drains the events of a same save, such as a write and a rename
+            timeout = 0.01
+        return changed
+
+    def _parse(self, data: bytes, changed: set[Path] | None) -> set[Path] | None:
+        """:return: the given changed paths, with the ones of the events in the
+        data, or None if events were lost."""
+        offset = 0
+        while offset < len(data):
+            descriptor, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                changed = None
+            elif changed is not None and name and descriptor in self._directories:
+                changed.add(self._directories[descriptor] / os.fsdecode(name))
+        return changed
+
+
+def _seconds_to_new_year(now: datetime) -> float:
+    """:return: the time until the next 1st of January, in seconds."""
+    return (datetime(now.year + 1, 1, 1) - now).total_seconds()
+
+
+def _print_changes(changes: list[StatusChange], output: TextIO, initial: bool) -> None:
+    """Prints the changes of the results of the files, or only the failures for the
+    initial check."""
+    for change in changes:
+        current = change.current
+        failed = current is not None and current.failed
+        if initial:
+            if failed:
+                output.write(f"{change.path}: {_label(current)}, failed\n")
+            continue
+        verdict = "failed" if failed else "passed"
+        output.write(
+            f"{change.path}: {_label(change.previous)} -> {_label(current)}, "
+            f"{verdict}\n"
+        )
+    output.flush()
+
+
+def watch(
+    index: HeaderIndex,
+    output: TextIO = sys.stdout,
+    *,
+    poll_interval: float = POLL_INTERVAL,
+    use_inotify: bool = True,
+    stop: threading.Event | None = None,
+) -> None:
+    """Builds the index, then prints the changes of the results of the files as they
+    happen, until interrupted or stopped.
+
+    Args:
+        index: the index of the files to watch.
+        output: where to print the failures, then the changes.
+        poll_interval: the time between two checks of the stat signatures of all the
+            files, when inotify is not available, in seconds.
+        use_inotify: if False, poll even if inotify is available.
+        stop: an event telling to stop watching, if any.
+    """
+    stop = stop or threading.Event()
+    changes = index.build()
+    _print_changes(changes, output, initial=True)
+    failed = sum(1 for change in changes if change.current and change.current.failed)
+
+    absolute_paths = {path.absolute(): path for path in index.paths}
+    inotify = None
+    if use_inotify:
+        try:
+            inotify = Inotify({path.parent for path in absolute_paths})
+        except OSError:
+            pass
+    mode = "inotify" if inotify is not None else "polling"
+    print(
+        f"{failed} of {len(index)} files failed, watching them ({mode}), "
+        "Ctrl+C to stop",
+        file=sys.stderr,
+    )
+
+    try:
+        while not stop.is_set():
+            timeout = min(_seconds_to_new_year(datetime.now()), _MAX_WAIT)
+            candidates: list[Path] | None = []
+            if inotify is not None:
+                changed = inotify.read(timeout)
+                candidates = (
+                    None
+                    if changed is None
+                    else [absolute_paths[p] for p in changed if p in absolute_paths]
+                )
+            elif stop.wait(min(timeout, poll_interval)):
+                break
+            else:
+                candidates = None
+            _print_changes(index.refresh(candidates), output, initial=False)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if inotify is not None:
+            inotify.close()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 # '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
-#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                     '
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                     '
 #                                                                                   '
 #  This file is part of mirageoscience.pre-commit-hooks package.                    '
 #                                                                                   '
@@ -14,34 +14,45 @@
 from __future__ import annotations
 
 import argparse
-import re
-import shlex
-import subprocess
+import io
+import json
+import os
 import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from mirageoscience.hooks.commit_message import (
+    CommitMessage,
+    parse_commit_message,
+    parse_subject_line,
+    patch_range,
+)
+from mirageoscience.hooks.hook_client import PROFILE_ENV
+from mirageoscience.hooks.hooks_config import configured_index_path
+from mirageoscience.hooks.jira_patterns import message_patterns
+from mirageoscience.hooks.profiling import profiling, span
+
+
+# cache of the branch name and its JIRA ID, relative to the git directory
+BRANCH_CACHE_FILE = "mira-hooks/branch.json"
+# the same, in memory, for long-running processes
+_branch_jira_ids: dict[str, str] = {}
+
+# the modules needed in some cases only are imported when used, to start faster
+# pylint: disable=import-outside-toplevel
 
 
 def get_jira_id(text) -> str:
     """Detect a JIRA issue ID at the begging of the given text.
 
+    The JIRA project keys are read from the configuration of the repository (see
+    :func:`~mirageoscience.hooks.jira_patterns.load_project_keys`).
+
     :return: the JIRA issue ID if found, else empty string
     """
 
-    class JiraPattern:
-        """Internal class that encapsulates the regular expression for the JIRA pattern,
-        making sure it gets compiled only once."""
-
-        __pattern = re.compile(
-            r"(?:\w*!)?\s*\S?\b((?:GEOPY|GI|GA|GMS|VPem1D|VPem3D|VPmg|UBCGIF|LICMGR|DEVOPS|QA)-\d+)"
-        )
-
-        @staticmethod
-        def get():
-            """:return: the compiled regular expression for the JIRA pattern"""
-            return JiraPattern.__pattern
-
-    # use re.match() rather than re.search() to enforce the JIRA reference to be at the beginning
-    match = re.match(JiraPattern.get(), text.strip())
-    return match.group(1) if match else ""
+    # anchored, to enforce the JIRA reference to be at the beginning
+    return message_patterns().jira_id(text.strip())
 
 
 def get_message_prefix_bang(line: str) -> str:
@@ -51,28 +62,77 @@ def get_message_prefix_bang(line: str) -> str:
     :return: the standard commit message prefix if found, else empty string.
     """
 
-    class BangPattern:
-        """Internal class that encapsulates the regular expression for the Bnag pattern,
-        making sure it gets compiled only once."""
+    # anchored, to enforce the prefix to be at the beginning
+    return message_patterns().prefix_bang(line.strip())
 
-        __pattern = re.compile(r"(\w*!\s)")
 
-        @staticmethod
-        def get():
-            """:return: the compiled regular expression for the JIRA pattern"""
-            return BangPattern.__pattern
+def find_git_dir(start: Path | None = None) -> Path | None:
+    """Locates the git directory of the repository or worktree, without running git.
 
-    # use re.match() rather than re.search() to enforce pattern at the beginning
-    match = re.match(BangPattern.get(), line.strip())
-    return match.group(1) if match else ""
+    Honors the ``GIT_DIR`` environment variable, as set by git for hooks. Otherwise,
+    looks for ``.git`` from the start directory upwards, be it a directory or a file
+    pointing to the actual git directory (``gitdir: <path>``), as for worktrees and
+    submodules.
 
+    :param start: the directory to start from. Defaults to the current directory.
+    :return: the path to the git directory if found, else None.
+    """
 
-def get_branch_name() -> str | None:
-    """:return: the name of the current branch"""
+    git_dir_env = os.environ.get("GIT_DIR")
+    if git_dir_env:
+        return Path(git_dir_env).absolute()
+
+    start = (start or Path.cwd()).absolute()
+    for directory in [start, *start.parents]:
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if content.startswith("gitdir:"):
+                return directory / content[len("gitdir:") :].strip()
+    return None
+
+
+def _read_branch_ref(ref_file: Path, prefix: str = "") -> str | None:
+    """:return: the short name of the branch referenced in the given file, if any."""
+    try:
+        ref = ref_file.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    ref = ref[len(prefix) :] if ref.startswith(prefix) else ""
+    if ref.startswith("refs/heads/"):
+        return ref[len("refs/heads/") :]
+    return None
 
-    git_proc = subprocess.run(
-        shlex.split("git branch --list"), stdout=subprocess.PIPE, text=True, check=False
-    )
+
+def read_branch_name(git_dir: Path) -> str | None:
+    """Reads the name of the current branch straight from the git directory.
+
+    While rebasing, HEAD is detached and the branch being rebased is read from
+    ``rebase-merge/head-name`` or ``rebase-apply/head-name`` instead.
+
+    :param git_dir: the git directory of the repository or worktree.
+    :return: the name of the current branch (or of the branch being rebased), or
+        None if HEAD is detached outside a rebase.
+    """
+
+    for rebase_dir in ["rebase-merge", "rebase-apply"]:
+        head_name = git_dir / rebase_dir / "head-name"
+        if head_name.is_file():
+            return _read_branch_ref(head_name)
+    return _read_branch_ref(git_dir / "HEAD", "ref: ")
+
+
+def _get_branch_name_from_git() -> str | None:
+    """:return: the name of the current branch, as told by `git branch`"""
+
+    import subprocess
+
+    with span("git_message_hook.git_branch"):
+        git_proc = subprocess.run(
+            ["git", "branch", "--list"], stdout=subprocess.PIPE, text=True, check=False
+        )
 
     if git_proc.returncode != 0:
         return None
@@ -86,55 +146,148 @@ def get_branch_name() -> str | None:
             break
     assert current_branch is not None
 
-    class RebasingPattern:
-        """Internal class that encapsulates the regular expression for the rebasing
-        message pattern, making sure it gets compiled only once."""
-
-        __pattern = re.compile(r"\(.*\s(\S+)\s*\)")
+    rebased_branch = message_patterns().rebased_branch(current_branch.strip())
+    if rebased_branch is not None:
+        return rebased_branch
 
-        @staticmethod
-        def get():
-            """:return: the compiled regular expression for the Rebasing pattern"""
-            return RebasingPattern.__pattern
+    return current_branch
 
-    match = re.match(RebasingPattern.get(), current_branch.strip())
-    if match:
-        return match.group(1)
 
-    return current_branch
+def get_branch_name() -> str | None:
+    """:return: the name of the current branch"""
 
+    with span("git_message_hook.get_branch_name") as details:
+        git_dir = find_git_dir()
+        if git_dir is not None:
+            branch_name = read_branch_name(git_dir)
+            if branch_name:
+                details["source"] = "git dir"
+                return branch_name
+
+        # detached HEAD outside a rebase, or unusual layout: let git describe it
+        details["source"] = "git branch"
+        return _get_branch_name_from_git()
+
+
+def _branch_cache_key(git_dir: Path) -> dict[str, str | int] | None:
+    """:return: what identifies the current branch: the content and modification time
+    of the file it is resolved from, i.e. the head-name of a rebase in progress, or
+    else HEAD, along with the JIRA pattern it is matched with. None if there is no
+    such file."""
+
+    for ref_file in [
+        git_dir / "rebase-merge" / "head-name",
+        git_dir / "rebase-apply" / "head-name",
+        git_dir / "HEAD",
+    ]:
+        try:
+            content = ref_file.read_text(encoding="utf-8")
+            mtime_ns = ref_file.stat().st_mtime_ns
+        except OSError:
+            continue
+        return {
+            "source": ref_file.relative_to(git_dir).as_posix(),
+            "content": content,
+            "mtime_ns": mtime_ns,
+            "patterns": message_patterns().fingerprint,
+        }
+    return None
+
+
+def get_branch_jira_id() -> str:
+    """Detect the JIRA issue ID at the beginning of the current branch name.
+
+    The result is cached in the git directory, keyed by the content and modification
+    time of the file the branch is resolved from. Hence, it is shared by the
+    prepare-commit-msg and the commit-msg stages, and by all the steps of a rebase,
+    while moving HEAD to another branch, or changing the JIRA project keys,
+    invalidates it. Long-running processes also keep it in memory.
 
-def check_commit_message(filepath: str) -> tuple[bool, str]:
-    """Check if the branch name or the commit message starts with a reference to JIRA,
-    and if the message meets the minimum required length for the summary line.
+    :return: the JIRA issue ID if found, else empty string
+    """
 
-    The JIRA reference has to be at the beginning of the branch name, or of the commit
-    message.
+    with span("git_message_hook.get_branch_jira_id") as details:
+        git_dir = find_git_dir()
+        cache_key = _branch_cache_key(git_dir) if git_dir is not None else None
+        cache_path = None
+        memory_key = ""
+        if git_dir is not None and cache_key is not None:
+            memory_key = f"{git_dir}:{json.dumps(cache_key, sort_keys=True)}"
+            if memory_key in _branch_jira_ids:
+                details["cache"] = "memory"
+                return _branch_jira_ids[memory_key]
+            cache_path = git_dir / BRANCH_CACHE_FILE
+            try:
+                with open(cache_path, encoding="utf-8") as cache_file:
+                    cached = json.load(cache_file)
+                if cached.get("key") == cache_key:
+                    _branch_jira_ids[memory_key] = cached["jira_id"]
+                    details["cache"] = "file"
+                    return cached["jira_id"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+
+        details["cache"] = "miss"
+        branch_jira_id = ""
+        branch_name = get_branch_name()
+        if branch_name:
+            branch_jira_id = get_jira_id(branch_name)
+
+        if cache_path is not None:
+            _branch_jira_ids[memory_key] = branch_jira_id
+            cached = {
+                "key": cache_key,
+                "branch": branch_name,
+                "jira_id": branch_jira_id,
+            }
+            temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            try:
+                cache_path.parent.mkdir(exist_ok=True)
+                temp_path.write_text(json.dumps(cached), encoding="utf-8")
+                os.replace(temp_path, cache_path)
+            except OSError:
+                pass
+        return branch_jira_id
+
+
+def check_message_subject(
+    first_line: str,
+    branch_jira_id: str,
+    validate_issue: Callable[[str], str] | None = None,
+) -> tuple[bool, str]:
+    """Check if the branch name or the first line of the commit message starts with a
+    reference to JIRA, and if this line meets the minimum required length.
+
+    :param first_line: the first non-comment, non-empty line of the commit message.
+    :param branch_jira_id: the JIRA ID found in the branch name, if any.
+    :param validate_issue: if given, tells whether the issue referred to is valid,
+        returning an error message if not (see
+        :class:`~mirageoscience.hooks.jira_index.IssueValidator`).
     :return: a tuple telling whether the commit message is valid or not, and an error
         message (empty in case the message is valid).
     """
 
-    branch_jira_id = ""
-    branch_name = get_branch_name()
-    if branch_name:
-        branch_jira_id = get_jira_id(branch_name)
+    return check_parsed_message(
+        parse_subject_line(first_line), branch_jira_id, validate_issue
+    )
+
 
-    message_jira_id = ""
-    first_line = None
-    with open(filepath, encoding="utf-8") as message_file:
-        for line in message_file:
-            if not line.startswith("#") and len(line.strip()) > 0:
-                # test only the first non-comment line that is not empty
-                # (should we reject messages with empty first line?)
-                first_line = line.strip()
-                prefix_bang = get_message_prefix_bang(first_line)
-                first_line = first_line[len(prefix_bang) :].strip()
-                message_jira_id = get_jira_id(first_line)
-                break
-    assert first_line is not None
+def check_parsed_message(
+    message: CommitMessage,
+    branch_jira_id: str,
+    validate_issue: Callable[[str], str] | None = None,
+) -> tuple[bool, str]:
+    """Check the subject line of a parsed commit message, as
+    :func:`check_message_subject` does.
+
+    :return: a tuple telling whether the commit message is valid or not, and an error
+        message (empty in case the message is valid).
+    """
 
+    message_jira_id = message.jira_id
     if not branch_jira_id and not (
-        message_jira_id or (not prefix_bang and first_line.lower().startswith("merge"))
+        message_jira_id
+        or (not message.prefix_bang and message.subject.lower().startswith("merge"))
     ):
         return (
             False,
@@ -148,13 +301,11 @@ def check_commit_message(filepath: str) -> tuple[bool, str]:
             f"and in branch name {branch_jira_id}.",
         )
 
-    stripped_message_line = ""
-    if first_line:
-        stripped_message_line = first_line.strip()
-        if message_jira_id:
-            stripped_message_line = stripped_message_line[
-                len(message_jira_id) + 1 :
-            ].strip()
+    stripped_message_line = message.subject
+    if message_jira_id:
+        stripped_message_line = stripped_message_line[
+            len(message_jira_id) + 1 :
+        ].strip()
 
     min_required_length = 10
     if len(stripped_message_line) < min_required_length:
@@ -164,9 +315,134 @@ def check_commit_message(filepath: str) -> tuple[bool, str]:
             "beyond the JIRA ID.",
         )
 
+    jira_id = message_jira_id or branch_jira_id
+    if validate_issue is not None and jira_id:
+        issue_error = validate_issue(jira_id)
+        if issue_error:
+            return False, issue_error
+
     return True, ""
 
 
+def _issue_validator() -> Callable[[str], str] | None:
+    """:return: the validator of the JIRA issues, if an index is configured."""
+
+    if configured_index_path() is None:
+        return None
+    from mirageoscience.hooks.jira_index import configured_validator
+
+    return configured_validator()
+
+
+def check_commit_message(filepath: str) -> tuple[bool, str]:
+    """Check if the branch name or the commit message starts with a reference to JIRA,
+    and if the message meets the minimum required length for the summary line.
+
+    The JIRA reference has to be at the beginning of the branch name, or of the commit
+    message.
+    :return: a tuple telling whether the commit message is valid or not, and an error
+        message (empty in case the message is valid).
+    """
+
+    with span("git_message_hook.check_commit_message"):
+        branch_jira_id = get_branch_jira_id()
+
+        with span("git_message_hook.read_message"):
+            with open(filepath, "rb") as message_file:
+                # test only the first non-comment line that is not empty
+                # (should we reject messages with empty first line?)
+                message = parse_commit_message(message_file, subject_only=True)
+        assert message.has_subject
+
+        with span("git_message_hook.check_parsed_message"):
+            return check_parsed_message(message, branch_jira_id, _issue_validator())
+
+
+def iter_commit_subjects(revisions: list[str]) -> Iterator[tuple[str, str]]:
+    """Lists the commits of the given revision range, as they are read from a single
+    `git log -z` process.
+
+    The subject is the first line of the message that is neither blank nor a comment,
+    as checked by the commit-msg hook: not the first paragraph joined into a line, as
+    git's ``%s`` format gives.
+
+    :param revisions: the git log arguments selecting the commits, e.g. ``["A..B"]``.
+    :return: an iterator of the SHA and subject line of each commit.
+    """
+
+    import subprocess
+
+    from mirageoscience.hooks.tracked_files import iter_nul_fields
+
+    with subprocess.Popen(
+        ["git", "log", "-z", "--format=%H%x00%B", *revisions, "--"],
+        stdout=subprocess.PIPE,
+    ) as git_proc:
+        assert isinstance(git_proc.stdout, io.BufferedReader)
+        completed = False
+        try:
+            fields = iter_nul_fields(git_proc.stdout)
+            for sha, body in zip(fields, fields, strict=False):
+                message = parse_commit_message(io.BytesIO(body), subject_only=True)
+                subject = body[message.subject_start : message.subject_end]
+                yield sha.decode(), subject.decode("utf-8", errors="replace").strip()
+            completed = True
+        finally:
+            if not completed:
+                git_proc.kill()
+    if git_proc.returncode != 0:
+        raise subprocess.CalledProcessError(git_proc.returncode, git_proc.args)
+
+
+def pushed_revisions() -> list[str]:
+    """Tell the commits being pushed, from the environment set by pre-commit for the
+    pre-push stage (``PRE_COMMIT_FROM_REF`` and ``PRE_COMMIT_TO_REF``).
+
+    :return: the git log arguments selecting the pushed commits. Without the refs,
+        as on the first push of a repository, these are the commits of HEAD that are
+        not on any remote yet.
+    """
+
+    from_ref = os.environ.get("PRE_COMMIT_FROM_REF", "")
+    to_ref = os.environ.get("PRE_COMMIT_TO_REF", "")
+    if not from_ref or not to_ref:
+        return [to_ref or "HEAD", "--not", "--remotes"]
+    return [f"{from_ref}..{to_ref}"]
+
+
+def check_commit_range(revisions: list[str], branch_name: str | None = None) -> bool:
+    """Check the subject line of every commit of the given range, with the same rules
+    as for the commit-msg hook, and report the invalid ones.
+
+    :param revisions: the git log arguments selecting the commits, e.g. ``["A..B"]``.
+    :param branch_name: the branch the commits belong to. Defaults to the branch
+        being pushed, if told by pre-commit, else to the current branch.
+    :return: True if all the commits are valid, False otherwise.
+    """
+
+    if branch_name is None:
+        branch_name = os.environ.get("PRE_COMMIT_LOCAL_BRANCH")
+    if branch_name is None:
+        branch_jira_id = get_branch_jira_id()
+    else:
+        branch_jira_id = get_jira_id(branch_name.removeprefix("refs/heads/"))
+
+    validate_issue = _issue_validator()
+    checked_count = 0
+    invalid_count = 0
+    for sha, subject in iter_commit_subjects(revisions):
+        checked_count += 1
+        (is_valid, error_message) = check_message_subject(
+            subject, branch_jira_id, validate_issue
+        )
+        if not is_valid:
+            invalid_count += 1
+            print(f"{sha[:12]} {subject}\n    **ERROR** {error_message}")
+
+    print(f"check-range: {checked_count} commit(s) checked, {invalid_count} invalid.")
+    return invalid_count == 0
+
+
 def check_commit_msg(filepath: str) -> None:
     """To be used as the Git commit-msg hook.
 
@@ -189,46 +465,47 @@ def prepare_commit_msg(filepath: str, source: str | None = None) -> None:
     message.
     """
 
-    branch_jira_id = ""
-    branch_name = get_branch_name()
-    if branch_name:
-        branch_jira_id = get_jira_id(branch_name)
+    with span("git_message_hook.prepare_commit_msg"):
+        _prepare_commit_msg(filepath, source)
+
 
+def _prepare_commit_msg(filepath: str, source: str | None) -> None:
+    """Adds the JIRA ID of the branch to the message, if missing. See
+    `prepare_commit_msg`."""
+
+    branch_jira_id = get_branch_jira_id()
     if not branch_jira_id:
         return
 
     if source not in [None, "message", "template"]:
         return
 
-    prefix_bang = ""
-    with open(filepath, "r+", encoding="utf-8") as message_file:
-        message_has_jira_id = False
-        message_lines = message_file.readlines()
-        for line_index, line_content in enumerate(message_lines):
-            if not line_content.startswith("#"):
-                # test only the first non-comment line
-                line_content = line_content.strip()
-                prefix_bang = get_message_prefix_bang(line_content)
-                line_content = line_content[len(prefix_bang) :].strip()
-                message_jira_id = get_jira_id(line_content)
-                if not message_jira_id:
-                    message_lines[line_index] = (
-                        f"{prefix_bang}[{branch_jira_id}] {line_content}\n"
-                    )
-                message_has_jira_id = True
-                break
-
-        if not message_has_jira_id:
+    with open(filepath, "r+b") as message_file:
+        with span("git_message_hook.read_message"):
+            message = parse_commit_message(message_file, subject_only=True)
+        if message.first_line_start is None or message.first_line_end is None:
             # message is empty or all lines are comments: insert JIRA ID at the very beginning
-            message_lines.insert(0, f"{prefix_bang}[{branch_jira_id}]\n")
-
-        message_file.seek(0, 0)
-        message_file.write("".join(message_lines))
+            patch_range(message_file, 0, 0, f"[{branch_jira_id}]\n".encode())
+            return
+
+        # test only the first non-comment line, even if blank
+        line_range = (message.first_line_start, message.first_line_end)
+        if message.first_line_start != message.subject_start:
+            message = parse_subject_line("")
+        if not message.jira_id:
+            subject_line = (
+                f"{message.prefix_bang}[{branch_jira_id}] {message.subject}\n"
+            )
+            patch_range(
+                message_file,
+                *line_range,
+                subject_line.encode("utf-8", errors="surrogateescape"),
+            )
 
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("msg_file", help="the message file")
+    parser.add_argument("msg_file", nargs="?", help="the message file")
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument(
         "-p", "--prepare", action="store_true", help="prepare the commit message"
@@ -239,9 +516,61 @@ def main():
         action="store_true",
         help="check if the commit message is valid",
     )
+    group.add_argument(
+        "--check-range",
+        nargs="?",
+        const="",
+        metavar="A..B",
+        help=(
+            "check the messages of all the commits in the given revision range. "
+            "Defaults to the commits being pushed, as told by pre-commit"
+        ),
+    )
+    parser.add_argument(
+        "--branch",
+        help=(
+            "with --check-range, the branch the commits belong to "
+            "(defaults to the branch being pushed, or else the current branch)"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        help=(
+            "file where to append the timings of the phases of the hook, as a Chrome "
+            "trace if named *.json, else as JSON lines "
+            f"(default: ${PROFILE_ENV})"
+        ),
+        metavar="PATH",
+        default=os.environ.get(PROFILE_ENV) or None,
+    )
     parser.add_argument("args", nargs=argparse.REMAINDER)
 
     args = parser.parse_args()
+    with profiling(args.profile):
+        _run(parser, args)
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Runs the hook as told by the parsed command line arguments.
+
+    Raises:
+        SystemExit: If the commit messages are invalid.
+    """
+    if args.check_range is not None:
+        revisions = [args.check_range] if args.check_range else pushed_revisions()
+        import subprocess  # pylint: disable=import-outside-toplevel
+
+        try:
+            valid = check_commit_range(revisions, args.branch)
+        except subprocess.CalledProcessError as error:
+            parser.error(f"cannot list the commits of {' '.join(revisions)}: {error}")
+        if not valid:
+            sys.exit(1)
+        return
+
+    if args.msg_file is None:
+        parser.error("the message file is required with --prepare and --check")
     if args.prepare:
         prepare_commit_msg(args.msg_file, *args.args)
     elif args.check:
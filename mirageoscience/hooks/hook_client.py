@@ -0,0 +1,317 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Entry points of the hooks, and the ``mira-hooks`` dispatcher of their commands.
+
+The command line of the hooks is forwarded to a warm daemon when enabled, or else
+the hooks run in process.
+
+This module is kept light on imports: the point is to spare the start-up of the
+hooks. The hook modules are imported only when run, and the modules needed to talk
+to the daemon only when enabled.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+
+from mirageoscience.hooks import __version__
+
+
+# as typing.TYPE_CHECKING, without importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# pylint: disable=import-outside-toplevel
+
+HOOK_MODULES = {
+    "check_copyright": "mirageoscience.hooks.check_copyright",
+    "git_message_hook": "mirageoscience.hooks.git_message_hook",
+    "jira_index": "mirageoscience.hooks.jira_index",
+}
+# the hooks that may run in the daemon
+DAEMON_HOOKS = ("check_copyright", "git_message_hook")
+# the commands of the mira-hooks dispatcher, with their hook and description
+COMMANDS = {
+    "check-copyright": ("check_copyright", "check the copyright statements of files"),
+    "git-message-hook": ("git_message_hook", "prepare or check commit messages"),
+    "jira-index": ("jira_index", "build, update or query the JIRA issue index"),
+}
+# set to 1 to enable the daemon
+DAEMON_ENV = "MIRA_HOOKS_DAEMON"
+# overrides the path of the socket of the daemon
+SOCKET_ENV = "MIRA_HOOKS_SOCKET"
+# the file where to append the profile of the hooks, to enable profiling
+# (see mirageoscience.hooks.profiling)
+PROFILE_ENV = "MIRA_HOOKS_PROFILE"
+# options that never end, and that must thus run in the process of the hook
+IN_PROCESS_OPTIONS = ("--watch",)
+# paths that mean something else in the daemon, e.g. its stdin is /dev/null
+CLIENT_PATH_PREFIXES = ("/dev/", "/proc/self/", "/proc/thread-self/")
+PROTOCOL_VERSION = 1
+_CONNECT_TIMEOUT = 0.5  # seconds
+# how long to wait for the daemon to run the hook, before running it in process
+REPLY_TIMEOUT = 120.0  # seconds
+_RECEIVE_CHUNK_SIZE = 64 * 1024
+
+
+def daemon_identity() -> str:
+    """:return: what a daemon must match to serve this client: the protocol, the
+    version of the package, and the interpreter."""
+    return f"{PROTOCOL_VERSION}:{__version__}:{sys.executable}"
+
+
+def daemon_enabled() -> bool:
+    """:return: True if the daemon is enabled, and supported on this platform."""
+    if os.environ.get(DAEMON_ENV, "").lower() not in ("1", "true", "yes", "on"):
+        return False
+    import socket
+
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+def socket_path() -> Path:
+    """:return: the path of the socket of the daemon for this user, package version
+    and interpreter, in a directory private to the user."""
+    import zlib
+    from pathlib import Path
+
+    env_path = os.environ.get(SOCKET_ENV)
+    if env_path:
+        return Path(env_path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR", "/tmp")
+    identity_hash = zlib.crc32(daemon_identity().encode())
+    return Path(runtime_dir) / f"mira-hooks-{os.getuid()}" / f"{identity_hash:08x}.sock"
+
+
+def private_directory(path: Path) -> bool:
+    """:return: True if the directory is owned by this user, with no access for
+    others, and not a symbolic link: no one else can serve or replace the sockets
+    in it, to which the clients send their environment."""
+    import stat
+
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and stat.S_IMODE(info.st_mode) == 0o700
+    )
+
+
+def daemon_command(path: Path) -> list[str]:
+    """:return: the command line of a daemon listening on the given socket."""
+    return [
+        sys.executable,
+        "-m",
+        "mirageoscience.hooks.hook_daemon",
+        "--socket",
+        str(path),
+    ]
+
+
+def start_daemon(path: Path) -> None:
+    """Starts a daemon listening on the given socket, detached from this process.
+
+    Failures to start it are ignored: the hooks then keep running in process.
+    """
+    import subprocess
+
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not private_directory(path.parent):
+            return
+        subprocess.Popen(  # pylint: disable=consider-using-with
+            daemon_command(path),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def must_run_in_process(argv: list[str]) -> bool:
+    """:return: True if the command line reads from stdin, or any other file that
+    only the client can read, such as ``/dev/fd/N`` from a process substitution, or
+    runs until interrupted, such as ``--watch``, with an output that the daemon
+    would only send back at the end, while serving no other client."""
+    for arg in argv:
+        option, _, value = arg.partition("=")
+        if not arg.startswith("--"):
+            # a positional argument, or the value of the previous option
+            option, value = "", arg
+        if value == "-" or value.startswith(CLIENT_PATH_PREFIXES):
+            return True
+        # as argparse, accept unambiguous abbreviations of the options
+        if len(option) > 2 and any(
+            name.startswith(option) for name in IN_PROCESS_OPTIONS
+        ):
+            return True
+    return False
+
+
+def forward(hook: str, argv: list[str]) -> int | None:
+    """Runs the hook in the daemon, starting the daemon if it is not running.
+
+    The output of the hook is written to the standard output and error of this
+    process once the hook completes, if it completes within :data:`REPLY_TIMEOUT`
+    seconds. Nothing is sent unless the directory of the
+    socket is private to the user (see :func:`private_directory`).
+
+    Args:
+        hook: the name of the hook.
+        argv: the command line arguments of the hook.
+
+    Returns:
+        int | None: the exit status of the hook, or None if it could not run in the
+            daemon.
+    """
+    import json
+    import socket
+
+    path = socket_path()
+    if not private_directory(path.parent):
+        if not path.parent.exists():
+            start_daemon(path)
+        return None
+    request = {
+        "identity": daemon_identity(),
+        "hook": hook,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(_CONNECT_TIMEOUT)
+            client.connect(str(path))
+            client.settimeout(REPLY_TIMEOUT)
+            client.sendall(json.dumps(request).encode())
+            client.shutdown(socket.SHUT_WR)
+            response = b"".join(iter(lambda: client.recv(_RECEIVE_CHUNK_SIZE), b""))
+    except (FileNotFoundError, ConnectionRefusedError):
+        start_daemon(path)
+        return None
+    except OSError:
+        return None
+
+    try:
+        reply = json.loads(response)
+    except ValueError:
+        return None
+    if not isinstance(reply, dict) or not isinstance(reply.get("status"), int):
+        return None
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    return reply["status"]
+
+
+def run_in_process(hook: str, argv: list[str]) -> int:
+    """Runs the main function of the hook in this process.
+
+    Args:
+        hook: the name of the hook.
+        argv: the command line arguments of the hook.
+
+    Returns:
+        int: the exit status of the hook.
+    """
+    if os.environ.get(PROFILE_ENV):
+        from pathlib import Path
+
+        from mirageoscience.hooks.profiling import profiling, span
+
+        with profiling(Path(os.environ[PROFILE_ENV])), span("run", hook=hook):
+            with span("import", module=HOOK_MODULES[hook]):
+                module = importlib.import_module(HOOK_MODULES[hook])
+            return _run_main(module, hook, argv)
+    return _run_main(importlib.import_module(HOOK_MODULES[hook]), hook, argv)
+
+
+def _run_main(module, hook: str, argv: list[str]) -> int:
+    """:return: the exit status of the main function of the hook module."""
+    saved_argv = sys.argv
+    sys.argv = [hook, *argv]
+    try:
+        module.main()
+    except SystemExit as exit_info:
+        if exit_info.code is None or isinstance(exit_info.code, int):
+            return exit_info.code or 0
+        print(exit_info.code, file=sys.stderr)
+        return 1
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
+def run_hook(hook: str, argv: list[str] | None = None) -> int:
+    """Runs the hook in the daemon if enabled, falling back to running it in process.
+
+    Args:
+        hook: the name of the hook.
+        argv: the command line arguments of the hook. Defaults to the ones of this
+            process.
+
+    Returns:
+        int: the exit status of the hook.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if hook in DAEMON_HOOKS and daemon_enabled() and not must_run_in_process(argv):
+        status = forward(hook, argv)
+        if status is not None:
+            return status
+    return run_in_process(hook, argv)
+
+
+def check_copyright() -> None:
+    """Entry point of the check_copyright hook."""
+    sys.exit(run_hook("check_copyright"))
+
+
+def git_message_hook() -> None:
+    """Entry point of the git_message_hook hook."""
+    sys.exit(run_hook("git_message_hook"))
+
+
+def _print_usage(file) -> None:
+    print("usage: mira-hooks <command> [arguments...]\n\ncommands:", file=file)
+    for command, (_, description) in COMMANDS.items():
+        print(f"  {command:<20}{description}", file=file)
+    print(
+        "\nSee mira-hooks <command> --help for the arguments of a command.", file=file
+    )
+
+
+def main() -> None:
+    """Entry point of the mira-hooks dispatcher: runs the hook of the command given
+    as first argument, with the rest of the arguments."""
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        _print_usage(sys.stdout if len(sys.argv) >= 2 else sys.stderr)
+        sys.exit(0 if len(sys.argv) >= 2 else 2)
+    if sys.argv[1] == "--version":
+        print(f"mira-hooks {__version__}")
+        sys.exit(0)
+
+    command = COMMANDS.get(sys.argv[1])
+    if command is None:
+        print(f"mira-hooks: unknown command {sys.argv[1]!r}", file=sys.stderr)
+        _print_usage(sys.stderr)
+        sys.exit(2)
+    sys.exit(run_hook(command[0], sys.argv[2:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Daemon running the hooks on behalf of :mod:`mirageoscience.hooks.hook_client`,
+with the modules kept imported from one run to the next.
+
+Each request is served in a child process forked from the daemon, in the working
+directory and with the environment of its client, so that the clients of a file
+list split by pre-commit run side by side. The daemon exits once idle for a while.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any
+
+from mirageoscience.hooks.hook_client import (
+    DAEMON_HOOKS,
+    HOOK_MODULES,
+    REPLY_TIMEOUT,
+    daemon_identity,
+    must_run_in_process,
+    private_directory,
+    run_in_process,
+)
+
+
+DEFAULT_IDLE_TIMEOUT = 600.0  # seconds
+IDLE_TIMEOUT_ENV = "MIRA_HOOKS_DAEMON_IDLE_TIMEOUT"
+_REQUEST_TIMEOUT = 10.0  # seconds
+# shorter than the reply timeout of the clients, for them not to run in process a
+# hook that still runs in the daemon
+_RUN_TIMEOUT = int(REPLY_TIMEOUT - 2 * _REQUEST_TIMEOUT)  # seconds
+_RECEIVE_CHUNK_SIZE = 64 * 1024
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Runs a hook as requested by a client.
+
+    Args:
+        request: the identity of the client, the name of the hook, its command
+            line arguments, and the working directory and environment to run it in.
+
+    Returns:
+        dict: the exit status and the output of the hook. The status is None if the
+            hook could not run, so that the client runs it in process.
+    """
+    if request.get("identity") != daemon_identity():
+        return {"status": None, "error": "the daemon does not match the client"}
+    if request.get("hook") not in DAEMON_HOOKS:
+        return {"status": None, "error": "unknown hook"}
+    if must_run_in_process(list(request.get("argv", []))):
+        return {"status": None, "error": "the hook must run in the client"}
+
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = run_in_process(request["hook"], list(request["argv"]))
+    except Exception as error:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+        # let the client run it again in process, where the error shows
+        return {"status": None, "error": repr(error)}
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+    return {"status": status, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def _send_reply(connection: socket.socket, reply: dict[str, Any]) -> None:
+    """Sends the reply to a request, unless the client is gone."""
+    connection.settimeout(None)
+    try:
+        connection.sendall(json.dumps(reply).encode())
+    except OSError:
+        pass
+
+
+def _serve_connection(connection: socket.socket, *inherited) -> bool:
+    """Serves the request of a client in a child process.
+
+    Args:
+        connection: the connection of the client.
+        inherited: the files of the daemon, for the child process to close.
+
+    Returns:
+        bool: False if the daemon should stop, as it does not match the client.
+    """
+    connection.settimeout(_REQUEST_TIMEOUT)
+    try:
+        data = b"".join(iter(lambda: connection.recv(_RECEIVE_CHUNK_SIZE), b""))
+        request = json.loads(data)
+    except (OSError, ValueError):
+        return True
+
+    if not isinstance(request, dict) or request.get("identity") != daemon_identity():
+        _send_reply(connection, handle_request({}))
+        return False
+    if os.fork() == 0:
+        # the child changes its working directory and environment to the ones of the
+        # client, leaving alone the daemon and the other requests
+        status = 1
+        try:
+            for file in inherited:
+                file.close()
+            signal.alarm(_RUN_TIMEOUT)
+            _send_reply(connection, handle_request(request))
+            status = 0
+        finally:
+            os._exit(status)  # pylint: disable=protected-access
+    return True
+
+
+def _reap_children() -> None:
+    """Collects the exit status of the child processes that completed."""
+    try:
+        while os.waitpid(-1, os.WNOHANG)[0]:
+            pass
+    except ChildProcessError:
+        pass
+
+
+def serve(socket_path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Serves the clients on the given Unix socket, until idle for the given time.
+
+    Only one daemon serves a socket: others exit right away, as do daemons asked to
+    serve in a directory that is not private to the user. The hook modules are
+    imported beforehand, for the child processes serving the requests to start warm.
+
+    Args:
+        socket_path: the path of the socket, in a directory private to the user.
+        idle_timeout: how long to wait for a request before exiting, in seconds.
+    """
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not private_directory(socket_path.parent):
+        # another user could have created it, to read the requests
+        return
+    with open(socket_path.with_suffix(".lock"), "a", encoding="utf-8") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return
+
+        for hook in DAEMON_HOOKS:
+            importlib.import_module(HOOK_MODULES[hook])
+        socket_path.unlink(missing_ok=True)
+        # bound aside, for the clients to only find it once it listens
+        bound_path = socket_path.with_name(f".{socket_path.name}.{os.getpid()}")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(bound_path))
+            try:
+                bound_path.chmod(0o600)
+                server.listen()
+                bound_path.replace(socket_path)
+                server.settimeout(idle_timeout)
+                while True:
+                    try:
+                        connection, _ = server.accept()
+                    except TimeoutError:
+                        break
+                    finally:
+                        _reap_children()
+                    with connection:
+                        if not _serve_connection(connection, server, lock_file):
+                            break
+            finally:
+                bound_path.unlink(missing_ok=True)
+                socket_path.unlink(missing_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve the hooks on a Unix socket, for hook_client."
+    )
+    parser.add_argument("--socket", type=Path, required=True, help="the socket path")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=float(os.environ.get(IDLE_TIMEOUT_ENV, DEFAULT_IDLE_TIMEOUT)),
+        help="exit after this many seconds without any request",
+    )
+    args = parser.parse_args()
+    serve(args.socket, args.idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Configuration of the hooks, read from the repository they run in."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+
+# configuration files, looked up in the current directory, in order
+CONFIG_FILE = ".mira-hooks.toml"
+PYPROJECT_FILE = "pyproject.toml"
+PYPROJECT_TABLE = "mira-hooks"
+
+# environment variable overriding the path of the JIRA issue index
+JIRA_INDEX_ENV = "MIRA_HOOKS_JIRA_INDEX"
+DEFAULT_REJECTED_STATUSES = ("Closed",)
+
+
+def _toml_module() -> ModuleType | None:
+    """:return: the TOML parser, imported only when there is a file to parse."""
+    # pylint: disable=import-outside-toplevel
+    if sys.version_info >= (3, 11):
+        import tomllib
+
+        return tomllib
+    try:  # pragma: no cover
+        import tomli
+
+        return tomli
+    except ImportError:  # pragma: no cover
+        return None
+
+
+def _read_config(config_path: Path) -> dict[str, Any] | None:
+    """:return: the hooks configuration from the given TOML file, if any."""
+    if not config_path.is_file():
+        return None
+    toml = _toml_module()
+    if toml is None:
+        return None
+    try:
+        with open(config_path, "rb") as file:
+            content = toml.load(file)
+    except (OSError, ValueError):
+        return None
+    if config_path.name == PYPROJECT_FILE:
+        content = content.get("tool", {}).get(PYPROJECT_TABLE)
+    return content if isinstance(content, dict) else None
+
+
+def load_hooks_config(config_dir: Path | None = None) -> tuple[dict[str, Any], Path]:
+    """Reads the configuration of the hooks for the repository.
+
+    The configuration is read from ``.mira-hooks.toml`` if present, else from the
+    ``[tool.mira-hooks]`` table of ``pyproject.toml``.
+
+    :param config_dir: where to look for the configuration files. Defaults to the
+        current directory.
+    :return: the configuration (empty if none), and the directory it was looked up
+        in, which relative paths of the configuration refer to.
+    """
+
+    config_dir = config_dir or Path.cwd()
+    for config_name in [CONFIG_FILE, PYPROJECT_FILE]:
+        config = _read_config(config_dir / config_name)
+        if config is not None:
+            return config, config_dir
+    return {}, config_dir
+
+
+def config_signature(config_dir: Path | None = None) -> tuple:
+    """Identifies the state of the configuration files, without reading them, so that
+    what is derived from the configuration can be cached by long-running processes.
+
+    :param config_dir: where to look for the configuration files. Defaults to the
+        current directory.
+    :return: the directory, with the size and modification time of each
+        configuration file (None for missing files).
+    """
+
+    config_dir = config_dir or Path.cwd()
+    signature: list[str | tuple[int, int] | None] = [str(config_dir)]
+    for config_name in [CONFIG_FILE, PYPROJECT_FILE]:
+        try:
+            stat = (config_dir / config_name).stat()
+            signature.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def configured_index_path(config_dir: Path | None = None) -> Path | None:
+    """:return: the path of the index to validate the JIRA IDs with, from the
+    ``MIRA_HOOKS_JIRA_INDEX`` environment variable, or else from ``jira-index`` in
+    the configuration of the repository. None if not configured."""
+
+    env_path = os.environ.get(JIRA_INDEX_ENV)
+    if env_path:
+        return Path(env_path).expanduser()
+    config, config_dir = load_hooks_config(config_dir)
+    index_path = config.get("jira-index")
+    if not index_path:
+        return None
+    return config_dir / Path(index_path).expanduser()
+
+
+def configured_rejected_statuses(config_dir: Path | None = None) -> set[str]:
+    """:return: the lower-cased statuses of the issues commits may not refer to,
+    from ``jira-rejected-statuses`` in the configuration of the repository."""
+
+    config, _ = load_hooks_config(config_dir)
+    statuses = config.get("jira-rejected-statuses", DEFAULT_REJECTED_STATUSES)
+    return {status.lower() for status in statuses}
@@ -0,0 +1,285 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Offline index of the JIRA issues, to validate the IDs cited in commit messages
+without any network access."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+from mirageoscience.hooks.hooks_config import (
+    configured_index_path,
+    configured_rejected_statuses,
+)
+
+
+INDEX_FORMAT_VERSION = 1
+
+# column names of a JIRA CSV export, lower-cased
+_KEY_COLUMNS = ("issue key", "key")
+_STATUS_COLUMNS = ("status",)
+_UPDATED_COLUMNS = ("updated",)
+
+_SCHEMA = """
+CREATE TABLE issues (
+    key TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    updated TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class IssueRecord(NamedTuple):
+    """An issue of the index."""
+
+    key: str
+    status: str
+    updated: str = ""
+
+
+class JiraIndex:
+    """Read-only access to an index of JIRA issues, stored as an SQLite file.
+
+    The issues are stored in a table clustered on their key, so that a lookup is a
+    single B-tree search in a file that stays in the OS cache: it takes a few
+    microseconds, once the index is open.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._connection = sqlite3.connect(
+            f"{path.absolute().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        try:
+            version = self._meta("version")
+        except sqlite3.DatabaseError as error:
+            self._connection.close()
+            raise ValueError(f"{path} is not a JIRA issue index") from error
+        if version != str(INDEX_FORMAT_VERSION):
+            self._connection.close()
+            raise ValueError(f"{path}: unsupported index format version {version}")
+
+    def _meta(self, name: str) -> str | None:
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    @property
+    def synced_at(self) -> str | None:
+        """When the index was last built or updated, as an ISO 8601 UTC timestamp."""
+        return self._meta("synced_at")
+
+    def lookup(self, key: str) -> IssueRecord | None:
+        """:return: the issue with the given key, or None if not in the index."""
+        row = self._connection.execute(
+            "SELECT key, status, updated FROM issues WHERE key = ?", (key,)
+        ).fetchone()
+        return IssueRecord(*row) if row else None
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> JiraIndex:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _column_index(header: list[str], names: tuple[str, ...], required: bool) -> int:
+    """:return: the index of the first column with any of the given names, or -1."""
+    lower_header = [name.strip().lower() for name in header]
+    for name in names:
+        if name in lower_header:
+            return lower_header.index(name)
+    if required:
+        raise ValueError(f"missing column {names[0]!r} in the CSV export")
+    return -1
+
+
+def read_csv_export(csv_path: Path) -> Iterator[IssueRecord]:
+    """Reads the issues from a CSV export of JIRA, with at least the ``Issue key``
+    and ``Status`` columns, and optionally ``Updated``.
+
+    :param csv_path: the CSV file.
+    :return: an iterator over the issues, as they are read.
+    """
+
+    with open(csv_path, encoding="utf-8-sig", newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        key_index = _column_index(header, _KEY_COLUMNS, True)
+        status_index = _column_index(header, _STATUS_COLUMNS, True)
+        updated_index = _column_index(header, _UPDATED_COLUMNS, False)
+        for row in reader:
+            if len(row) <= max(key_index, status_index) or not row[key_index]:
+                continue
+            updated = row[updated_index] if 0 <= updated_index < len(row) else ""
+            yield IssueRecord(
+                row[key_index].strip(), row[status_index].strip(), updated
+            )
+
+
+def _upsert(connection: sqlite3.Connection, records: Iterable[IssueRecord]) -> int:
+    """Inserts or replaces the given issues, and stamps the time of the sync.
+
+    :return: the number of issues written.
+    """
+
+    cursor = connection.executemany(
+        "INSERT OR REPLACE INTO issues (key, status, updated) VALUES (?, ?, ?)",
+        records,
+    )
+    connection.execute(
+        "INSERT OR REPLACE INTO meta (name, value) VALUES ('synced_at', ?)",
+        (datetime.now(timezone.utc).isoformat(timespec="seconds"),),
+    )
+    return cursor.rowcount
+
+
+def build_index(index_path: Path, records: Iterable[IssueRecord]) -> int:
+    """Builds a new index with the given issues, replacing the existing one, if any.
+
+    The index is written to a temporary file that then atomically replaces the
+    previous one, so that hooks running meanwhile always read a complete index.
+
+    :param index_path: the index file.
+    :param records: the issues.
+    :return: the number of issues written.
+    """
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(
+        dir=index_path.parent, prefix=f".{index_path.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        connection = sqlite3.connect(temp_name)
+        try:
+            with connection:
+                connection.executescript(_SCHEMA)
+                connection.execute(
+                    "INSERT INTO meta (name, value) VALUES ('version', ?)",
+                    (str(INDEX_FORMAT_VERSION),),
+                )
+                count = _upsert(connection, records)
+        finally:
+            connection.close()
+        os.replace(temp_name, index_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return count
+
+
+def update_index(index_path: Path, records: Iterable[IssueRecord]) -> int:
+    """Adds or updates the given issues in an existing index, in a single
+    transaction, e.g. from an export of the issues updated since the last sync.
+
+    :param index_path: the index file.
+    :param records: the new or updated issues.
+    :return: the number of issues written.
+    """
+
+    JiraIndex(index_path).close()  # validates the format
+    connection = sqlite3.connect(index_path)
+    try:
+        with connection:
+            return _upsert(connection, records)
+    finally:
+        connection.close()
+
+
+class IssueValidator:
+    """Validates JIRA IDs against an index, rejecting unknown issues and the issues
+    with some statuses (e.g. closed ones)."""
+
+    def __init__(self, index: JiraIndex, rejected_statuses: Iterable[str]):
+        self.index = index
+        self.rejected_statuses = {status.lower() for status in rejected_statuses}
+
+    def __call__(self, jira_id: str) -> str:
+        """:return: an error message if the issue is not valid, else empty string."""
+        record = self.index.lookup(jira_id)
+        if record is None:
+            return f"JIRA issue {jira_id} does not exist (index synced {self.index.synced_at})."
+        if record.status.lower() in self.rejected_statuses:
+            return f"JIRA issue {jira_id} is {record.status}."
+        return ""
+
+
+def configured_validator(config_dir: Path | None = None) -> IssueValidator | None:
+    """Opens the index configured for the repository, if any.
+
+    A configured index that cannot be opened is reported as a warning, and skipped:
+    not having synced the index must not prevent from committing.
+
+    :return: the validator for the configured index, or None.
+    """
+
+    index_path = configured_index_path(config_dir)
+    if index_path is None:
+        return None
+    try:
+        index = JiraIndex(index_path)
+    except (sqlite3.Error, ValueError) as error:
+        print(f"warning: JIRA issue index not used: {error}", file=sys.stderr)
+        return None
+    return IssueValidator(index, configured_rejected_statuses(config_dir))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build, update or query the offline index of the JIRA issues."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in [
+        ("build", "build a new index from CSV exports of JIRA"),
+        ("update", "add or update issues in an index from CSV exports of JIRA"),
+    ]:
+        subparser = subparsers.add_parser(command, help=help_text)
+        subparser.add_argument("index", type=Path, help="the index file")
+        subparser.add_argument(
+            "csv_files", type=Path, nargs="+", help="the CSV exports of JIRA"
+        )
+    lookup_parser = subparsers.add_parser("lookup", help="look up issues in an index")
+    lookup_parser.add_argument("index", type=Path, help="the index file")
+    lookup_parser.add_argument("keys", nargs="+", help="the issue keys")
+
+    args = parser.parse_args()
+    if args.command == "lookup":
+        found_all = True
+        with JiraIndex(args.index) as index:
+            for key in args.keys:
+                record = index.lookup(key)
+                found_all &= record is not None
+                print(f"{key}: {record.status if record else 'not found'}")
+        sys.exit(0 if found_all else 1)
+
+    records = (
+        record for csv_file in args.csv_files for record in read_csv_export(csv_file)
+    )
+    write_index = build_index if args.command == "build" else update_index
+    count = write_index(args.index, records)
+    print(f"{count} issue(s) written to {args.index}")
@@ -0,0 +1,258 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Registry of the regular expressions matching JIRA IDs and commit message prefixes,
+with the JIRA project keys read from the configuration of the repository.
+
+Branch names and commit subjects are not trusted input: they may be generated by
+bots, or pasted from logs. The hooks thus match them with anchored matchers that
+run in linear time by construction, whatever the regular expression engine. The
+regular expressions are kept as the specification of what the matchers find.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from mirageoscience.hooks.hooks_config import config_signature, load_hooks_config
+
+
+# single runs of a character class, which the regex engine matches in one pass
+_WORD_RUN = re.compile(r"\w*")
+_SPACE_RUN = re.compile(r"\s*")
+_DIGIT_RUN = re.compile(r"\d+")
+_WORD_CHAR = re.compile(r"\w")
+_SPACE_CHAR = re.compile(r"\s")
+
+
+def _run_end(run: re.Pattern[str], text: str, start: int = 0) -> int:
+    """:return: the end of the run of characters of the given pattern, such as
+    ``_SPACE_RUN``, from the given start in the text."""
+    match = run.match(text, start)
+    return match.end() if match else start
+
+
+DEFAULT_JIRA_PROJECT_KEYS = (
+    "GEOPY",
+    "GI",
+    "GA",
+    "GMS",
+    "VPem1D",
+    "VPem3D",
+    "VPmg",
+    "UBCGIF",
+    "LICMGR",
+    "DEVOPS",
+    "QA",
+)
+
+
+def load_project_keys(config_dir: Path | None = None) -> tuple[str, ...]:
+    """Reads the JIRA project keys from the configuration of the repository.
+
+    The configuration is read from ``.mira-hooks.toml`` if present, else from the
+    ``[tool.mira-hooks]`` table of ``pyproject.toml``. There, ``jira-project-keys``
+    replaces the default keys, while ``extra-jira-project-keys`` extends them.
+
+    :param config_dir: where to look for the configuration files. Defaults to the
+        current directory.
+    :return: the JIRA project keys, without duplicates.
+    """
+
+    config, _ = load_hooks_config(config_dir)
+
+    keys = [
+        *config.get("jira-project-keys", DEFAULT_JIRA_PROJECT_KEYS),
+        *config.get("extra-jira-project-keys", []),
+    ]
+    invalid_keys = [key for key in keys if not re.fullmatch(r"[A-Za-z]\w*", key)]
+    if invalid_keys:
+        raise ValueError(f"Invalid JIRA project keys: {', '.join(invalid_keys)}")
+    return tuple(dict.fromkeys(keys))
+
+
+def prefix_factored_pattern(words: tuple[str, ...] | list[str]) -> str:
+    """Builds a regular expression matching any of the given words, factored by
+    common prefixes as in a trie, so that the regex engine never tries the same
+    prefix twice: e.g. ``GA|GEOPY|GI`` becomes ``G(?:A|EOPY|I)``.
+
+    :param words: the literal words to match.
+    :return: the regular expression, as a string.
+    """
+
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_pattern(trie)
+
+
+def _trie_pattern(node: dict) -> str:
+    """:return: the regular expression matching the words of the given trie node."""
+    alternatives = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not alternatives:
+        return ""
+    if len(alternatives) == 1 and "" not in node:
+        return alternatives[0]
+    pattern = "(?:" + "|".join(alternatives) + ")"
+    return pattern + "?" if "" in node else pattern
+
+
+class MessagePatterns(NamedTuple):
+    """The compiled regular expressions for the commit messages and branch names."""
+
+    jira: re.Pattern[str]
+    """JIRA ID at the beginning of a text, possibly after a prefix such as `fixup!`."""
+
+    bang: re.Pattern[str]
+    """Standard commit message prefix, such as `fixup!` or `amend!`."""
+
+    rebasing: re.Pattern[str]
+    """Branch being rebased, in the current branch description of `git branch`."""
+
+    project_keys: frozenset[str] = frozenset()
+    """The JIRA project keys of the JIRA pattern."""
+
+    @property
+    def fingerprint(self) -> str:
+        """A short digest of the JIRA pattern, to invalidate what was cached with
+        other project keys."""
+        return f"{zlib.crc32(self.jira.pattern.encode()):08x}"
+
+    def jira_id(self, text: str) -> str:
+        """Finds the JIRA ID at the beginning of the text, as ``jira.match`` does,
+        in linear time.
+
+        The pattern allows a prefix such as ``fixup!``, then spaces, then a single
+        other character (e.g. a bracket) before the ID. That leaves at most four
+        places where the ID can start, tried in the order of the regex engine: only
+        the ID starting at each of them is looked up.
+
+        :param text: the text to search, such as a branch name or a commit subject.
+        :return: the JIRA ID, or an empty string if there is none.
+        """
+        starts = []
+        word_end = _run_end(_WORD_RUN, text)
+        if text.startswith("!", word_end):
+            starts.append(word_end + 1)
+        starts.append(0)
+        max_key_length = max(map(len, self.project_keys), default=0)
+        for start in starts:
+            space_end = _run_end(_SPACE_RUN, text, start)
+            # after the spaces, with or without the next character
+            for id_start in (space_end + 1, space_end):
+                if id_start > len(text):
+                    continue
+                # the key starts with a word character: a word boundary is before it
+                if id_start > 0 and _WORD_CHAR.match(text, id_start - 1):
+                    continue
+                # keys are word characters, so the first hyphen must end the key
+                key_end = text.find("-", id_start, id_start + max_key_length + 1)
+                if key_end < 0 or text[id_start:key_end] not in self.project_keys:
+                    continue
+                digits = _DIGIT_RUN.match(text, key_end + 1)
+                if digits:
+                    return text[id_start : digits.end()]
+        return ""
+
+    def prefix_bang(self, text: str) -> str:
+        """Finds the standard prefix at the beginning of the text, such as
+        ``fixup!``, as ``bang.match`` does, in linear time.
+
+        :param text: the text to search, such as a commit subject.
+        :return: the prefix with the space after it, or an empty string if none.
+        """
+        bang = _run_end(_WORD_RUN, text)
+        if text.startswith("!", bang) and _SPACE_CHAR.match(text, bang + 1):
+            return text[: bang + 2]
+        return ""
+
+    def rebased_branch(self, description: str) -> str | None:
+        """Finds the branch being rebased in the description of the current branch
+        by `git branch`, such as ``(no branch, rebasing GEOPY-1-branch)``, as
+        ``rebasing.match`` does, in linear time.
+
+        As with the greedy pattern, the last word of the first line that ends with,
+        or is followed by, a closing parenthesis wins. The words are joined by
+        single spaces, for the last parenthesis to tell which word it is.
+
+        :param description: the description of the current branch.
+        :return: the name of the branch, or None if not rebasing.
+        """
+        if not description.startswith("("):
+            return None
+        line_end = description.find("\n", 1)
+        line = description[1:] if line_end < 0 else description[1 : line_end + 1]
+        words = line.split()
+        # the words must follow a space, the one right after the parenthesis does not
+        if line and not line[0].isspace():
+            words = words[1:]
+        if line_end >= 0:
+            rest = description[line_end + 1 :]
+            next_words = rest.split(maxsplit=2)
+            # the space before a word may end the line
+            if rest and not rest[0].isspace():
+                words.append(next_words.pop(0))
+            # only a parenthesis starting the next word matters
+            if next_words:
+                words.append(next_words[0][0])
+
+        joined = " ".join(words)
+        parenthesis = joined.rfind(")")
+        if parenthesis <= 0:
+            return None
+        if joined[parenthesis - 1] == " ":
+            # a word followed by spaces then the parenthesis
+            word_end = parenthesis - 1
+        else:
+            # a word holding the parenthesis, after its first character
+            word_end = parenthesis
+        word_start = joined.rfind(" ", 0, word_end) + 1
+        return joined[word_start:word_end]
+
+
+def compile_patterns(project_keys: tuple[str, ...]) -> MessagePatterns:
+    """Compiles the message patterns for the given JIRA project keys.
+
+    :param project_keys: the JIRA project keys, made of word characters and starting
+        with a letter, as checked by :func:`load_project_keys`.
+    :return: the compiled patterns.
+    """
+
+    # with no key at all, the JIRA pattern never matches
+    keys_pattern = prefix_factored_pattern(project_keys) or "(?!)"
+    return MessagePatterns(
+        jira=re.compile(r"(?:\w*!)?\s*\S?\b((?:" + keys_pattern + r")-\d+)"),
+        bang=re.compile(r"(\w*!\s)"),
+        rebasing=re.compile(r"\(.*\s(\S+)\s*\)"),
+        project_keys=frozenset(project_keys),
+    )
+
+
+@lru_cache(maxsize=16)
+def _patterns_for_config(signature: tuple) -> MessagePatterns:
+    """:return: the message patterns for the configuration of the given signature."""
+    return compile_patterns(load_project_keys(Path(signature[0])))
+
+
+def message_patterns() -> MessagePatterns:
+    """:return: the message patterns for the JIRA project keys of the configuration
+    in the current directory, compiled once for as long as the configuration files
+    do not change."""
+    return _patterns_for_config(config_signature())
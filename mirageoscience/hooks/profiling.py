@@ -0,0 +1,182 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Opt-in timing of the phases of the hooks, and of each file they check.
+
+The hooks enable profiling with the ``MIRA_HOOKS_PROFILE`` environment variable, or
+with their ``--profile`` option, set to the file where to append the timed spans.
+With a ``.json`` extension, the file is a Chrome trace, to open with Perfetto or
+``chrome://tracing``. Otherwise, it holds a JSON object per span and per line.
+Several runs, even concurrent ones, append to the same file.
+
+When profiling is disabled, :func:`span` returns a shared no-op context manager:
+the instrumented code pays no more than a function call.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+
+class _DiscardedArgs(dict):
+    """Arguments of a span that is not recorded: whatever is set is ignored."""
+
+    def __setitem__(self, key, value) -> None:
+        pass
+
+
+_NO_SPAN = nullcontext(_DiscardedArgs())
+
+
+class Profiler:
+    """Records timed spans, then appends them to a file.
+
+    Spans may be recorded from several threads, each tagged with its thread ID.
+
+    Args:
+        path: the file to append the spans to, as a Chrome trace if its extension is
+            ``.json``, else as JSON lines.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.chrome_trace = path.suffix == ".json"
+        self._events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        # wall-clock time of the origin of the performance counter, in microseconds,
+        # for the spans of different processes to line up
+        self._origin_us = time.time_ns() / 1000 - time.perf_counter_ns() / 1000
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Times the enclosed block.
+
+        Args:
+            name: the name of the span.
+            args: details about the span, such as the file it is about.
+
+        Returns:
+            Iterator[dict]: the arguments of the span, where to add details that
+                are only known at the end of the block.
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            yield args
+        finally:
+            end_ns = time.perf_counter_ns()
+            event = {
+                "name": name,
+                "ts": round(self._origin_us + start_ns / 1000, 3),
+                "dur": round((end_ns - start_ns) / 1000, 3),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+            with self._lock:
+                self._events.append(event)
+
+    def write(self) -> None:
+        """Appends the recorded spans to the file, in a single write, then forgets
+        them. Failures to write are reported on stderr, but never fail the hook."""
+        import json  # pylint: disable=import-outside-toplevel
+
+        with self._lock:
+            events, self._events = self._events, []
+        if not events:
+            return
+
+        if self.chrome_trace:
+            process = {
+                "name": "process_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "args": {"name": Path(sys.argv[0]).name},
+            }
+            lines = [process] + [
+                {**event, "ph": "X", "cat": "hooks"} for event in events
+            ]
+        else:
+            lines = events
+        # the closing bracket of a Chrome trace is optional, so that it can be appended
+        content = "".join(
+            json.dumps(line, default=str) + (",\n" if self.chrome_trace else "\n")
+            for line in lines
+        )
+        try:
+            if self.chrome_trace:
+                try:
+                    with open(self.path, "x", encoding="utf-8") as file:
+                        file.write("[\n")
+                except FileExistsError:
+                    pass
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(content)
+        except OSError as error:
+            print(f"cannot write the profile to {self.path}: {error}", file=sys.stderr)
+
+
+# the profiler of the outermost block where profiling is enabled, if any
+_active_profilers: list[Profiler] = []
+
+
+def active_profiler() -> Profiler | None:
+    """:return: the profiler recording the spans, if profiling is enabled."""
+    return _active_profilers[0] if _active_profilers else None
+
+
+def span(name: str, **args: Any) -> AbstractContextManager[dict[str, Any]]:
+    """Times the enclosed block, if profiling is enabled.
+
+    Args:
+        name: the name of the span.
+        args: details about the span, such as the file it is about.
+
+    Returns:
+        AbstractContextManager[dict]: a context manager giving the arguments of the
+            span, where to add details that are only known at the end of the block.
+    """
+    if not _active_profilers:
+        return _NO_SPAN
+    return _active_profilers[0].span(name, **args)
+
+
+@contextmanager
+def profiling(path: Path | None) -> Iterator[Profiler | None]:
+    """Enables profiling for the enclosed block, if requested.
+
+    Within a block where profiling is already enabled, the spans go to the same
+    profiler, and are written when the outermost block ends.
+
+    Args:
+        path: the file to append the spans to, or None not to profile.
+
+    Returns:
+        Iterator[Profiler | None]: the profiler, or None if profiling is disabled.
+    """
+    if _active_profilers:
+        yield _active_profilers[0]
+        return
+    if path is None:
+        yield None
+        return
+
+    profiler = Profiler(path)
+    _active_profilers.append(profiler)
+    try:
+        yield profiler
+    finally:
+        _active_profilers.clear()
+        profiler.write()
@@ -0,0 +1,185 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Regular expression rules in the format of relint, checked along with the
+copyright statement."""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+
+# back-references are renumbered in a combined pattern: such rules stay apart
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class Rule(NamedTuple):
+    """A rule that files must follow: the given pattern must not be found in them.
+
+    Attributes:
+        name: the name of the rule, as reported.
+        pattern: the forbidden pattern, compiled in multi-line mode.
+        hint: how to fix a violation.
+        file_pattern: the pattern that the paths of the checked files match.
+        error: if False, violations are only warnings.
+    """
+
+    name: str
+    pattern: re.Pattern[str]
+    hint: str = ""
+    file_pattern: re.Pattern[str] = re.compile(".*")
+    error: bool = True
+
+
+class RuleMatch(NamedTuple):
+    """A violation of a rule in a file."""
+
+    rule: Rule
+    line: int
+    offset: int
+
+
+def _parse_rule(entry: Any) -> Rule:
+    """:return: the rule described by an entry of a relint configuration file."""
+    if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+        raise ValueError(f"invalid rule, expected a name and a pattern: {entry!r}")
+    name = entry["name"]
+    try:
+        return Rule(
+            name,
+            re.compile(str(entry["pattern"]), re.MULTILINE),
+            str(entry.get("hint") or ""),
+            re.compile(str(entry.get("filePattern", ".*"))),
+            bool(entry.get("error", True)),
+        )
+    except KeyError as error:
+        raise ValueError(f"rule {name!r} has no pattern") from error
+    except re.error as error:
+        raise ValueError(f"rule {name!r} has an invalid pattern: {error}") from error
+
+
+def load_rules(path: Path) -> list[Rule]:
+    """Loads the rules of a relint configuration file, such as ``.relint.yml``.
+
+    As with relint, the file is a YAML list of rules, or a stream of YAML documents
+    with a rule each. Rules have a ``name`` and a ``pattern``, and optionally a
+    ``hint``, a ``filePattern`` and an ``error`` flag.
+
+    Args:
+        path: the configuration file.
+
+    Returns:
+        list[Rule]: the rules, in the order of the file.
+
+    Raises:
+        ImportError: if PyYAML is not installed.
+        OSError: if the file cannot be read.
+        ValueError: if the file does not describe valid rules.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    with open(path, encoding="utf-8") as file:
+        try:
+            documents = list(yaml.safe_load_all(file))
+        except yaml.YAMLError as error:
+            raise ValueError(f"invalid YAML in {path}: {error}") from error
+
+    rules: list[Rule] = []
+    for document in documents:
+        if document is None:
+            continue
+        entries = document if isinstance(document, list) else [document]
+        rules.extend(_parse_rule(entry) for entry in entries)
+    return rules
+
+
+class RuleSet:
+    """Checks several rules in a single pass over the content of each file.
+
+    The patterns of the rules that apply to a file are combined into a single
+    alternation, searched once: content where it finds nothing, as in most files,
+    violates none of the rules. Only otherwise is each rule searched on its own, to
+    locate all of its matches.
+
+    Args:
+        rules: the rules to check.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = tuple(rules)
+        self._combined: dict[tuple[int, ...], re.Pattern[str] | None] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    @property
+    def fingerprint(self) -> str:
+        """A short digest of the rules, for cached verdicts to depend on them."""
+        description = repr(
+            [
+                (rule.pattern.pattern, rule.file_pattern.pattern, rule.error)
+                for rule in self.rules
+            ]
+        )
+        return f"{zlib.crc32(description.encode()):08x}"
+
+    def rules_for(self, file_path: Path) -> tuple[int, ...]:
+        """:return: the indices of the rules that apply to the given file."""
+        name = file_path.as_posix()
+        return tuple(
+            index
+            for index, rule in enumerate(self.rules)
+            if rule.file_pattern.match(name)
+        )
+
+    def _combined_pattern(self, indices: tuple[int, ...]) -> re.Pattern[str] | None:
+        """:return: the alternation of the patterns of the given rules, or None if
+        they cannot be combined."""
+        if indices not in self._combined:
+            patterns = [self.rules[index].pattern.pattern for index in indices]
+            combined = None
+            if not any(_BACKREFERENCE_RE.search(pattern) for pattern in patterns):
+                try:
+                    combined = re.compile(
+                        "|".join(f"(?:{pattern})" for pattern in patterns),
+                        re.MULTILINE,
+                    )
+                except re.error:
+                    # e.g. a same group name, or inline flags, in several patterns
+                    pass
+            self._combined[indices] = combined
+        return self._combined[indices]
+
+    def scan(self, text: str, indices: tuple[int, ...]) -> list[RuleMatch]:
+        """Searches the violations of the given rules in the text of a file.
+
+        Args:
+            text: the content of the file.
+            indices: the indices of the rules to check, from :meth:`rules_for`.
+
+        Returns:
+            list[RuleMatch]: the violations, by rule then by position.
+        """
+        if not indices:
+            return []
+        combined = self._combined_pattern(indices)
+        if combined is not None and combined.search(text) is None:
+            return []
+
+        violations = []
+        for index in indices:
+            rule = self.rules[index]
+            for match in rule.pattern.finditer(text):
+                line = text.count("\n", 0, match.start()) + 1
+                violations.append(RuleMatch(rule, line, match.start()))
+        return violations
@@ -0,0 +1,267 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+"""Machine-readable reports of the copyright check: JSON lines and SARIF.
+
+Both are written as the files are checked, one file at a time, for the reports of
+large trees to be processed while they are produced. JSON lines give a record per
+checked file, failed or not, with its metrics: what dashboards aggregate. SARIF
+gives a result per failure or violation, as code scanning tools expect.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+from mirageoscience.hooks import __version__
+from mirageoscience.hooks.copyright_scan import FileStatus
+
+
+if TYPE_CHECKING:
+    from mirageoscience.hooks.check_copyright import FileResult, ScanPolicy
+    from mirageoscience.hooks.regex_rules import RuleMatch
+
+
+RULES_FAILURE = "rules"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+_INFORMATION_URI = "https://github.com/MiraGeoscience/pre-commit-hooks"
+
+# SARIF rules of the copyright check, by status of the failed files
+_COPYRIGHT_RULES = {
+    FileStatus.MISSING: (
+        "copyright/missing",
+        "The file has no copyright statement at the top.",
+    ),
+    FileStatus.OUTDATED: (
+        "copyright/outdated",
+        "The copyright statement of the file is not for the current year.",
+    ),
+    FileStatus.BINARY: (
+        "copyright/binary",
+        "The file is binary, and cannot hold a copyright statement.",
+    ),
+    FileStatus.OVERSIZE: (
+        "copyright/oversize",
+        "The file is too large to be scanned.",
+    ),
+}
+
+
+def failure_kind(result: FileResult, policy: ScanPolicy) -> str | None:
+    """:return: what fails the check of the file: the status of its copyright
+    statement, or ``RULES_FAILURE`` if only violations of rules do; None if the file
+    passes."""
+    if policy.is_failure(result.path, result.status):
+        return result.status.value
+    return RULES_FAILURE if result.failed else None
+
+
+def _level(violation: RuleMatch) -> str:
+    return "error" if violation.rule.error else "warning"
+
+
+def json_record(result: FileResult, policy: ScanPolicy) -> dict[str, Any]:
+    """:return: the JSON record of the result of a file."""
+    return {
+        "path": result.path.as_posix(),
+        "status": result.status.value,
+        "failure": failure_kind(result, policy),
+        "year": result.year,
+        "line": result.line,
+        "offset": result.offset,
+        "bytes_read": result.bytes_read,
+        "scan_time": round(result.scan_time, 6),
+        "violations": [
+            {
+                "rule": violation.rule.name,
+                "level": _level(violation),
+                "line": violation.line,
+                "offset": violation.offset,
+            }
+            for violation in result.violations
+        ],
+    }
+
+
+def write_json_lines(
+    results: Iterable[FileResult], policy: ScanPolicy, stream: TextIO
+) -> bool:
+    """Writes the JSON record of each checked file, on a line of its own.
+
+    Args:
+        results: the results of the files, as yielded by `iter_check_results`.
+        policy: the policy the files were checked with.
+        stream: where to write the records.
+
+    Returns:
+        bool: True if no file failed the check.
+    """
+    all_valid = True
+    for result in results:
+        stream.write(json.dumps(json_record(result, policy)) + "\n")
+        all_valid = all_valid and not result.failed
+    return all_valid
+
+
+def _sarif_location(
+    path: Path, line: int | None, offset: int | None, offset_key: str
+) -> dict[str, Any]:
+    """:return: the SARIF location in the file, with its region if known."""
+    location: dict[str, Any] = {"artifactLocation": {"uri": path.as_posix()}}
+    if line is not None:
+        location["region"] = {"startLine": line, offset_key: offset}
+    return {"physicalLocation": location}
+
+
+def _sarif_metrics(result: FileResult) -> dict[str, Any]:
+    return {
+        "status": result.status.value,
+        "year": result.year,
+        "bytesRead": result.bytes_read,
+        "scanTime": round(result.scan_time, 6),
+    }
+
+
+def _sarif_message(result: FileResult) -> str:
+    if result.status == FileStatus.OUTDATED:
+        return f"Copyright statement for {result.year}, not the current year"
+    return _COPYRIGHT_RULES[result.status][1].rstrip(".")
+
+
+def sarif_results(result: FileResult, policy: ScanPolicy) -> list[dict[str, Any]]:
+    """:return: the SARIF results for the failure and the violations of a file."""
+    sarif = []
+    if policy.is_failure(result.path, result.status):
+        sarif.append(
+            {
+                "ruleId": _COPYRIGHT_RULES[result.status][0],
+                "level": "error",
+                "message": {"text": _sarif_message(result)},
+                "locations": [
+                    _sarif_location(
+                        result.path, result.line, result.offset, "byteOffset"
+                    )
+                ],
+                "properties": _sarif_metrics(result),
+            }
+        )
+    for violation in result.violations:
+        rule = violation.rule
+        sarif.append(
+            {
+                "ruleId": rule.name,
+                "level": _level(violation),
+                "message": {"text": rule.hint or rule.name},
+                "locations": [
+                    # violations are located in the decoded text
+                    _sarif_location(
+                        result.path, violation.line, violation.offset, "charOffset"
+                    )
+                ],
+                "properties": _sarif_metrics(result),
+            }
+        )
+    return sarif
+
+
+def _sarif_rules(policy: ScanPolicy) -> list[dict[str, Any]]:
+    """:return: the SARIF descriptions of the rules checked with the policy."""
+    rules: list[dict[str, Any]] = [
+        {
+            "id": rule_id,
+            "shortDescription": {"text": description},
+            "defaultConfiguration": {"level": "error"},
+        }
+        for rule_id, description in _COPYRIGHT_RULES.values()
+    ]
+    for rule in policy.rules.rules if policy.rules else ():
+        description = {
+            "id": rule.name,
+            "shortDescription": {"text": rule.name},
+            "defaultConfiguration": {"level": "error" if rule.error else "warning"},
+        }
+        if rule.hint:
+            description["help"] = {"text": rule.hint}
+        rules.append(description)
+    return rules
+
+
+def write_sarif(
+    results: Iterable[FileResult], policy: ScanPolicy, stream: TextIO
+) -> bool:
+    """Writes a SARIF 2.1.0 log of the failures and violations of the files.
+
+    The log is written as the files are checked: the results of each file are
+    appended to the ``results`` array, which is only closed at the end.
+
+    Args:
+        results: the results of the files, as yielded by `iter_check_results`.
+        policy: the policy the files were checked with.
+        stream: where to write the log.
+
+    Returns:
+        bool: True if no file failed the check.
+    """
+    log = {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "check_copyright",
+                        "version": __version__,
+                        "informationUri": _INFORMATION_URI,
+                        "rules": _sarif_rules(policy),
+                    }
+                },
+                # kept last, to be written one result at a time
+                "results": [],
+            }
+        ],
+    }
+    head, tail = json.dumps(log, indent=2).rsplit("[]", 1)
+    stream.write(head + "[")
+    separator = "\n"
+    all_valid = True
+    for result in results:
+        for sarif in sarif_results(result, policy):
+            stream.write(separator + json.dumps(sarif))
+            separator = ",\n"
+        all_valid = all_valid and not result.failed
+    stream.write("\n]" + tail + "\n")
+    return all_valid
+
+
+def write_report(
+    results: Iterable[FileResult],
+    report_format: str,
+    policy: ScanPolicy,
+    stream: TextIO,
+) -> bool:
+    """Writes the results of the files in the given machine-readable format.
+
+    Args:
+        results: the results of the files, as yielded by `iter_check_results`.
+        report_format: either "json", for JSON lines, or "sarif".
+        policy: the policy the files were checked with.
+        stream: where to write the report.
+
+    Returns:
+        bool: True if no file failed the check.
+    """
+    if report_format == "json":
+        return write_json_lines(results, policy, stream)
+    if report_format == "sarif":
+        return write_sarif(results, policy, stream)
+    raise ValueError(f"unknown report format: {report_format!r}")
@@ -0,0 +1,171 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Access to the content of the files staged in the git index."""
+
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+from collections import deque
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, BinaryIO, NamedTuple
+
+
+# symbolic links and submodules have no file content to check
+_SKIPPED_MODES = {b"120000", b"160000"}
+_DRAIN_CHUNK_SIZE = 1024 * 1024
+# blobs requested ahead of the one being read: few enough for their requests to
+# fit in the input pipe of git, which then never blocks this process
+_REQUESTS_AHEAD = 256
+
+
+class StagedBlob(NamedTuple):
+    """A blob from the git index, readable from the output of `git cat-file`."""
+
+    sha: str
+    size: int
+    stream: BinaryIO
+
+
+class _BlobStream(io.RawIOBase):
+    """Reads a single blob from the output of `git cat-file --batch`, never beyond
+    its end."""
+
+    def __init__(self, pipe: IO[bytes], size: int):
+        super().__init__()
+        self._pipe = pipe
+        self._remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._pipe.read(min(len(buffer), self._remaining))
+        self._remaining -= len(data)
+        buffer[: len(data)] = data
+        return len(data)
+
+    def drain(self) -> None:
+        """Skips what remains of the blob, and the line feed that follows it."""
+        while self._remaining > 0:
+            data = self._pipe.read(min(_DRAIN_CHUNK_SIZE, self._remaining))
+            if not data:
+                raise EOFError("unexpected end of git cat-file output")
+            self._remaining -= len(data)
+        self._pipe.read(1)
+
+
+def staged_blob_shas(files: Iterable[str | Path] | None = None) -> dict[Path, str]:
+    """Resolves the paths to the SHA of their blob in the git index, with a single
+    call to `git ls-files`.
+
+    The whole index is listed, without pathspecs: git would match each entry
+    against each of them, and a long list of files could exceed the limits of a
+    command line. Paths that are not in the index, symbolic links and submodules
+    are omitted.
+
+    :param files: the paths to resolve, or None for all the files of the index
+        under the current directory.
+    :return: the blob SHA for each staged path.
+    """
+    git_proc = subprocess.run(
+        ["git", "ls-files", "--stage", "-z"], stdout=subprocess.PIPE, check=True
+    )
+
+    blob_shas = {}
+    for entry in git_proc.stdout.split(b"\0"):
+        if not entry:
+            continue
+        info, path = entry.split(b"\t", 1)
+        mode, sha, _stage = info.split()
+        if mode not in _SKIPPED_MODES:
+            blob_shas[Path(os.fsdecode(path))] = sha.decode()
+    if files is None:
+        return blob_shas
+    return {Path(f): blob_shas[Path(f)] for f in files if Path(f) in blob_shas}
+
+
+def _read_blobs(
+    pipes: tuple[IO[bytes], IO[bytes]],
+    requests: list[str],
+    pending: deque[tuple[Path, str | None]],
+    keep: int,
+) -> Iterator[tuple[Path, StagedBlob | None]]:
+    """Sends the requests to `git cat-file --batch`, then reads the blobs of the
+    pending files, in order, until only the given number of them is left pending."""
+    requests_pipe, output = pipes
+    try:
+        requests_pipe.write("".join(requests).encode())
+        requests_pipe.flush()
+    except BrokenPipeError:
+        # git exited: the blobs show as missing
+        pass
+    requests.clear()
+    while len(pending) > keep:
+        f, sha = pending.popleft()
+        if sha is None:
+            yield f, None
+            continue
+
+        header = output.readline().split()
+        if len(header) != 3:
+            # the object is missing from the repository
+            yield f, None
+            continue
+
+        size = int(header[2])
+        stream = _BlobStream(output, size)
+        yield f, StagedBlob(sha, size, io.BufferedReader(stream))
+        stream.drain()
+
+
+def iter_staged_blobs(
+    file_paths: Iterable[Path],
+) -> Iterator[tuple[Path, StagedBlob | None]]:
+    """Iterates over the staged content of the given files, in order.
+
+    All the blobs are streamed by a single `git cat-file --batch` process. The files
+    are consumed lazily: the blobs are requested as the files arrive, a bounded
+    number of them ahead of the one being read, so that git does not wait for the
+    requests. The stream of a blob is only valid until the next item is requested.
+
+    :return: an iterator of the paths with their staged blob, or None for files that
+        are not staged.
+    """
+    blob_shas = staged_blob_shas()
+    if not blob_shas:
+        yield from ((f, None) for f in file_paths)
+        return
+
+    with subprocess.Popen(
+        ["git", "cat-file", "--batch"], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    ) as git_proc:
+        assert git_proc.stdin is not None and git_proc.stdout is not None
+        pipes = (git_proc.stdin, git_proc.stdout)
+        requests: list[str] = []
+        pending: deque[tuple[Path, str | None]] = deque()
+        completed = False
+        try:
+            for f in file_paths:
+                sha = blob_shas.get(f)
+                if sha is not None:
+                    requests.append(f"{sha}\n")
+                pending.append((f, sha))
+                if len(pending) >= _REQUESTS_AHEAD:
+                    yield from _read_blobs(
+                        pipes, requests, pending, _REQUESTS_AHEAD // 2
+                    )
+            yield from _read_blobs(pipes, requests, pending, 0)
+            completed = True
+        finally:
+            if not completed:
+                git_proc.kill()
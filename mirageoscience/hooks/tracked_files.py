@@ -0,0 +1,125 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Enumeration of the files tracked by git, filtered by globs and attributes."""
+
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+from collections.abc import Generator, Iterator
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+
+# files with any of these attribute values are not expected to hold a copyright
+EXCLUDING_ATTRIBUTES = {
+    "copyright": {"unset", "false"},
+    "linguist-generated": {"set", "true"},
+}
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def iter_nul_fields(stream: io.BufferedReader) -> Iterator[bytes]:
+    """Reads the NUL-terminated fields of the stream, as they arrive."""
+    remainder = b""
+    while chunk := stream.read1(_READ_CHUNK_SIZE):
+        fields = (remainder + chunk).split(b"\0")
+        remainder = fields.pop()
+        yield from fields
+
+
+def _matches_any(path: str, patterns: list[str]) -> bool:
+    return any(fnmatchcase(path, pattern) for pattern in patterns)
+
+
+def iter_tracked_files(
+    include: list[str] | None = None, exclude: list[str] | None = None
+) -> Generator[str, None, None]:
+    """Enumerates the files tracked by git, as they are listed.
+
+    `git ls-files -z` is piped straight into `git check-attr --stdin`, so that the
+    attributes are resolved in the same pass as the enumeration. Files are yielded
+    while git is still listing the next ones. Files with any of the
+    ``EXCLUDING_ATTRIBUTES`` (e.g. ``-copyright`` or ``linguist-generated`` in
+    ``.gitattributes``), and files missing from the working tree, are skipped.
+
+    Args:
+        include: glob patterns of the paths to keep. Keep all if None or empty.
+        exclude: glob patterns of the paths to skip.
+
+    Returns:
+        Generator[str, None, None]: the paths of the selected files, relative to the
+            current directory, to close for git to stop listing them.
+
+    Raises:
+        subprocess.CalledProcessError: once the listing is used up, if git failed to
+            list the files or their attributes.
+    """
+    include = include or []
+    exclude = exclude or []
+
+    with subprocess.Popen(
+        ["git", "ls-files", "-z"], stdout=subprocess.PIPE
+    ) as ls_files_proc:
+        with subprocess.Popen(
+            ["git", "check-attr", "--stdin", "-z", *EXCLUDING_ATTRIBUTES],
+            stdin=ls_files_proc.stdout,
+            stdout=subprocess.PIPE,
+        ) as check_attr_proc:
+            assert ls_files_proc.stdout is not None
+            assert isinstance(check_attr_proc.stdout, io.BufferedReader)
+            # only check-attr reads the listing now
+            ls_files_proc.stdout.close()
+
+            completed = False
+            try:
+                yield from _select_files(
+                    iter_nul_fields(check_attr_proc.stdout), include, exclude
+                )
+                completed = True
+            finally:
+                if not completed:
+                    check_attr_proc.kill()
+                    ls_files_proc.kill()
+    # e.g. not in a git repository: git already told why, but nothing was listed
+    for git_proc in (ls_files_proc, check_attr_proc):
+        if git_proc.returncode != 0:
+            raise subprocess.CalledProcessError(git_proc.returncode, git_proc.args)
+
+
+def _select_files(
+    fields: Iterator[bytes], include: list[str], exclude: list[str]
+) -> Iterator[str]:
+    """Selects the files from the output fields of `git check-attr -z`."""
+    excluded = False
+    for index, (path, attribute, value) in enumerate(
+        zip(fields, fields, fields, strict=False)
+    ):
+        if value.decode() in EXCLUDING_ATTRIBUTES[attribute.decode()]:
+            excluded = True
+        # the attributes of a path are listed in a row, in the requested order
+        if index % len(EXCLUDING_ATTRIBUTES) < len(EXCLUDING_ATTRIBUTES) - 1:
+            continue
+
+        name = os.fsdecode(path)
+        if not excluded and _is_selected(name, include, exclude):
+            yield name
+        excluded = False
+
+
+def _is_selected(name: str, include: list[str], exclude: list[str]) -> bool:
+    """Tells whether the file is selected by the globs, and present on disk."""
+    if include and not _matches_any(name, include):
+        return False
+    if _matches_any(name, exclude):
+        return False
+    # submodules are listed as directories, deleted files are still listed
+    return Path(name).is_file()
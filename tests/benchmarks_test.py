@@ -0,0 +1,148 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.hook_benchmarks import find_regressions, load_results, main
+from benchmarks.synthetic_repo import (
+    BRANCH_NAME,
+    SCALES,
+    RepoScale,
+    checkout_branch,
+    create_synthetic_repo,
+    end_rebase,
+    generate_source_files,
+    simulate_rebase,
+)
+from mirageoscience.hooks.check_copyright import iter_check_results
+from mirageoscience.hooks.git_message_hook import find_git_dir, get_branch_name
+
+
+# each placement with the status the copyright check reports for it
+PLACEMENT_STATUSES = {
+    "top": "valid",
+    "late": "valid",
+    "beyond": "missing",
+    "outdated": "outdated",
+    "missing": "missing",
+}
+
+
+def test_header_placements(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    shares = dict.fromkeys(PLACEMENT_STATUSES, 1.0)
+    names, placements = generate_source_files(tmp_path, 200, shares, seed=3)
+    assert set(placements) == set(PLACEMENT_STATUSES)
+    assert generate_source_files(tmp_path, 200, shares, seed=3) == (names, placements)
+
+    monkeypatch.chdir(tmp_path)
+    results = {
+        result.path.as_posix(): result.status for result in iter_check_results(names)
+    }
+    assert [results[name] for name in names] == [
+        PLACEMENT_STATUSES[placement] for placement in placements
+    ]
+
+
+def test_synthetic_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    scale = RepoScale(
+        files=20, branches=30, rebase_steps=8, huge_line_bytes=5000, readme_bytes=3000
+    )
+    repo = create_synthetic_repo(tmp_path / "repo", scale)
+    assert len(repo.source_files) == 20
+    assert (repo.root / repo.huge_line_file).stat().st_size == 5000
+    assert (repo.root / repo.huge_line_file).read_bytes().count(b"\n") == 0
+    readme = (repo.root / repo.readme).read_text(encoding="utf-8")
+    assert len(readme) >= 3000 - 100
+    assert "Copyright" in readme.splitlines()[-1]
+
+    monkeypatch.chdir(repo.root)
+    assert get_branch_name() == BRANCH_NAME
+    simulate_rebase(repo.root, scale.rebase_steps)
+    git_dir = find_git_dir()
+    assert git_dir is not None
+    assert (git_dir / "rebase-merge" / "msgnum").read_text(encoding="utf-8") == "4\n"
+    assert get_branch_name() == BRANCH_NAME
+    end_rebase(repo.root)
+    assert not (git_dir / "rebase-merge").exists()
+    # detached, on the same commit as all the branches
+    assert get_branch_name() is not None
+    checkout_branch(repo.root)
+    assert get_branch_name() == BRANCH_NAME
+
+
+def test_find_regressions():
+    baseline = {
+        "small": {
+            "steady": {"median": 0.100},
+            "slower": {"median": 0.100},
+            "noisy": {"median": 0.001},
+        }
+    }
+    results = {
+        "small": {
+            "steady": {"median": 0.110},
+            "slower": {"median": 0.200},
+            "noisy": {"median": 0.003},
+            "new": {"median": 1.0},
+        },
+        "medium": {"steady": {"median": 1.0}},
+    }
+    regressions = find_regressions(results, baseline, threshold=1.25, min_delta=0.005)
+    assert [(r.scale, r.name) for r in regressions] == [("small", "slower")]
+    assert regressions[0].ratio == pytest.approx(2.0)
+
+    regressions = find_regressions(results, baseline, threshold=1.25, min_delta=0)
+    assert [r.name for r in regressions] == ["slower", "noisy"]
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    output = tmp_path / "results.json"
+    workdir = tmp_path / "work"
+    args = ["--scale", "tiny", "--repeat", "1", "--workdir", str(workdir)]
+    assert main([*args, "--output", str(output)]) == 0
+    results = load_results(output)
+    assert results["environment"]["scales"]["tiny"] == SCALES["tiny"]._asdict()
+    timings = results["results"]["tiny"]
+    assert {
+        "check_files",
+        "check_files.full_scan_readme",
+        "get_branch_name.rebase",
+        "get_branch_name.detached",
+        "check_commit_message.branch",
+        "prepare_commit_msg.rebase",
+        "jira_id.spaces",
+        "rebased_branch.words",
+    } <= set(timings)
+    assert all(timing["runs"] == 1 for timing in timings.values())
+    assert "tiny check_files " in capsys.readouterr().out.replace("    ", "")
+
+    # the repository is reused, and left on its branch
+    marker = (workdir / "tiny.json").stat().st_mtime_ns
+    assert main([*args, "--baseline", str(output), "--min-delta", "10"]) == 0
+    assert (workdir / "tiny.json").stat().st_mtime_ns == marker
+    assert "no regression" in capsys.readouterr().out
+
+    for timing in timings.values():
+        timing["median"] = 1e-9
+    output.write_text(json.dumps(results), encoding="utf-8")
+    assert main([*args, "--baseline", str(output), "--min-delta", "0"]) == 1
+    assert "regression: tiny check_files " in capsys.readouterr().out
+
+
+def test_main_invalid_baseline(tmp_path: Path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text("{}", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        main(["--baseline", str(baseline)])
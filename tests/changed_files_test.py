@@ -0,0 +1,158 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks import changed_files
+from mirageoscience.hooks.changed_files import files_changed_in_year
+from mirageoscience.hooks.check_copyright import ScanPolicy, check_files
+from mirageoscience.hooks.check_copyright import main as check_copyright_main
+
+
+CURRENT_YEAR = date.today().year
+
+
+def _commit(message: str, year: int):
+    commit_date = f"{year}-06-15T12:00:00"
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_DATE": commit_date,
+        "GIT_COMMITTER_DATE": commit_date,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    subprocess.run(["git", "add", "."], check=True)
+    subprocess.run(["git", "commit", "-q", "-m", message], check=True, env=env)
+
+
+@pytest.fixture
+def dated_repo(git_repo: Path) -> Path:
+    """:return: a repository with files committed two years ago: one not changed
+    since, one committed again this year, and one with uncommitted changes."""
+    for name in ["old.py", "recent.py", "modified.py"]:
+        (git_repo / name).write_text(
+            f"# Copyright (c) {CURRENT_YEAR - 2}\n", encoding="utf-8"
+        )
+    _commit("old commit", CURRENT_YEAR - 2)
+    (git_repo / "recent.py").write_text(
+        f"# Copyright (c) {CURRENT_YEAR - 1}\n", encoding="utf-8"
+    )
+    _commit("recent commit", CURRENT_YEAR)
+    (git_repo / "modified.py").write_text(
+        f"# Copyright (c) {CURRENT_YEAR - 1}\n", encoding="utf-8"
+    )
+    return git_repo
+
+
+def test_files_changed_in_year(dated_repo: Path):
+    assert files_changed_in_year(CURRENT_YEAR) == {
+        Path("recent.py"),
+        Path("modified.py"),
+    }
+    assert files_changed_in_year(CURRENT_YEAR - 2) == {
+        Path("old.py"),
+        Path("recent.py"),
+        Path("modified.py"),
+    }
+
+
+def test_files_changed_in_year_is_cached(dated_repo: Path):
+    files_changed_in_year(CURRENT_YEAR)
+    assert (
+        dated_repo / ".git" / "mira-hooks" / f"changed-files-{CURRENT_YEAR}.json"
+    ).is_file()
+    with mock.patch.object(
+        changed_files, "_committed_this_year", side_effect=AssertionError
+    ):
+        assert Path("recent.py") in files_changed_in_year(CURRENT_YEAR)
+
+    # a new commit invalidates the cache
+    (dated_repo / "old.py").write_text("# changed\n", encoding="utf-8")
+    _commit("new commit", CURRENT_YEAR)
+    assert Path("old.py") in files_changed_in_year(CURRENT_YEAR)
+
+
+def test_files_changed_in_year_from_sub_directory(dated_repo: Path, monkeypatch):
+    (dated_repo / "sub").mkdir()
+    (dated_repo / "sub" / "a.py").write_text("content\n", encoding="utf-8")
+    _commit("sub commit", CURRENT_YEAR)
+
+    monkeypatch.chdir(dated_repo / "sub")
+    assert files_changed_in_year(CURRENT_YEAR) == {Path("a.py")}
+    monkeypatch.chdir(dated_repo)
+    assert files_changed_in_year(CURRENT_YEAR) == {
+        Path("recent.py"),
+        Path("modified.py"),
+        Path("sub/a.py"),
+    }
+
+
+def test_files_changed_without_commit(git_repo: Path):
+    (git_repo / "new.py").write_text("content\n", encoding="utf-8")
+    assert files_changed_in_year(CURRENT_YEAR) == {Path("new.py")}
+
+
+def test_check_files_with_current_year_for_changed(dated_repo: Path, capsys):
+    files = ["old.py", "recent.py", "modified.py"]
+    assert not check_files(files)
+    assert len(capsys.readouterr().err.splitlines()) == 3
+
+    policy = ScanPolicy(current_year_files=files_changed_in_year(CURRENT_YEAR))
+    assert not check_files(files, policy=policy)
+    assert capsys.readouterr().err.splitlines() == [
+        "recent.py: No copyright or invalid year",
+        "modified.py: No copyright or invalid year",
+    ]
+
+    # older files still need a copyright statement
+    (dated_repo / "old.py").write_text("# no statement\n", encoding="utf-8")
+    assert not check_files(["old.py"], policy=policy)
+
+
+def test_fix_with_current_year_for_changed(dated_repo: Path):
+    test_args = ["script_name", "old.py", "recent.py", "--fix"]
+    with mock.patch.object(sys, "argv", [*test_args, "--current-year-for", "changed"]):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 1
+    # the outdated statement of a file unchanged this year is accepted as it is
+    assert (dated_repo / "old.py").read_text(encoding="utf-8") == (
+        f"# Copyright (c) {CURRENT_YEAR - 2}\n"
+    )
+    assert (dated_repo / "recent.py").read_text(encoding="utf-8") == (
+        f"# Copyright (c) {CURRENT_YEAR - 1}-{CURRENT_YEAR}\n"
+    )
+
+
+def test_current_year_for_changed_out_of_git_repo(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test_file.py").write_text("# nothing\n", encoding="utf-8")
+    with pytest.raises(subprocess.CalledProcessError):
+        files_changed_in_year(CURRENT_YEAR)
+
+    test_args = ["script_name", "test_file.py", "--current-year-for", "changed"]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 2
+    assert "--current-year-for changed requires a git repository" in (
+        capsys.readouterr().err
+    )
@@ -1,5 +1,5 @@
 # '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
-#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#  Copyright (c) 2025-2026 Mira Geoscience Ltd.                                     '
 #                                                                                   '
 #  This file is part of mirageoscience.pre-commit-hooks package.                    '
 #                                                                                   '
@@ -9,6 +9,8 @@
 
 from __future__ import annotations
 
+import io
+import mmap
 import sys
 from datetime import date
 from pathlib import Path
@@ -16,8 +18,25 @@ from unittest import mock
 
 import pytest
 
-from mirageoscience.hooks.check_copyright import _FULL_SCAN_FILE_NAMES, check_files
+from mirageoscience.hooks.check_copyright import (
+    _FULL_SCAN_FILE_NAMES,
+    FileResult,
+    ScanPolicy,
+    check_files,
+    iter_check_results,
+    iter_file_list,
+)
 from mirageoscience.hooks.check_copyright import main as check_copyright_main
+from mirageoscience.hooks.copyright_cache import CopyrightCache
+from mirageoscience.hooks.copyright_scan import (
+    MAX_TOP_BYTES,
+    MAX_TOP_LINES,
+    FileStatus,
+    ScanResult,
+    dated_copyright_pattern,
+    scan_file,
+    scan_file_result,
+)
 
 
 def test_valid_copyright(tmp_path: Path):
@@ -42,6 +61,31 @@ def test_missing_copyright(tmp_path: Path):
     assert not check_files([str(test_file)])
 
 
+@pytest.mark.parametrize("full_scan", [True, False])
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("Copyright (c) {year}", FileStatus.VALID),
+        ("Copyright (c) 2020-{year}", FileStatus.VALID),
+        ("Copyright (c) 2020", FileStatus.OUTDATED),
+        ("No statement", FileStatus.MISSING),
+    ],
+)
+def test_scan_file_status(
+    tmp_path: Path, statement: str, expected: FileStatus, full_scan: bool
+):
+    current_year = date.today().year
+    test_file = tmp_path / "test_file.py"
+    test_file.write_text(
+        f"# Copyright (c) 2019\n# {statement.format(year=current_year)}\n",
+        encoding="utf-8",
+    )
+    copyright_re = dated_copyright_pattern(current_year)
+    if expected == FileStatus.MISSING:
+        test_file.write_text(f"# {statement}\n", encoding="utf-8")
+    assert scan_file(test_file, copyright_re, full_scan) == expected
+
+
 @pytest.mark.parametrize("year_is_current", [True, False])
 def test_full_scan_custom_files(tmp_path: Path, year_is_current: bool):
     statement_year = date.today().year
@@ -57,6 +101,53 @@ def test_full_scan_custom_files(tmp_path: Path, year_is_current: bool):
     assert year_is_current == check_files(test_files, full_scan_files=file_names)
 
 
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_full_scan_large_file(tmp_path: Path, use_mmap: bool):
+    current_year = date.today().year
+    file_name = "package.rst"
+    test_file = tmp_path / file_name
+    # statement straddling the boundary of the chunks when streamed
+    filler = "x" * (1024 * 1024 - 10)
+    test_file.write_text(f"{filler} Copyright (c) {current_year}\n", encoding="utf-8")
+
+    if use_mmap:
+        assert check_files([str(test_file)], full_scan_files=[file_name])
+        return
+
+    with mock.patch(
+        "mirageoscience.hooks.copyright_scan.mmap.mmap", side_effect=OSError
+    ) as mock_mmap:
+        assert check_files([str(test_file)], full_scan_files=[file_name])
+        mock_mmap.assert_called_once()
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_full_scan_line_far_down(tmp_path: Path, use_mmap: bool):
+    current_year = date.today().year
+    test_file = tmp_path / "package.rst"
+    # several chunks of lines before the statement
+    lines = ["filler line"] * 300_000 + [f"Copyright (c) {current_year}"]
+    test_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    copyright_re = dated_copyright_pattern(current_year)
+    if use_mmap:
+        result = scan_file_result(test_file, copyright_re, full_scan=True)
+    else:
+        with mock.patch(
+            "mirageoscience.hooks.copyright_scan.mmap.mmap", side_effect=OSError
+        ):
+            result = scan_file_result(test_file, copyright_re, full_scan=True)
+    assert result.status == FileStatus.VALID
+    assert result.line == len(lines)
+
+
+def test_full_scan_empty_file(tmp_path: Path):
+    file_name = "README.rst"
+    test_file = tmp_path / file_name
+    test_file.write_bytes(b"")
+    assert not check_files([str(test_file)], full_scan_files=[file_name])
+
+
 def test_copyright_not_found_further_down(tmp_path: Path):
     current_year = date.today().year
     file_content = "\n Not Here" * 100 + f"# Copyright (c) {current_year}\n"
@@ -66,6 +157,101 @@ def test_copyright_not_found_further_down(tmp_path: Path):
     assert not check_files([str(test_file)])
 
 
+def test_copyright_on_last_top_line(tmp_path: Path):
+    current_year = date.today().year
+    file_content = "\n" * (MAX_TOP_LINES - 2) + f"# Copyright (c) {current_year}\n"
+    test_file = tmp_path / "test_last_line.py"
+    test_file.write_text(file_content, encoding="utf-8")
+    assert check_files([str(test_file)])
+
+    test_file.write_text("\n" + file_content, encoding="utf-8")
+    assert not check_files([str(test_file)])
+
+
+def test_copyright_beyond_top_bytes(tmp_path: Path):
+    current_year = date.today().year
+    test_file = tmp_path / "test_long_line.js"
+    test_file.write_text(
+        f"// Copyright (c) {current_year}\n" + "x" * 10 * MAX_TOP_BYTES,
+        encoding="utf-8",
+    )
+    assert check_files([str(test_file)])
+
+    test_file.write_text(
+        "x" * MAX_TOP_BYTES + f"// Copyright (c) {current_year}\n", encoding="utf-8"
+    )
+    assert not check_files([str(test_file)])
+
+
+def test_copyright_in_non_utf8_file(tmp_path: Path):
+    current_year = date.today().year
+    test_file = tmp_path / "test_latin1.py"
+    test_file.write_bytes(f"# \xe9\n# Copyright (c) {current_year}\n".encode("latin-1"))
+    assert check_files([str(test_file)])
+
+
+@pytest.mark.parametrize("report_unscannable", [True, False])
+def test_binary_file(tmp_path: Path, capsys, report_unscannable: bool):
+    test_file = tmp_path / "test_binary.py"
+    test_file.write_bytes(b"\x89PNG\r\n\x1a\n\0\0\0\rIHDR\xff\xfe")
+    policy = ScanPolicy(report_unscannable=report_unscannable)
+    assert check_files([str(test_file)], policy=policy) != report_unscannable
+    assert ("Binary file" in capsys.readouterr().err) == report_unscannable
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-32", "utf-8-sig"])
+def test_copyright_with_bom(tmp_path: Path, encoding: str):
+    current_year = date.today().year
+    test_file = tmp_path / "test_bom.py"
+    test_file.write_text(f"# Copyright (c) {current_year}\n", encoding=encoding)
+    assert check_files([str(test_file)])
+
+    test_file.write_text(f"# Copyright (c) {current_year - 1}\n", encoding=encoding)
+    assert not check_files([str(test_file)])
+
+
+def test_full_scan_with_bom(tmp_path: Path):
+    current_year = date.today().year
+    file_name = "README.rst"
+    test_file = tmp_path / file_name
+    file_content = "\n Not Here" * 2000 + f"# Copyright (c) {current_year}\n"
+    test_file.write_text(file_content, encoding="utf-16")
+    assert check_files([str(test_file)], full_scan_files=[file_name])
+
+
+@pytest.mark.parametrize("report_unscannable", [True, False])
+def test_oversize_file(tmp_path: Path, capsys, report_unscannable: bool):
+    current_year = date.today().year
+    test_file = tmp_path / "test_large.py"
+    test_file.write_text(f"# Copyright (c) {current_year}\n" * 10, encoding="utf-8")
+    policy = ScanPolicy(max_file_size=100, report_unscannable=report_unscannable)
+    with mock.patch("mirageoscience.hooks.check_copyright.open") as mock_open:
+        assert check_files([str(test_file)], policy=policy) != report_unscannable
+        mock_open.assert_not_called()
+    assert ("too large" in capsys.readouterr().err) == report_unscannable
+
+    policy = ScanPolicy(max_file_size=1000, report_unscannable=report_unscannable)
+    assert check_files([str(test_file)], policy=policy)
+
+
+def test_main_with_unscannable_policy():
+    test_args = [
+        "script_name",
+        "file1.py",
+        "--max-file-size",
+        "1024",
+        "--unscannable",
+        "report",
+    ]
+    with mock.patch.object(sys, "argv", test_args):
+        with mock.patch(
+            "mirageoscience.hooks.check_copyright.check_files"
+        ) as mock_check_files:
+            mock_check_files.return_value = True
+            check_copyright_main()
+            assert mock_check_files.call_args.kwargs["policy"] == ScanPolicy(1024, True)
+
+
 @pytest.mark.parametrize("outdated_file_position", [0, 1, 2])
 def test_multiple_good_files(tmp_path: Path, outdated_file_position: int):
     current_year = date.today().year
@@ -96,6 +282,10 @@ def test_main_passes_args_to_check_files():
             mock_check_files.assert_called_once_with(
                 ["file1.py", "file2.py"],
                 ["README.rst", "README-dev.rst", "package.rst"],
+                jobs=1,
+                cache=None,
+                policy=ScanPolicy(),
+                staged=False,
             )
 
 
@@ -125,5 +315,239 @@ def test_main_with_full_scan_files():
             mock_check_files.return_value = True
             check_copyright_main()
             mock_check_files.assert_called_once_with(
-                ["file1.py"], [*_FULL_SCAN_FILE_NAMES, "full_file1.py", "full_file2.py"]
+                ["file1.py"],
+                [*_FULL_SCAN_FILE_NAMES, "full_file1.py", "full_file2.py"],
+                jobs=1,
+                cache=None,
+                policy=ScanPolicy(),
+                staged=False,
             )
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_parallel_report_order(tmp_path: Path, capsys, jobs: int):
+    current_year = date.today().year
+    test_files = []
+    for i in range(20):
+        year = current_year if i % 3 else current_year - 1
+        test_file = tmp_path / f"test_{i}.py"
+        test_file.write_text(f"# Copyright (c) {year}\n", encoding="utf-8")
+        test_files.append(str(test_file))
+
+    assert not check_files(test_files, jobs=jobs)
+    reported = [
+        line.split(":")[0] for line in capsys.readouterr().err.splitlines() if line
+    ]
+    assert reported == [f for i, f in enumerate(test_files) if i % 3 == 0]
+
+
+@pytest.mark.parametrize(("value", "expected"), [("auto", None), ("3", 3)])
+def test_main_with_jobs(value: str, expected: int | None):
+    test_args = ["script_name", "file1.py", "--jobs", value]
+    with mock.patch.object(sys, "argv", test_args):
+        with mock.patch(
+            "mirageoscience.hooks.check_copyright.check_files"
+        ) as mock_check_files:
+            mock_check_files.return_value = True
+            check_copyright_main()
+            jobs = mock_check_files.call_args.kwargs["jobs"]
+            assert jobs >= 1
+            if expected is not None:
+                assert jobs == expected
+
+
+def test_main_with_invalid_jobs():
+    test_args = ["script_name", "file1.py", "--jobs", "0"]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 2
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_main_with_invalid_cache_size(value: str, capsys):
+    test_args = ["script_name", "file1.py", "--cache-size", value]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 2
+    assert "--cache-size: expected a positive integer" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("separator", [b"\n", b"\r\n", b"\0"])
+def test_iter_file_list(separator: bytes):
+    names = [f"dir {i}/file_{i}.py" for i in range(10_000)]
+    content = separator.join(name.encode() for name in names) + separator * 2
+    stream = io.BytesIO(content)
+    file_list = iter_file_list(stream, b"\0" if separator == b"\0" else b"\n")
+    assert next(file_list) == names[0]
+    # the stream is consumed by chunks, not at once
+    assert stream.tell() < len(content)
+    assert [names[0], *file_list] == names
+
+
+def test_files_are_consumed_lazily(tmp_path: Path, capsys):
+    current_year = date.today().year
+    test_file = tmp_path / "test_outdated.py"
+    test_file.write_text(f"# Copyright (c) {current_year - 1}\n", encoding="utf-8")
+
+    def files():
+        yield str(test_file)
+        # the first failure is reported before the next file is even requested
+        assert "test_outdated.py" in capsys.readouterr().err
+        yield str(test_file)
+
+    assert not check_files(files())
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+@pytest.mark.parametrize("full_scan", [True, False])
+def test_iter_check_results(tmp_path: Path, full_scan: bool, use_mmap: bool):
+    current_year = date.today().year
+    valid_file = tmp_path / "valid.py"
+    valid_file.write_text(
+        f"#!/bin/sh\n\n# Copyright (c) 2020-{current_year}\n", "utf-8"
+    )
+    outdated_file = tmp_path / "outdated.py"
+    outdated_file.write_text("# Copyright (c) 2019\n", encoding="utf-8")
+    missing_file = tmp_path / "missing.py"
+    missing_file.write_text("# nothing\n", encoding="utf-8")
+    # statement straddling the boundary of the chunks when streamed
+    filler = "x" * (1024 * 1024 - 10)
+    large_file = tmp_path / "large.py"
+    large_file.write_text(f"\n\n{filler} Copyright (c) {current_year}\n", "utf-8")
+
+    files = [str(f) for f in (valid_file, outdated_file, missing_file, large_file)]
+    full_scan_files = [large_file.name] if full_scan else []
+    with mock.patch(
+        "mirageoscience.hooks.copyright_scan.mmap.mmap",
+        side_effect=mmap.mmap if use_mmap else OSError,
+    ):
+        results = list(iter_check_results(files, full_scan_files))
+
+    assert all(result.scan_time > 0 for result in results)
+    results = [result._replace(scan_time=0.0) for result in results]
+    sizes = [Path(f).stat().st_size for f in files]
+    assert results[:3] == [
+        FileResult(
+            valid_file, FileStatus.VALID, current_year, 3, 13, [], False, sizes[0]
+        ),
+        FileResult(outdated_file, FileStatus.OUTDATED, 2019, 1, 2, [], True, sizes[1]),
+        FileResult(missing_file, FileStatus.MISSING, None, None, None, [], True, 10),
+    ]
+    if full_scan:
+        assert results[3][:7] == (
+            large_file,
+            FileStatus.VALID,
+            current_year,
+            3,
+            len(filler) + 3,
+            [],
+            False,
+        )
+        # mapped, the search stops at the statement, else it reads by chunks
+        assert results[3].bytes_read == (sizes[3] - 1 if use_mmap else sizes[3])
+    else:
+        assert results[3].status == FileStatus.MISSING
+        assert results[3].bytes_read == MAX_TOP_BYTES
+
+
+def test_cached_results_keep_location(tmp_path: Path):
+    current_year = date.today().year
+    test_file = tmp_path / "test_file.py"
+    test_file.write_text(f"\n# Copyright (c) {current_year - 1}\n", "utf-8")
+    cache_path = tmp_path / "cache.json"
+    first = list(iter_check_results([str(test_file)], cache=CopyrightCache(cache_path)))
+    with mock.patch(
+        "mirageoscience.hooks.copyright_scan.scan_file_result"
+    ) as mock_scan:
+        second = list(
+            iter_check_results([str(test_file)], cache=CopyrightCache(cache_path))
+        )
+        mock_scan.assert_not_called()
+    assert first[0][:7] == second[0][:7]
+    assert (first[0].bytes_read, second[0].bytes_read) == (test_file.stat().st_size, 0)
+    assert second[0].year == current_year - 1
+    assert (second[0].line, second[0].offset) == (2, 3)
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        ScanResult(FileStatus.VALID, 2024, 3, 120),
+        ScanResult(FileStatus.MISSING),
+        ScanResult(FileStatus.BINARY),
+    ],
+)
+def test_scan_result_verdict(result: ScanResult):
+    assert ScanResult.from_verdict(result.verdict) == result
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_fail_fast(tmp_path: Path, capsys, jobs: int):
+    current_year = date.today().year
+    good_file = tmp_path / "good.py"
+    good_file.write_text(f"# Copyright (c) {current_year}\n", encoding="utf-8")
+    bad_file = tmp_path / "bad.py"
+    bad_file.write_text(f"# Copyright (c) {current_year - 1}\n", encoding="utf-8")
+    requested = []
+
+    def files():
+        for i in range(100):
+            requested.append(i)
+            yield str(bad_file if i == 2 else good_file)
+
+    with mock.patch(
+        "mirageoscience.hooks.copyright_scan.scan_file_result",
+        wraps=scan_file_result,
+    ) as mock_scan:
+        assert not check_files(files(), jobs=jobs, policy=ScanPolicy(fail_fast=True))
+    assert capsys.readouterr().err == f"{bad_file}: No copyright or invalid year\n"
+    # no further file is requested than the ones in flight
+    assert len(requested) <= 3 + jobs * 4
+    assert mock_scan.call_count <= len(requested)
+    if jobs == 1:
+        assert len(requested) == mock_scan.call_count == 3
+
+
+def test_main_with_fail_fast():
+    test_args = ["script_name", "file1.py", "--fail-fast"]
+    with mock.patch.object(sys, "argv", test_args):
+        with mock.patch(
+            "mirageoscience.hooks.check_copyright.check_files"
+        ) as mock_check_files:
+            mock_check_files.return_value = True
+            check_copyright_main()
+            assert mock_check_files.call_args.kwargs["policy"] == ScanPolicy(
+                fail_fast=True
+            )
+
+
+@pytest.mark.parametrize("null", [True, False])
+def test_main_with_files_from(tmp_path: Path, null: bool):
+    separator = "\0" if null else "\n"
+    file_list = tmp_path / "file_list.txt"
+    file_list.write_text(separator.join(["file2.py", "file3.py"]), encoding="utf-8")
+    test_args = ["script_name", "file1.py", "--files-from", str(file_list)]
+    if null:
+        test_args.append("-z")
+    checked_files = []
+
+    def fake_check_files(files, *_args, **_kwargs):
+        checked_files.extend(files)
+        return True
+
+    with mock.patch.object(sys, "argv", test_args):
+        with mock.patch(
+            "mirageoscience.hooks.check_copyright.check_files",
+            side_effect=fake_check_files,
+        ):
+            check_copyright_main()
+    assert checked_files == ["file1.py", "file2.py", "file3.py"]
+
+
+def test_main_without_files():
+    with mock.patch.object(sys, "argv", ["script_name"]):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 2
@@ -0,0 +1,121 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from mirageoscience.hooks import commit_message
+from mirageoscience.hooks.commit_message import (
+    SCISSORS_LINE,
+    parse_commit_message,
+    parse_subject_line,
+    patch_range,
+)
+
+
+def test_parse_commit_message():
+    content = (
+        b"# Please enter the commit message\n"
+        b"\n"
+        b"fixup! GEOPY-123: Fix a bug\n"
+        b"\n"
+        b"Some details\n"
+        b"on two lines\n"
+        b"# a comment in the body\n"
+        b"\n"
+        b"Signed-off-by: Someone <someone@example.com>\n"
+        b"Co-authored-by: Other\n"
+        b"  <other@example.com>\n"
+        b"\n"
+        b"# Changes to be committed:\n"
+        b"#\tmodified: file.py\n"
+    )
+    message = parse_commit_message(io.BytesIO(content))
+    assert content[message.first_line_start : message.first_line_end] == b"\n"
+    assert (
+        content[message.subject_start : message.subject_end]
+        == b"fixup! GEOPY-123: Fix a bug\n"
+    )
+    assert message.prefix_bang == "fixup! "
+    assert message.subject == "GEOPY-123: Fix a bug"
+    assert message.jira_id == "GEOPY-123"
+    assert content[message.body_start : message.body_end].startswith(b"Some details")
+    assert content[message.body_start : message.body_end].endswith(b"example.com>\n")
+    assert message.trailers == [
+        ("Signed-off-by", "Someone <someone@example.com>"),
+        ("Co-authored-by", "Other <other@example.com>"),
+    ]
+    assert [content[start:end] for start, end in message.comments] == [
+        b"# Please enter the commit message\n",
+        b"# a comment in the body\n",
+        b"# Changes to be committed:\n#\tmodified: file.py\n",
+    ]
+
+
+def test_parse_commit_message_without_trailers():
+    message = parse_commit_message(
+        io.BytesIO(b"Subject line\n\nKey: value\nnot a trailer\n")
+    )
+    assert not message.trailers
+    assert message.jira_id == ""
+
+
+def test_parse_commit_message_stops_at_scissors():
+    content = b"GEOPY-1: subject\n" + SCISSORS_LINE + b"\ndiff --git a/x b/x\nbody?\n"
+    message = parse_commit_message(io.BytesIO(content))
+    assert message.body_start is None
+    assert message.comments == [(17, len(content))]
+
+
+def test_parse_commit_message_subject_only():
+    stream = io.BytesIO(b"# comment\nGEOPY-1: subject\n\nbody\n")
+    message = parse_commit_message(stream, subject_only=True)
+    assert message.subject == "GEOPY-1: subject"
+    assert message.body_start is None
+    assert stream.tell() < len(stream.getvalue())
+
+
+def test_parse_empty_commit_message():
+    message = parse_commit_message(io.BytesIO(b"# only\n# comments\n"))
+    assert message.first_line_start is None
+    assert not message.has_subject
+    assert message.comments == [(0, 18)]
+
+
+def test_parse_subject_line():
+    message = parse_subject_line("  amend! [GI-12] Some change  ")
+    assert message.prefix_bang == "amend! "
+    assert message.subject == "[GI-12] Some change"
+    assert message.jira_id == "GI-12"
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "replacement"),
+    [
+        (3, 5, b"longer replacement"),
+        (3, 20, b"short"),
+        (0, 0, b"inserted"),
+        (10, 10, b""),
+        (90, 100, b"at the end"),
+    ],
+)
+def test_patch_range(tmp_path: Path, monkeypatch, start, end, replacement):
+    # small chunks, to shift the rest of the file in several steps
+    monkeypatch.setattr(commit_message, "_SHIFT_CHUNK_SIZE", 7)
+    content = bytes(range(100))
+    file_path = tmp_path / "message"
+    file_path.write_bytes(content)
+    with open(file_path, "r+b") as file:
+        patch_range(file, start, end, replacement)
+    assert file_path.read_bytes() == content[:start] + replacement + content[end:]
@@ -0,0 +1,44 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from mirageoscience.hooks.jira_index import IssueRecord, build_index
+
+
+# stand-in for a snapshot of the JIRA issues
+JIRA_ISSUES = [
+    IssueRecord("GEOPY-123", "In Progress", "2026-01-02T10:00:00"),
+    IssueRecord("GEOPY-456", "Closed", "2025-12-01T10:00:00"),
+    IssueRecord("DEVOPS-7", "To Do", "2026-03-04T10:00:00"),
+]
+
+
+@pytest.fixture
+def jira_index_path(tmp_path: Path) -> Path:
+    """:return: the path to an index of the ``JIRA_ISSUES``."""
+    index_path = tmp_path / "jira-index.sqlite"
+    build_index(index_path, JIRA_ISSUES)
+    return index_path
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, monkeypatch) -> Path:
+    """:return: an empty git repository on the ``main`` branch, made the current
+    directory, whatever the repository of the hook running the tests."""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
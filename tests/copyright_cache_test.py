@@ -0,0 +1,127 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import subprocess
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from mirageoscience.hooks.check_copyright import check_files
+from mirageoscience.hooks.copyright_cache import (
+    CopyrightCache,
+    git_blob_sha,
+    shared_cache,
+)
+
+
+def test_git_blob_sha_matches_git(tmp_path: Path):
+    test_file = tmp_path / "some_file.txt"
+    test_file.write_bytes(b"some content\n" * 1000)
+    git_proc = subprocess.run(
+        ["git", "hash-object", str(test_file)],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    assert git_blob_sha(test_file) == git_proc.stdout.strip()
+
+
+def test_cached_verdicts_are_reused(tmp_path: Path):
+    current_year = date.today().year
+    test_file = tmp_path / "test_file.py"
+    test_file.write_text(f"# Copyright (c) {current_year}\n", encoding="utf-8")
+    cache_path = tmp_path / "cache" / "copyright.json"
+
+    assert check_files([str(test_file)], cache=CopyrightCache(cache_path))
+    assert cache_path.is_file()
+
+    with mock.patch(
+        "mirageoscience.hooks.copyright_scan.scan_file_result"
+    ) as mock_scan:
+        assert check_files([str(test_file)], cache=CopyrightCache(cache_path))
+        mock_scan.assert_not_called()
+
+
+def test_cache_is_keyed_by_content(tmp_path: Path):
+    current_year = date.today().year
+    test_file = tmp_path / "test_file.py"
+    test_file.write_text(f"# Copyright (c) {current_year}\n", encoding="utf-8")
+    cache_path = tmp_path / "copyright.json"
+    assert check_files([str(test_file)], cache=CopyrightCache(cache_path))
+
+    test_file.write_text(f"# Copyright (c) {current_year - 1}\n", encoding="utf-8")
+    assert not check_files([str(test_file)], cache=CopyrightCache(cache_path))
+
+    # same content under another path: no need to scan, even without a stat signature
+    other_file = tmp_path / "other_file.py"
+    other_file.write_bytes(test_file.read_bytes())
+    with mock.patch(
+        "mirageoscience.hooks.copyright_scan.scan_file_result"
+    ) as mock_scan:
+        assert not check_files([str(other_file)], cache=CopyrightCache(cache_path))
+        mock_scan.assert_not_called()
+
+
+def test_cache_invalidated_by_parameters(tmp_path: Path):
+    cache_path = tmp_path / "copyright.json"
+    cache = CopyrightCache(cache_path)
+    cache.load({"year": 2024})
+    cache.put("some_key", "valid")
+    cache.save()
+
+    cache = CopyrightCache(cache_path)
+    cache.load({"year": 2024})
+    assert cache.get("some_key") == "valid"
+
+    cache.load({"year": 2025})
+    assert cache.get("some_key") is None
+
+
+def test_cache_eviction(tmp_path: Path):
+    cache = CopyrightCache(tmp_path / "copyright.json", max_entries=2)
+    cache.load({})
+    cache.put("first", "valid")
+    cache.put("second", "invalid")
+    assert cache.get("first") == "valid"
+    cache.put("third", "valid")
+    assert cache.get("second") is None
+    assert cache.get("first") == "valid"
+    assert cache.get("third") == "valid"
+
+
+def test_unreadable_cache_is_ignored(tmp_path: Path):
+    cache_path = tmp_path / "copyright.json"
+    cache_path.write_text("not json", encoding="utf-8")
+    cache = CopyrightCache(cache_path)
+    cache.load({})
+    assert cache.get("anything") is None
+
+
+def test_shared_cache_stays_warm(tmp_path: Path):
+    cache_path = tmp_path / "copyright.json"
+    cache = shared_cache(cache_path)
+    assert shared_cache(cache_path) is cache
+    cache.load({"year": 1})
+    cache.put("key", "valid")
+    cache.save()
+
+    # reloaded without reading the unchanged file
+    with mock.patch("json.load", side_effect=AssertionError):
+        cache.load({"year": 1})
+    assert cache.get("key") == "valid"
+
+    # changed by another process: read again
+    other = CopyrightCache(cache_path)
+    other.load({"year": 1})
+    other.put("other", "valid")
+    other.save()
+    cache.load({"year": 1})
+    assert cache.get("other") == "valid"
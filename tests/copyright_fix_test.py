@@ -0,0 +1,123 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks.check_copyright import check_files
+from mirageoscience.hooks.check_copyright import main as check_copyright_main
+from mirageoscience.hooks.copyright_fix import FixOutcome, fix_file, fix_files
+
+
+CURRENT_YEAR = date.today().year
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("Copyright (c) 2020", f"Copyright (c) 2020-{CURRENT_YEAR}"),
+        ("copyright (C) 2020-2022", f"copyright (C) 2020-{CURRENT_YEAR}"),
+        (
+            f"Copyright (c) {CURRENT_YEAR - 1}",
+            f"Copyright (c) {CURRENT_YEAR - 1}-{CURRENT_YEAR}",
+        ),
+    ],
+)
+def test_fix_outdated_year(tmp_path: Path, statement: str, expected: str):
+    test_file = tmp_path / "test_file.py"
+    body = "print('hello')\n" * 1000
+    test_file.write_text(f"# {statement} Someone\n{body}", encoding="utf-8")
+    test_file.chmod(0o755)
+
+    assert fix_file(test_file, False, CURRENT_YEAR) == FixOutcome.FIXED
+    assert test_file.read_text(encoding="utf-8") == f"# {expected} Someone\n{body}"
+    assert test_file.stat().st_mode & 0o777 == 0o755
+    assert fix_file(test_file, False, CURRENT_YEAR) == FixOutcome.UNCHANGED
+
+
+def test_fix_keeps_framed_header_aligned(tmp_path: Path):
+    test_file = tmp_path / "test_file.py"
+    line = "#  Copyright (c) 2020 Mira Geoscience Ltd.".ljust(60) + "'\n"
+    test_file.write_text("# " + "'" * 58 + "\n" + line, encoding="utf-8")
+
+    assert fix_file(test_file, False, CURRENT_YEAR) == FixOutcome.FIXED
+    fixed_line = test_file.read_text(encoding="utf-8").splitlines()[1]
+    assert fixed_line.startswith(f"#  Copyright (c) 2020-{CURRENT_YEAR} Mira")
+    assert len(fixed_line) == len(line) - 1
+
+
+def test_fix_full_scan_file(tmp_path: Path):
+    test_file = tmp_path / "README.rst"
+    test_file.write_text(
+        "Not here\n" * 100 + "Copyright (c) 2020 Someone\n", encoding="utf-8"
+    )
+    assert fix_file(test_file, False, CURRENT_YEAR) == FixOutcome.UNFIXABLE
+    assert fix_file(test_file, True, CURRENT_YEAR) == FixOutcome.FIXED
+    assert check_files([str(test_file)], full_scan_files=["README.rst"])
+
+
+def test_fix_inserts_header(tmp_path: Path):
+    test_file = tmp_path / "test_file.py"
+    test_file.write_text("#!/usr/bin/env python\nprint('hello')\n", encoding="utf-8")
+    assert fix_file(test_file, False, CURRENT_YEAR) == FixOutcome.UNFIXABLE
+
+    template = b"# Copyright (c) {year} Someone"
+    assert fix_file(test_file, False, CURRENT_YEAR, template) == FixOutcome.FIXED
+    assert test_file.read_text(encoding="utf-8") == (
+        f"#!/usr/bin/env python\n# Copyright (c) {CURRENT_YEAR} Someone\nprint('hello')\n"
+    )
+
+
+def test_fix_skips_binary_files(tmp_path: Path):
+    test_file = tmp_path / "test_file.bin"
+    test_file.write_bytes(b"\0\1\2 Copyright (c) 2020")
+    assert fix_file(test_file, False, CURRENT_YEAR) == FixOutcome.SKIPPED
+    assert test_file.read_bytes() == b"\0\1\2 Copyright (c) 2020"
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_fix_files(tmp_path: Path, capsys, jobs: int):
+    test_files = []
+    for i in range(10):
+        test_file = tmp_path / f"test_{i}.py"
+        year = CURRENT_YEAR if i % 2 else 2020
+        test_file.write_text(f"# Copyright (c) {year}\n", encoding="utf-8")
+        test_files.append(str(test_file))
+
+    assert not fix_files(test_files, jobs=jobs)
+    reported = capsys.readouterr().err.splitlines()
+    assert reported == [f"Fixing {f}" for f in test_files[::2]]
+    assert check_files(test_files)
+    assert fix_files(test_files, jobs=jobs)
+
+
+def test_main_with_fix(tmp_path: Path):
+    test_file = tmp_path / "test_file.py"
+    test_file.write_text("print('hello')\n", encoding="utf-8")
+    header_file = tmp_path / "header.txt"
+    header_file.write_text("# Copyright (c) {year} Someone\n", encoding="utf-8")
+
+    test_args = [
+        "script_name",
+        str(test_file),
+        "--fix",
+        "--fix-header",
+        str(header_file),
+    ]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 1
+    assert check_files([str(test_file)])
@@ -0,0 +1,234 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import io
+import os
+import struct
+import sys
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks import copyright_watch
+from mirageoscience.hooks.check_copyright import (
+    FileResult,
+    ScanPolicy,
+    iter_check_results,
+)
+from mirageoscience.hooks.check_copyright import main as check_copyright_main
+from mirageoscience.hooks.copyright_scan import FileStatus
+from mirageoscience.hooks.copyright_watch import HeaderIndex, Inotify, watch
+
+
+CURRENT_YEAR = date.today().year
+
+
+class _NextYear(date):
+    @classmethod
+    def today(cls):
+        return date(CURRENT_YEAR + 1, 1, 1)
+
+
+def _write(file_path: Path, content: str) -> None:
+    # a distinct modification time, even on file systems with a coarse resolution
+    mtime_ns = file_path.stat().st_mtime_ns if file_path.exists() else 0
+    file_path.write_text(content, encoding="utf-8")
+    os.utime(file_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+
+def _index(files: list[Path], policy: ScanPolicy | None = None) -> HeaderIndex:
+    def check(checked_files: list[str], policy: ScanPolicy):
+        return iter_check_results(checked_files, policy=policy)
+
+    return HeaderIndex(
+        [str(f) for f in files], check, lambda _year: policy or ScanPolicy()
+    )
+
+
+def _statuses(changes) -> list[tuple[str, str | None, str | None]]:
+    return [
+        (
+            change.path.name,
+            change.previous.status.value if change.previous else None,
+            change.current.status.value if change.current else None,
+        )
+        for change in changes
+    ]
+
+
+@pytest.fixture(name="files")
+def files_fixture(tmp_path: Path) -> list[Path]:
+    valid = tmp_path / "valid.py"
+    valid.write_text(f"# Copyright (c) {CURRENT_YEAR}\n", encoding="utf-8")
+    missing = tmp_path / "missing.py"
+    missing.write_text("# nothing\n", encoding="utf-8")
+    return [valid, missing]
+
+
+def test_index_checks_changed_files_only(files: list[Path]):
+    valid, missing = files
+    index = _index(files)
+    assert _statuses(index.build()) == [
+        ("valid.py", None, "valid"),
+        ("missing.py", None, "missing"),
+    ]
+    assert len(index) == 2
+
+    with mock.patch.object(index, "check", wraps=index.check) as mock_check:
+        assert not index.refresh()
+        mock_check.assert_called_once_with([], index.policy)
+
+        _write(valid, "# Copyright (c) 2019\n")
+        _write(missing, "# nothing, still\n")
+        assert _statuses(index.refresh()) == [("valid.py", "valid", "outdated")]
+        assert mock_check.call_args.args[0] == [str(valid), str(missing)]
+
+        # only the given candidates are checked
+        _write(missing, f"# Copyright (c) {CURRENT_YEAR}\n")
+        assert not index.refresh([valid])
+        assert _statuses(index.refresh([missing])) == [
+            ("missing.py", "missing", "valid")
+        ]
+
+    valid.unlink()
+    assert _statuses(index.refresh()) == [("valid.py", "outdated", None)]
+    assert index.result(valid) is None
+    _write(valid, f"# Copyright (c) {CURRENT_YEAR}\n")
+    assert _statuses(index.refresh()) == [("valid.py", None, "valid")]
+
+
+def test_index_new_year(files: list[Path]):
+    index = _index(files)
+    index.build()
+    with (
+        mock.patch.object(copyright_watch, "date", _NextYear),
+        mock.patch("mirageoscience.hooks.check_copyright.date", _NextYear),
+    ):
+        assert _statuses(index.refresh()) == [("valid.py", "valid", "outdated")]
+        assert index.year == CURRENT_YEAR + 1
+        assert not index.refresh()
+
+
+def test_index_changed_files_need_current_year(tmp_path: Path):
+    outdated = tmp_path / "outdated.py"
+    outdated.write_text("# Copyright (c) 2019\n", encoding="utf-8")
+    index = _index([outdated], ScanPolicy(current_year_files=set()))
+    index.build()
+    result = index.result(outdated)
+    assert result is not None and not result.failed
+
+    # once changed, as about to be committed this year
+    _write(outdated, "# Copyright (c) 2019\n# changed\n")
+    index.refresh()
+    result = index.result(outdated)
+    assert result is not None and result.failed
+    # until the index is rebuilt, as for a new year
+    index.build()
+    result = index.result(outdated)
+    assert result is not None and not result.failed
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+def test_inotify(tmp_path: Path):
+    watched = tmp_path / "watched.py"
+    with Inotify([tmp_path]) as inotify:
+        assert inotify.read(0) == set()
+        watched.write_text("content\n", encoding="utf-8")
+        assert inotify.read(1.0) == {watched}
+        (tmp_path / "temp").write_text("content\n", encoding="utf-8")
+        (tmp_path / "temp").rename(watched)
+        assert inotify.read(1.0) == {tmp_path / "temp", watched}
+
+        # events were lost: any file may have changed
+        overflow = struct.pack("iIII", -1, 0x4000, 0, 0)
+        event = struct.pack("iIII", 1, 0x8, 0, 16) + b"watched.py".ljust(16, b"\0")
+        assert inotify._parse(event + overflow, set()) is None  # pylint: disable=protected-access
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+def test_inotify_error(tmp_path: Path):
+    with pytest.raises(OSError):
+        Inotify([tmp_path / "missing"])
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watch(files: list[Path], capsys, use_inotify: bool):
+    valid, missing = files
+    output = io.StringIO()
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=watch,
+        args=(_index(files), output),
+        kwargs={"poll_interval": 0.05, "use_inotify": use_inotify, "stop": stop},
+    )
+    thread.start()
+    try:
+        assert _wait_for(lambda: "watching" in capsys.readouterr().err)
+        assert output.getvalue() == f"{missing}: missing, failed\n"
+        _write(valid, "# Copyright (c) 2019\n")
+        assert _wait_for(lambda: "outdated" in output.getvalue())
+    finally:
+        stop.set()
+        thread.join()
+    assert output.getvalue().splitlines()[1] == f"{valid}: valid -> outdated, failed"
+
+
+def test_watch_falls_back_to_polling(files: list[Path], capsys):
+    stop = threading.Event()
+    stop.set()
+    with mock.patch.object(copyright_watch, "Inotify", side_effect=OSError):
+        watch(_index(files), io.StringIO(), stop=stop)
+    assert "(polling)" in capsys.readouterr().err
+
+
+def test_seconds_to_new_year():
+    now = datetime(2025, 12, 31, 23, 59, 30)
+    assert copyright_watch._seconds_to_new_year(now) == 30  # pylint: disable=protected-access
+
+
+def test_main_with_watch(tmp_path: Path):
+    test_file = tmp_path / "test.py"
+    test_file.write_text(f"# Copyright (c) {CURRENT_YEAR - 1}\n", encoding="utf-8")
+    test_args = ["script_name", str(test_file), "--watch", "--current-year-for", "all"]
+    with mock.patch.object(sys, "argv", test_args):
+        with mock.patch("mirageoscience.hooks.copyright_watch.watch") as mock_watch:
+            check_copyright_main()
+    index = mock_watch.call_args.args[0]
+    assert isinstance(index, HeaderIndex)
+    index.build()
+    result = index.result(test_file)
+    assert isinstance(result, FileResult)
+    assert result.status == FileStatus.OUTDATED and result.failed
+
+
+@pytest.mark.parametrize(
+    "option", ["--fix", "--staged", "--fail-fast", "--format=json"]
+)
+def test_main_with_watch_and_conflicting_option(option: str):
+    test_args = ["script_name", "file1.py", "--watch", option]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 2
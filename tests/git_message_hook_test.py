@@ -1,5 +1,5 @@
 # '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
-#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                     '
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                     '
 #                                                                                   '
 #  This file is part of mirageoscience.pre-commit-hooks package.                    '
 #                                                                                   '
@@ -9,6 +9,8 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
 import sys
 from pathlib import Path
 from unittest import mock
@@ -16,17 +18,32 @@ from unittest import mock
 import pytest
 
 from mirageoscience.hooks.git_message_hook import (
+    BRANCH_CACHE_FILE,
     check_commit_message,
+    check_commit_range,
+    check_message_subject,
+    find_git_dir,
+    get_branch_jira_id,
+    get_branch_name,
     get_jira_id,
     get_message_prefix_bang,
+    iter_commit_subjects,
+    prepare_commit_msg,
+    pushed_revisions,
+    read_branch_name,
 )
 from mirageoscience.hooks.git_message_hook import (
     main as git_message_hook_main,
 )
+from mirageoscience.hooks.jira_index import IssueValidator, JiraIndex
 
 
 @pytest.fixture
-def mock_get_branch_name(mocker):
+def mock_get_branch_name(mocker, tmp_path: Path, monkeypatch):
+    # out of any repository, for the branch not to be cached
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+
     def _mock_get_branch_name(branch_name):
         mocker.patch(
             "mirageoscience.hooks.git_message_hook.get_branch_name",
@@ -119,6 +136,352 @@ def test_check_commit_message_invalid_short_message(
     assert error_message.startswith("First line of commit message must be at least")
 
 
+@pytest.mark.parametrize(
+    ("message_content", "expected_content"),
+    [
+        ("Fix a bug\n\nSome details\n", "[GEOPY-123] Fix a bug\n\nSome details\n"),
+        ("fixup! Fix a bug", "fixup! [GEOPY-123] Fix a bug\n"),
+        ("GEOPY-123: Fix a bug\n", "GEOPY-123: Fix a bug\n"),
+        ("GI-456: Fix a bug\n", "GI-456: Fix a bug\n"),
+        (
+            "# comment\n  Fix a bug  \n# another\nbody\n",
+            "# comment\n[GEOPY-123] Fix a bug\n# another\nbody\n",
+        ),
+        # the first non-comment line is patched, even if blank
+        ("\nFix a bug\n", "[GEOPY-123] \nFix a bug\n"),
+        ("# only comments\n", "[GEOPY-123]\n# only comments\n"),
+        ("", "[GEOPY-123]\n"),
+    ],
+)
+def test_prepare_commit_msg(
+    mock_get_branch_name, tmp_path: Path, message_content, expected_content
+):
+    mock_get_branch_name("GEOPY-123_fix_bug")
+    filepath = tmp_path / "test_commit_message.txt"
+    filepath.write_bytes(message_content.encode())
+
+    prepare_commit_msg(str(filepath))
+    assert filepath.read_bytes().decode() == expected_content
+
+
+def test_prepare_commit_msg_without_branch_jira_id(mock_get_branch_name, tmp_path):
+    mock_get_branch_name("feature_branch")
+    filepath = tmp_path / "test_commit_message.txt"
+    filepath.write_text("Fix a bug\n", encoding="utf-8")
+
+    prepare_commit_msg(str(filepath))
+    prepare_commit_msg(str(filepath), "commit")
+    assert filepath.read_text(encoding="utf-8") == "Fix a bug\n"
+
+
+def test_prepare_commit_msg_of_amended_commit(mock_get_branch_name, tmp_path):
+    mock_get_branch_name("GEOPY-123_fix_bug")
+    filepath = tmp_path / "test_commit_message.txt"
+    filepath.write_text("Fix a bug\n", encoding="utf-8")
+
+    prepare_commit_msg(str(filepath), "commit")
+    assert filepath.read_text(encoding="utf-8") == "Fix a bug\n"
+
+
+@pytest.fixture
+def git_dir(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+    dot_git = tmp_path / ".git"
+    dot_git.mkdir()
+    (dot_git / "HEAD").write_text(
+        "ref: refs/heads/GEOPY-123_branch\n", encoding="utf-8"
+    )
+    return dot_git
+
+
+def test_find_git_dir(git_dir: Path):
+    sub_dir = git_dir.parent / "some" / "sub_dir"
+    sub_dir.mkdir(parents=True)
+    assert find_git_dir() == git_dir
+    assert find_git_dir(sub_dir) == git_dir
+
+
+def test_find_git_dir_from_env(git_dir: Path, monkeypatch):
+    monkeypatch.setenv("GIT_DIR", "elsewhere/.git")
+    assert find_git_dir() == git_dir.parent / "elsewhere" / ".git"
+
+
+def test_find_git_dir_of_worktree(git_dir: Path):
+    worktree_git_dir = git_dir / "worktrees" / "other"
+    worktree_git_dir.mkdir(parents=True)
+    (worktree_git_dir / "HEAD").write_text(
+        "ref: refs/heads/GI-456_other\n", encoding="utf-8"
+    )
+    worktree = git_dir.parent / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text(
+        "gitdir: ../.git/worktrees/other\n", encoding="utf-8"
+    )
+    found_git_dir = find_git_dir(worktree)
+    assert found_git_dir is not None
+    assert found_git_dir.resolve() == worktree_git_dir.resolve()
+    assert read_branch_name(found_git_dir) == "GI-456_other"
+
+
+def test_read_branch_name(git_dir: Path):
+    assert read_branch_name(git_dir) == "GEOPY-123_branch"
+
+    (git_dir / "HEAD").write_text("ref: refs/heads/feature/GI-1\n", encoding="utf-8")
+    assert read_branch_name(git_dir) == "feature/GI-1"
+
+
+@pytest.mark.parametrize("rebase_dir", ["rebase-merge", "rebase-apply"])
+def test_read_branch_name_while_rebasing(git_dir: Path, rebase_dir: str):
+    (git_dir / "HEAD").write_text("0123456789abcdef\n", encoding="utf-8")
+    assert read_branch_name(git_dir) is None
+
+    (git_dir / rebase_dir).mkdir()
+    (git_dir / rebase_dir / "head-name").write_text(
+        "refs/heads/GEOPY-456_rebased\n", encoding="utf-8"
+    )
+    assert read_branch_name(git_dir) == "GEOPY-456_rebased"
+
+
+def test_get_branch_name_without_git(git_dir: Path):
+    with mock.patch("subprocess.run") as mock_run:
+        assert get_branch_name() == "GEOPY-123_branch"
+        mock_run.assert_not_called()
+
+
+def test_get_branch_name_detached(git_dir: Path):
+    (git_dir / "HEAD").write_text("0123456789abcdef\n", encoding="utf-8")
+    git_output = "  GEOPY-123_branch\n* (HEAD detached at 0123456)\n"
+    with mock.patch(
+        "subprocess.run",
+        return_value=mock.Mock(returncode=0, stdout=git_output),
+    ) as mock_run:
+        assert get_branch_name() == "0123456"
+        mock_run.assert_called_once()
+
+
+def test_branch_jira_id_is_cached(git_dir: Path):
+    with mock.patch(
+        "mirageoscience.hooks.git_message_hook.get_branch_name",
+        wraps=get_branch_name,
+    ) as mock_branch_name:
+        assert get_branch_jira_id() == "GEOPY-123"
+        assert get_branch_jira_id() == "GEOPY-123"
+        mock_branch_name.assert_called_once()
+        assert (git_dir / BRANCH_CACHE_FILE).is_file()
+
+        # moving to another branch invalidates the cache
+        (git_dir / "HEAD").write_text(
+            "ref: refs/heads/GI-456_other\n", encoding="utf-8"
+        )
+        assert get_branch_jira_id() == "GI-456"
+        assert mock_branch_name.call_count == 2
+
+
+def test_branch_jira_id_shared_across_rebase_steps(git_dir: Path):
+    (git_dir / "rebase-merge").mkdir()
+    (git_dir / "rebase-merge" / "head-name").write_text(
+        "refs/heads/GEOPY-456_rebased\n", encoding="utf-8"
+    )
+    assert get_branch_jira_id() == "GEOPY-456"
+    with mock.patch(
+        "mirageoscience.hooks.git_message_hook.get_branch_name"
+    ) as mock_branch_name:
+        for step in range(3):
+            (git_dir / "HEAD").write_text(f"{step:040d}\n", encoding="utf-8")
+            assert get_branch_jira_id() == "GEOPY-456"
+        mock_branch_name.assert_not_called()
+
+
+def test_check_message_subject():
+    assert check_message_subject("GEOPY-123: long enough message", "") == (True, "")
+    assert check_message_subject("fixup! GEOPY-123: long enough", "GEOPY-123")[0]
+    assert check_message_subject("Merge branch 'main' into x", "")[0]
+    assert not check_message_subject("fixup! Merge branch 'main'", "")[0]
+    assert not check_message_subject("GI-1: long enough message", "GEOPY-123")[0]
+    assert not check_message_subject("GEOPY-123: short", "")[0]
+
+
+def test_check_message_subject_with_issue_index(jira_index_path: Path):
+    with JiraIndex(jira_index_path) as index:
+        validate = IssueValidator(index, ["Closed"])
+        assert check_message_subject("GEOPY-123: long enough", "", validate)[0]
+        assert check_message_subject("long enough message", "GEOPY-123", validate)[0]
+        is_valid, error_message = check_message_subject(
+            "GEOPY-999: long enough", "", validate
+        )
+        assert not is_valid
+        assert "GEOPY-999 does not exist" in error_message
+        is_valid, error_message = check_message_subject(
+            "GEOPY-456: long enough", "", validate
+        )
+        assert not is_valid
+        assert "GEOPY-456 is Closed" in error_message
+        # no JIRA ID at all: nothing to look up
+        assert check_message_subject("Merge branch 'main' into x", "", validate)[0]
+
+
+def test_check_commit_message_with_issue_index(
+    mock_get_branch_name, tmp_path: Path, jira_index_path: Path, monkeypatch
+):
+    monkeypatch.setenv("MIRA_HOOKS_JIRA_INDEX", str(jira_index_path))
+    mock_get_branch_name("some_branch")
+    msg_file = tmp_path / "msg"
+    msg_file.write_text("GEOPY-999: a typo in the JIRA ID\n", encoding="utf-8")
+    is_valid, error_message = check_commit_message(str(msg_file))
+    assert not is_valid
+    assert error_message.startswith("JIRA issue GEOPY-999 does not exist")
+    msg_file.write_text("GEOPY-123: an existing JIRA ID\n", encoding="utf-8")
+    assert check_commit_message(str(msg_file)) == (True, "")
+
+
+@pytest.fixture
+def commit_history(git_repo: Path) -> list[str]:
+    """A repository with a few commits, the oldest first.
+
+    :return: the SHA of the commits.
+    """
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    for message in [
+        "GEOPY-1: initial commit on main",
+        "GEOPY-1: some valid message\n\nwith a body",
+        "no JIRA ID in this one",
+        "GEOPY-2: short",
+    ]:
+        subprocess.run(
+            ["git", "commit", "-q", "--allow-empty", "-m", message], check=True, env=env
+        )
+    log = subprocess.run(
+        ["git", "log", "--reverse", "--format=%H"],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return log.stdout.split()
+
+
+def test_iter_commit_subjects(commit_history: list[str]):
+    assert list(iter_commit_subjects([f"{commit_history[0]}..HEAD"])) == [
+        (commit_history[3], "GEOPY-2: short"),
+        (commit_history[2], "no JIRA ID in this one"),
+        (commit_history[1], "GEOPY-1: some valid message"),
+    ]
+
+
+def test_iter_commit_subjects_invalid_range(commit_history: list[str]):
+    with pytest.raises(subprocess.CalledProcessError):
+        list(iter_commit_subjects(["no-such-branch..HEAD"]))
+
+
+def test_check_commit_range(commit_history: list[str], capsys):
+    assert check_commit_range([f"{commit_history[1]}..HEAD"], "main") is False
+    report = capsys.readouterr().out
+    assert f"{commit_history[2][:12]} no JIRA ID in this one" in report
+    assert f"{commit_history[3][:12]} GEOPY-2: short" in report
+    assert "2 commit(s) checked, 2 invalid" in report
+
+    assert check_commit_range(["HEAD~3..HEAD~2"], "main") is True
+    assert "1 commit(s) checked, 0 invalid" in capsys.readouterr().out
+
+
+def test_check_commit_range_first_line_only(commit_history: list[str], capsys):
+    # git's %s would join the wrapped line to the subject, long enough then
+    subprocess.run(
+        [
+            *("git", "-c", "user.name=Test", "-c", "user.email=test@example.com"),
+            *("commit", "-q", "--allow-empty"),
+            *("-m", "GEOPY-2 ab\nthis wraps onto a second line"),
+        ],
+        check=True,
+    )
+    assert check_commit_range(["HEAD~1..HEAD"], "main") is False
+    report = capsys.readouterr().out
+    assert "GEOPY-2 ab\n" in report
+    assert "1 commit(s) checked, 1 invalid" in report
+
+
+def test_main_check_invalid_range(commit_history: list[str], capsys):
+    test_args = ["script_name", "--check-range", "no-such-branch..HEAD"]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            git_message_hook_main()
+        assert e.value.code == 2
+    assert "cannot list the commits of no-such-branch..HEAD" in capsys.readouterr().err
+
+
+def test_check_commit_range_with_pushed_branch(
+    commit_history: list[str], monkeypatch, capsys
+):
+    # the JIRA ID of the branch is enough, but must not conflict with the message
+    monkeypatch.setenv("PRE_COMMIT_LOCAL_BRANCH", "refs/heads/GEOPY-1_feature")
+    assert check_commit_range(["HEAD~2..HEAD~1"]) is True
+    assert check_commit_range(["HEAD~1..HEAD"]) is False
+    assert "Different JIRA ID" in capsys.readouterr().out
+
+
+def test_pushed_revisions(monkeypatch):
+    monkeypatch.delenv("PRE_COMMIT_FROM_REF", raising=False)
+    monkeypatch.delenv("PRE_COMMIT_TO_REF", raising=False)
+    # the first push of a repository
+    assert pushed_revisions() == ["HEAD", "--not", "--remotes"]
+
+    monkeypatch.setenv("PRE_COMMIT_TO_REF", "abc")
+    assert pushed_revisions() == ["abc", "--not", "--remotes"]
+    monkeypatch.setenv("PRE_COMMIT_FROM_REF", "def")
+    assert pushed_revisions() == ["def..abc"]
+
+
+def test_main_calls_check_commit_range():
+    test_args = ["script_name", "--check-range", "A..B"]
+    with mock.patch.object(sys, "argv", test_args):
+        with mock.patch(
+            "mirageoscience.hooks.git_message_hook.check_commit_range",
+            return_value=False,
+        ) as mock_check_commit_range:
+            with pytest.raises(SystemExit):
+                git_message_hook_main()
+            mock_check_commit_range.assert_called_once_with(["A..B"], None)
+
+
+def test_main_check_range_from_pre_commit(monkeypatch):
+    monkeypatch.setenv("PRE_COMMIT_FROM_REF", "def")
+    monkeypatch.setenv("PRE_COMMIT_TO_REF", "abc")
+    test_args = ["script_name", "--check-range", "--branch", "GEOPY-1_feature"]
+    with mock.patch.object(sys, "argv", test_args):
+        with mock.patch(
+            "mirageoscience.hooks.git_message_hook.check_commit_range",
+            return_value=True,
+        ) as mock_check_commit_range:
+            git_message_hook_main()
+            mock_check_commit_range.assert_called_once_with(
+                ["def..abc"], "GEOPY-1_feature"
+            )
+
+
+def test_main_check_range_of_first_push(commit_history: list[str], monkeypatch, capsys):
+    # pre-commit tells no refs on the first push of a repository
+    monkeypatch.delenv("PRE_COMMIT_FROM_REF", raising=False)
+    monkeypatch.delenv("PRE_COMMIT_TO_REF", raising=False)
+    test_args = ["script_name", "--check-range", "--branch", "GEOPY-1_feature"]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            git_message_hook_main()
+        assert e.value.code == 1
+    assert f"{len(commit_history)} commit(s) checked" in capsys.readouterr().out
+
+
+def test_main_requires_msg_file():
+    with mock.patch.object(sys, "argv", ["script_name", "--check"]):
+        with pytest.raises(SystemExit):
+            git_message_hook_main()
+
+
 def test_main_calls_prepare_commit_msg():
     test_args = ["script_name", "--prepare", "msg_file"]
     with mock.patch.object(sys, "argv", test_args):
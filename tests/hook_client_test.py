@@ -0,0 +1,163 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks import hook_client
+from mirageoscience.hooks.hook_client import (
+    daemon_enabled,
+    forward,
+    private_directory,
+    run_hook,
+    run_in_process,
+    socket_path,
+)
+from mirageoscience.hooks.hook_client import main as dispatcher_main
+
+
+def test_run_in_process(tmp_path: Path, capsys):
+    test_file = tmp_path / "test_file.py"
+    test_file.write_text("# no copyright\n", encoding="utf-8")
+    assert run_in_process("check_copyright", [str(test_file)]) == 1
+    assert "No copyright or invalid year" in capsys.readouterr().err
+    assert run_in_process("check_copyright", []) == 2
+
+
+def test_daemon_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("MIRA_HOOKS_DAEMON", raising=False)
+    assert not daemon_enabled()
+    monkeypatch.setenv("MIRA_HOOKS_DAEMON", "1")
+    assert daemon_enabled()
+
+
+def test_socket_path(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.delenv("MIRA_HOOKS_SOCKET", raising=False)
+    assert socket_path().parent.parent == tmp_path
+    monkeypatch.setenv("MIRA_HOOKS_SOCKET", str(tmp_path / "my.sock"))
+    assert socket_path() == tmp_path / "my.sock"
+
+
+def test_run_hook_starts_daemon_and_falls_back(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("MIRA_HOOKS_DAEMON", "1")
+    monkeypatch.setenv("MIRA_HOOKS_SOCKET", str(tmp_path / "missing.sock"))
+    with (
+        mock.patch.object(hook_client, "start_daemon") as mock_start_daemon,
+        mock.patch.object(
+            hook_client, "run_in_process", return_value=3
+        ) as mock_run_in_process,
+    ):
+        assert run_hook("git_message_hook", ["--check", "msg"]) == 3
+    mock_start_daemon.assert_called_once_with(tmp_path / "missing.sock")
+    mock_run_in_process.assert_called_once_with("git_message_hook", ["--check", "msg"])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets are not supported")
+def test_private_directory(tmp_path: Path):
+    assert private_directory(tmp_path)
+    assert not private_directory(tmp_path / "missing")
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+    assert not private_directory(shared)
+    link = tmp_path / "link"
+    link.symlink_to(tmp_path)
+    assert not private_directory(link)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets are not supported")
+def test_never_forward_to_shared_directory(monkeypatch, tmp_path: Path):
+    # e.g. created by another user before the first daemon
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    monkeypatch.setenv("MIRA_HOOKS_SOCKET", str(shared / "daemon.sock"))
+    with (
+        mock.patch.object(hook_client, "start_daemon") as mock_start_daemon,
+        mock.patch("socket.socket") as mock_socket,
+    ):
+        assert forward("check_copyright", ["file.py"]) is None
+    mock_start_daemon.assert_not_called()
+    mock_socket.assert_not_called()
+
+
+def test_run_hook_when_daemon_cannot_start(monkeypatch):
+    monkeypatch.setenv("MIRA_HOOKS_DAEMON", "1")
+    monkeypatch.setenv("MIRA_HOOKS_SOCKET", "/proc/nope/daemon.sock")
+    with mock.patch.object(hook_client, "run_in_process", return_value=0):
+        assert run_hook("check_copyright", ["file.py"]) == 0
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--files-from", "-"],
+        ["--files-from=-"],
+        ["--watch", "file.py"],
+        ["--files-from", "/dev/stdin"],
+        ["--files-from=/dev/fd/63"],
+        ["--rules", "/proc/self/fd/3", "file.py"],
+        ["file.py", "--wat"],
+    ],
+)
+def test_run_hook_with_stdin_or_watch_in_process(monkeypatch, argv):
+    monkeypatch.setenv("MIRA_HOOKS_DAEMON", "1")
+    with (
+        mock.patch.object(hook_client, "forward") as mock_forward,
+        mock.patch.object(hook_client, "run_in_process", return_value=0),
+    ):
+        assert run_hook("check_copyright", argv) == 0
+    mock_forward.assert_not_called()
+
+
+def test_dispatcher_runs_command(monkeypatch):
+    monkeypatch.delenv("MIRA_HOOKS_DAEMON", raising=False)
+    with (
+        mock.patch.object(
+            sys, "argv", ["mira-hooks", "git-message-hook", "--check", "msg"]
+        ),
+        mock.patch.object(
+            hook_client, "run_in_process", return_value=1
+        ) as mock_run_in_process,
+        pytest.raises(SystemExit) as exit_info,
+    ):
+        dispatcher_main()
+    assert exit_info.value.code == 1
+    mock_run_in_process.assert_called_once_with("git_message_hook", ["--check", "msg"])
+
+
+def test_dispatcher_never_forwards_jira_index(monkeypatch):
+    monkeypatch.setenv("MIRA_HOOKS_DAEMON", "1")
+    with (
+        mock.patch.object(hook_client, "forward") as mock_forward,
+        mock.patch.object(hook_client, "run_in_process", return_value=0),
+    ):
+        assert run_hook("jira_index", ["lookup", "index", "GEOPY-1"]) == 0
+    mock_forward.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected_code"), [([], 2), (["--help"], 0), (["unknown"], 2)]
+)
+def test_dispatcher_usage(argv, expected_code, capsys):
+    with (
+        mock.patch.object(sys, "argv", ["mira-hooks", *argv]),
+        pytest.raises(SystemExit) as exit_info,
+    ):
+        dispatcher_main()
+    assert exit_info.value.code == expected_code
+    output = capsys.readouterr()
+    assert "check-copyright" in output.out + output.err
@@ -0,0 +1,156 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from mirageoscience.hooks import hook_client
+from mirageoscience.hooks.hook_client import daemon_command, daemon_identity, forward
+from mirageoscience.hooks.hook_daemon import handle_request, serve
+
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix sockets are not supported"
+)
+
+
+def _request(hook: str, argv: list[str], cwd: Path) -> dict:
+    return {
+        "identity": daemon_identity(),
+        "hook": hook,
+        "argv": argv,
+        "cwd": str(cwd),
+        "env": {"PATH": "/usr/bin:/bin"},
+    }
+
+
+def test_handle_request(tmp_path: Path):
+    (tmp_path / "valid.py").write_text(
+        f"# Copyright (c) {date.today().year}\n", encoding="utf-8"
+    )
+    (tmp_path / "invalid.py").write_text("# nothing\n", encoding="utf-8")
+    cwd = Path.cwd()
+
+    reply = handle_request(_request("check_copyright", ["valid.py"], tmp_path))
+    assert reply == {"status": 0, "stdout": "", "stderr": ""}
+    reply = handle_request(_request("check_copyright", ["invalid.py"], tmp_path))
+    assert reply["status"] == 1
+    assert reply["stderr"] == "invalid.py: No copyright or invalid year\n"
+    # the state of the daemon is restored
+    assert Path.cwd() == cwd
+
+
+def test_handle_request_of_other_client(tmp_path: Path):
+    request = _request("check_copyright", ["valid.py"], tmp_path)
+    assert handle_request({**request, "identity": "other"})["status"] is None
+    assert handle_request({**request, "hook": "other"})["status"] is None
+
+
+def test_handle_request_never_watches_nor_reads_client_files(tmp_path: Path):
+    (tmp_path / "valid.py").write_text(
+        f"# Copyright (c) {date.today().year}\n", encoding="utf-8"
+    )
+    # the watch would never end, and block the daemon
+    reply = handle_request(
+        _request("check_copyright", ["--watch", "valid.py"], tmp_path)
+    )
+    assert reply["status"] is None
+    # the stdin of the daemon is not the one of the client
+    reply = handle_request(
+        _request("check_copyright", ["--files-from", "/dev/stdin"], tmp_path)
+    )
+    assert reply["status"] is None
+
+
+@pytest.fixture
+def daemon_socket(tmp_path: Path, monkeypatch):
+    path = tmp_path / "daemon.sock"
+    monkeypatch.setenv("MIRA_HOOKS_SOCKET", str(path))
+    with subprocess.Popen(
+        [*daemon_command(path), "--idle-timeout", "5"]
+    ) as daemon_proc:
+        deadline = time.monotonic() + 10
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        yield path
+        daemon_proc.terminate()
+
+
+def test_forward_to_daemon(daemon_socket: Path, tmp_path: Path, monkeypatch, capsys):
+    (tmp_path / "invalid.py").write_text("# nothing\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    for _ in range(2):
+        assert forward("check_copyright", ["invalid.py"]) == 1
+        assert capsys.readouterr().err == "invalid.py: No copyright or invalid year\n"
+    assert forward("check_copyright", []) == 2
+
+
+def test_daemon_serves_requests_side_by_side(
+    daemon_socket: Path, tmp_path: Path, monkeypatch, capsys
+):
+    (tmp_path / "invalid.py").write_text("# nothing\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    file_list = tmp_path / "file_list"
+    os.mkfifo(file_list)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as blocked:
+        # this request waits for its file list, until written below
+        blocked.connect(str(daemon_socket))
+        request = _request(
+            "check_copyright", ["--files-from", str(file_list)], tmp_path
+        )
+        blocked.sendall(json.dumps(request).encode())
+        blocked.shutdown(socket.SHUT_WR)
+
+        assert forward("check_copyright", ["invalid.py"]) == 1
+        assert capsys.readouterr().err == "invalid.py: No copyright or invalid year\n"
+
+        file_list.write_text("invalid.py\n", encoding="utf-8")
+        blocked.settimeout(10)
+        reply = json.loads(b"".join(iter(lambda: blocked.recv(4096), b"")))
+    assert reply["status"] == 1
+    assert reply["stderr"] == "invalid.py: No copyright or invalid year\n"
+
+
+def test_forward_when_daemon_stalls(tmp_path: Path, monkeypatch):
+    path = tmp_path / "daemon.sock"
+    monkeypatch.setenv("MIRA_HOOKS_SOCKET", str(path))
+    monkeypatch.setattr(hook_client, "REPLY_TIMEOUT", 0.1)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+        stalled.bind(str(path))
+        stalled.listen()
+        assert forward("check_copyright", ["invalid.py"]) is None
+
+
+def test_daemon_exits_when_idle(tmp_path: Path):
+    path = tmp_path / "daemon.sock"
+    subprocess.run(
+        [*daemon_command(path), "--idle-timeout", "0.1"],
+        check=True,
+        timeout=10,
+    )
+    assert not path.exists()
+
+
+def test_daemon_never_serves_shared_directory(tmp_path: Path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    serve(shared / "daemon.sock", idle_timeout=10)
+    assert not list(shared.iterdir())
@@ -0,0 +1,125 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks.hooks_config import configured_index_path
+from mirageoscience.hooks.jira_index import (
+    IssueRecord,
+    IssueValidator,
+    JiraIndex,
+    configured_validator,
+    read_csv_export,
+    update_index,
+)
+from mirageoscience.hooks.jira_index import main as jira_index_main
+
+from .conftest import JIRA_ISSUES
+
+
+def test_lookup(jira_index_path: Path):
+    with JiraIndex(jira_index_path) as index:
+        for record in JIRA_ISSUES:
+            assert index.lookup(record.key) == record
+        assert index.lookup("GEOPY-999") is None
+        assert index.synced_at is not None
+
+
+def test_open_invalid_index(tmp_path: Path):
+    not_an_index = tmp_path / "index.sqlite"
+    not_an_index.write_text("not a database", encoding="utf-8")
+    with pytest.raises(ValueError, match="not a JIRA issue index"):
+        JiraIndex(not_an_index)
+    with pytest.raises(sqlite3.OperationalError):
+        JiraIndex(tmp_path / "missing.sqlite")
+
+
+def test_update_index(jira_index_path: Path):
+    update_index(
+        jira_index_path,
+        [IssueRecord("GEOPY-123", "Closed"), IssueRecord("GEOPY-789", "To Do")],
+    )
+    with JiraIndex(jira_index_path) as index:
+        assert index.lookup("GEOPY-123") == IssueRecord("GEOPY-123", "Closed")
+        assert index.lookup("GEOPY-789") == IssueRecord("GEOPY-789", "To Do")
+        assert index.lookup("DEVOPS-7") == JIRA_ISSUES[2]
+
+
+def test_read_csv_export(tmp_path: Path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text(
+        "﻿Summary,Issue key,Issue id,Status,Updated\n"
+        '"A summary, with a comma",GEOPY-1,1001,Done,2026-01-01 10:00\n'
+        ",,,,\n"
+        "Another,GI-2,1002,In Progress,\n",
+        encoding="utf-8",
+    )
+    assert list(read_csv_export(csv_path)) == [
+        IssueRecord("GEOPY-1", "Done", "2026-01-01 10:00"),
+        IssueRecord("GI-2", "In Progress", ""),
+    ]
+
+    csv_path.write_text("Summary,Status\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="issue key"):
+        list(read_csv_export(csv_path))
+
+
+def test_issue_validator(jira_index_path: Path):
+    with JiraIndex(jira_index_path) as index:
+        validate = IssueValidator(index, ["closed"])
+        assert validate("GEOPY-123") == ""
+        assert "is Closed" in validate("GEOPY-456")
+        assert "does not exist" in validate("GEOPY-999")
+
+
+def test_configured_index(jira_index_path: Path, tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("MIRA_HOOKS_JIRA_INDEX", raising=False)
+    assert configured_index_path(tmp_path) is None
+    assert configured_validator(tmp_path) is None
+
+    (tmp_path / ".mira-hooks.toml").write_text(
+        f'jira-index = "{jira_index_path.name}"\njira-rejected-statuses = []\n',
+        encoding="utf-8",
+    )
+    assert configured_index_path(tmp_path) == jira_index_path
+    validator = configured_validator(tmp_path)
+    assert validator is not None
+    assert validator("GEOPY-456") == ""
+    validator.index.close()
+
+    monkeypatch.setenv("MIRA_HOOKS_JIRA_INDEX", str(tmp_path / "missing.sqlite"))
+    assert configured_validator(tmp_path) is None
+
+
+def test_main_build_and_lookup(tmp_path: Path, capsys):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text("Issue key,Status\nGEOPY-1,Done\n", encoding="utf-8")
+    index_path = tmp_path / "index.sqlite"
+
+    with mock.patch.object(
+        sys, "argv", ["jira_index", "build", str(index_path), str(csv_path)]
+    ):
+        jira_index_main()
+    assert "1 issue(s) written" in capsys.readouterr().out
+
+    with mock.patch.object(
+        sys, "argv", ["jira_index", "lookup", str(index_path), "GEOPY-1", "GEOPY-2"]
+    ):
+        with pytest.raises(SystemExit) as exit_info:
+            jira_index_main()
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().out == "GEOPY-1: Done\nGEOPY-2: not found\n"
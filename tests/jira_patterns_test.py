@@ -0,0 +1,204 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import random
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from mirageoscience.hooks.jira_patterns import (
+    DEFAULT_JIRA_PROJECT_KEYS,
+    compile_patterns,
+    load_project_keys,
+    message_patterns,
+    prefix_factored_pattern,
+)
+
+
+def test_prefix_factored_pattern():
+    assert prefix_factored_pattern(["GA", "GEOPY", "GI"]) == "G(?:A|EOPY|I)"
+    assert prefix_factored_pattern(["GI", "GIS"]) == "GI(?:S)?"
+    assert prefix_factored_pattern([]) == ""
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        DEFAULT_JIRA_PROJECT_KEYS,
+        ("GI", "GIS", "GISX", "G"),
+        ("AB", "ABC", "ABD", "B", "BA"),
+    ],
+)
+def test_prefix_factored_pattern_matches_alternation(keys):
+    factored = re.compile(f"(?:{prefix_factored_pattern(keys)})-\\d+")
+    alternation = re.compile(f"(?:{'|'.join(keys)})-\\d+")
+    candidates = [f"{key}-12" for key in keys] + ["GIT-1", "X-1", "AB", "BAB-2", "-1"]
+    for text in candidates:
+        expected = alternation.fullmatch(text)
+        assert bool(factored.fullmatch(text)) == bool(expected), text
+
+
+def test_compile_patterns():
+    patterns = compile_patterns(("ABC", "XY"))
+    match = re.match(patterns.jira, "[XY-12] message")
+    assert match is not None
+    assert match.group(1) == "XY-12"
+    assert re.match(patterns.jira, "GEOPY-12 message") is None
+    assert re.match(compile_patterns(()).jira, "ABC-12") is None
+    assert patterns.fingerprint != compile_patterns(("ABC",)).fingerprint
+
+
+def test_load_default_project_keys(tmp_path: Path):
+    assert load_project_keys(tmp_path) == DEFAULT_JIRA_PROJECT_KEYS
+
+
+def test_load_project_keys_from_pyproject(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.mira-hooks]\njira-project-keys = ["ABC", "XY", "ABC"]\n',
+        encoding="utf-8",
+    )
+    assert load_project_keys(tmp_path) == ("ABC", "XY")
+
+
+def test_load_project_keys_from_config_file(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.mira-hooks]\njira-project-keys = ["ABC"]\n', encoding="utf-8"
+    )
+    (tmp_path / ".mira-hooks.toml").write_text(
+        'extra-jira-project-keys = ["NEW"]\n', encoding="utf-8"
+    )
+    assert load_project_keys(tmp_path) == (*DEFAULT_JIRA_PROJECT_KEYS, "NEW")
+
+
+def test_load_invalid_project_keys(tmp_path: Path):
+    (tmp_path / ".mira-hooks.toml").write_text(
+        'jira-project-keys = ["A|B"]\n', encoding="utf-8"
+    )
+    with pytest.raises(ValueError, match=re.escape("A|B")):
+        load_project_keys(tmp_path)
+
+
+def test_message_patterns_compiled_once():
+    assert message_patterns() is message_patterns()
+
+
+def test_message_patterns_follow_config(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert re.match(message_patterns().jira, "NEW-1") is None
+
+    (tmp_path / ".mira-hooks.toml").write_text(
+        'extra-jira-project-keys = ["NEW"]\n', encoding="utf-8"
+    )
+    assert re.match(message_patterns().jira, "NEW-1") is not None
+    assert message_patterns().jira_id("NEW-1") == "NEW-1"
+
+
+# pieces of branch names, commit subjects and `git branch` descriptions, with the
+# characters on which the regular expressions and the matchers could differ
+# (non-ASCII digits and spaces, line breaks, keys prefix of others)
+FRAGMENTS = [
+    *("GEOPY", "GI", "GIS", "G", "GA", "A_1"),
+    *("-", "-", "1", "42", "\u0663", "\u00b2"),
+    *("!", "fixup!", "amend! ", "_", "a", "\u00e9", "x", "rebasing"),
+    *(" ", " ", "\t", "\n", "\r", "\x0b", "\u00a0"),
+    *("(", ")", ")", "[", "]", ",", "#"),
+]
+
+
+def random_texts(seed: int, count: int) -> list[str]:
+    generator = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        text = "".join(
+            generator.choice(FRAGMENTS) for _ in range(generator.randint(0, 12))
+        )
+        texts.append("(" + text if generator.random() < 0.5 else text)
+    return texts
+
+
+def _group(pattern: re.Pattern[str], text: str) -> str | None:
+    match = pattern.match(text)
+    return match.group(1) if match else None
+
+
+@pytest.mark.parametrize("keys", [DEFAULT_JIRA_PROJECT_KEYS, ("GI", "GIS", "G", "A_1")])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matchers_match_patterns(keys: tuple[str, ...], seed: int):
+    patterns = compile_patterns(keys)
+    for text in random_texts(seed, 3000):
+        assert patterns.jira_id(text) == (_group(patterns.jira, text) or ""), text
+        assert patterns.prefix_bang(text) == (_group(patterns.bang, text) or ""), text
+        assert patterns.rebased_branch(text) == _group(patterns.rebasing, text), text
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("GEOPY-12 message", "GEOPY-12"),
+        ("fixup! GEOPY-12 message", "GEOPY-12"),
+        ("fixup!  [GI-3] message", "GI-3"),
+        ("GIS-3", ""),
+        ("xGEOPY-12", ""),
+        ("GEOPY-", ""),
+        ("GEOPY-12abc", "GEOPY-12"),
+        ("", ""),
+    ],
+)
+def test_jira_id(text: str, expected: str):
+    assert compile_patterns(DEFAULT_JIRA_PROJECT_KEYS).jira_id(text) == expected
+    assert compile_patterns(()).jira_id(text) == ""
+
+
+@pytest.mark.parametrize(
+    "description, expected",
+    [
+        ("(no branch, rebasing GEOPY-12-feature)", "GEOPY-12-feature"),
+        ("(HEAD detached at 1a2b3c4)", "1a2b3c4"),
+        ("(a b) c)", "c"),
+        ("(a b)c)", "b)c"),
+        ("(a\nb)", "b"),
+        ("(no branch)", "branch"),
+        ("(nothing", None),
+        ("GEOPY-12-feature", None),
+    ],
+)
+def test_rebased_branch(description: str, expected: str | None):
+    assert compile_patterns(()).rebased_branch(description) == expected
+
+
+# inputs that make a backtracking engine try many ways to match
+ADVERSARIAL_TEXTS = {
+    "jira_id": lambda size: "fixup!" + " " * size + "x",
+    "prefix_bang": lambda size: "a" * size + "!",
+    "rebased_branch": lambda size: "(" + "a " * (size // 2),
+}
+
+
+def _min_time(func, text: str) -> float:
+    durations = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func(text)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+@pytest.mark.parametrize("matcher", list(ADVERSARIAL_TEXTS))
+def test_matchers_are_linear(matcher: str):
+    func = getattr(compile_patterns(DEFAULT_JIRA_PROJECT_KEYS), matcher)
+    make_text = ADVERSARIAL_TEXTS[matcher]
+    small = _min_time(func, make_text(100_000))
+    large = _min_time(func, make_text(800_000))
+    # 8 times the input: 64 times slower if quadratic, with room for noise
+    assert large < max(small, 1e-4) * 24
@@ -0,0 +1,181 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks import profiling as profiling_module
+from mirageoscience.hooks.check_copyright import check_files
+from mirageoscience.hooks.check_copyright import main as check_copyright_main
+from mirageoscience.hooks.git_message_hook import main as git_message_hook_main
+from mirageoscience.hooks.hook_client import PROFILE_ENV, run_in_process
+from mirageoscience.hooks.profiling import active_profiler, profiling, span
+
+
+def read_jsonl(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def read_chrome_trace(path: Path) -> list[dict]:
+    # as the trace viewers do: the closing bracket is optional
+    return json.loads(path.read_text(encoding="utf-8").rstrip().rstrip(",") + "]")
+
+
+def test_span_is_a_no_op_when_disabled():
+    with profiling(None) as profiler:
+        assert profiler is None
+        assert span("a") is span("b", arg=1)
+        with span("a") as details:
+            details["ignored"] = True
+            assert not details
+
+
+def test_spans_written_as_json_lines(tmp_path: Path):
+    profile_path = tmp_path / "profile.jsonl"
+    for run in range(2):
+        with profiling(profile_path):
+            with span("outer", run=run) as details:
+                with span("inner"):
+                    pass
+                details["result"] = "done"
+        assert active_profiler() is None
+
+    events = read_jsonl(profile_path)
+    assert [event["name"] for event in events] == ["inner", "outer"] * 2
+    assert events[1]["args"] == {"run": 0, "result": "done"}
+    inner, outer = events[:2]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert outer["tid"] == threading.get_ident()
+
+
+def test_spans_written_as_chrome_trace(tmp_path: Path):
+    profile_path = tmp_path / "profile.json"
+    for _ in range(2):
+        with profiling(profile_path):
+            with span("phase"):
+                pass
+
+    events = read_chrome_trace(profile_path)
+    assert [event["ph"] for event in events] == ["M", "X"] * 2
+    assert all(event["name"] == "phase" for event in events[1::2])
+
+
+def test_nested_profiling_shares_the_profiler(tmp_path: Path):
+    profile_path = tmp_path / "profile.jsonl"
+    with profiling(profile_path) as outer:
+        with profiling(tmp_path / "other.jsonl") as inner:
+            assert inner is outer
+            with span("phase"):
+                pass
+        # only written at the end of the outermost block
+        assert not profile_path.exists()
+    assert [event["name"] for event in read_jsonl(profile_path)] == ["phase"]
+    assert not (tmp_path / "other.jsonl").exists()
+
+
+def test_write_failure_does_not_fail(tmp_path: Path, capsys):
+    with profiling(tmp_path / "missing" / "profile.jsonl"):
+        with span("phase"):
+            pass
+    assert "cannot write the profile" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_check_files_spans(tmp_path: Path, jobs: int):
+    current_year = date.today().year
+    files = []
+    for i in range(8):
+        test_file = tmp_path / f"file_{i}.py"
+        year = current_year if i % 2 else current_year - 1
+        test_file.write_text(f"# Copyright (c) {year}\n", encoding="utf-8")
+        files.append(str(test_file))
+
+    profile_path = tmp_path / "profile.jsonl"
+    with profiling(profile_path):
+        assert not check_files(files, jobs=jobs)
+
+    events = read_jsonl(profile_path)
+    file_spans = [e for e in events if e["name"] == "check_copyright.scan_file"]
+    assert sorted(e["args"]["path"] for e in file_spans) == sorted(files)
+    statuses = {e["args"]["path"]: e["args"]["status"] for e in file_spans}
+    assert statuses[files[0]] == "outdated"
+    assert statuses[files[1]] == "valid"
+    assert events[-1]["name"] == "check_copyright.check_files"
+    assert events[-1]["args"] == {"valid": False}
+
+
+def test_git_message_hook_spans(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    subprocess.run(["git", "init", "-q", "-b", "GEOPY-12-x", str(tmp_path)], check=True)
+    monkeypatch.chdir(tmp_path)
+    message_file = tmp_path / "COMMIT_EDITMSG"
+    message_file.write_text("some change\n", encoding="utf-8")
+    profile_path = tmp_path / "profile.jsonl"
+
+    for option in ("--prepare", "--check"):
+        test_args = ["git_message_hook", "--profile", str(profile_path), option]
+        with mock.patch.object(sys, "argv", [*test_args, str(message_file)]):
+            git_message_hook_main()
+    assert message_file.read_text(encoding="utf-8") == "[GEOPY-12] some change\n"
+
+    names = [event["name"] for event in read_jsonl(profile_path)]
+    prepare_end = names.index("git_message_hook.prepare_commit_msg")
+    assert names[:prepare_end] == [
+        "git_message_hook.get_branch_name",
+        "git_message_hook.get_branch_jira_id",
+        "git_message_hook.read_message",
+    ]
+    assert names[prepare_end + 1 :] == [
+        "git_message_hook.get_branch_jira_id",
+        "git_message_hook.read_message",
+        "git_message_hook.check_parsed_message",
+        "git_message_hook.check_commit_message",
+    ]
+    jira_id_spans = [
+        event
+        for event in read_jsonl(profile_path)
+        if event["name"] == "git_message_hook.get_branch_jira_id"
+    ]
+    assert [event["args"]["cache"] for event in jira_id_spans] == ["miss", "memory"]
+
+
+def test_run_in_process_times_import(tmp_path: Path, monkeypatch):
+    profile_path = tmp_path / "profile.jsonl"
+    monkeypatch.setenv(PROFILE_ENV, str(profile_path))
+    assert run_in_process("check_copyright", ["--help"]) == 0
+    events = read_jsonl(profile_path)
+    assert [event["name"] for event in events] == ["import", "run"]
+    assert events[1]["args"] == {"hook": "check_copyright"}
+    assert profiling_module.active_profiler() is None
+
+
+def test_profile_from_environment(tmp_path: Path, monkeypatch):
+    test_file = tmp_path / "test_file.py"
+    test_file.write_text(f"# Copyright (c) {date.today().year}\n", encoding="utf-8")
+    profile_path = tmp_path / "profile.json"
+    monkeypatch.setenv(PROFILE_ENV, str(profile_path))
+    with mock.patch.object(sys, "argv", ["check_copyright", str(test_file)]):
+        check_copyright_main()
+    names = [event["name"] for event in read_chrome_trace(profile_path)]
+    assert names == [
+        "process_name",
+        "check_copyright.scan_file",
+        "check_copyright.check_files",
+    ]
@@ -0,0 +1,232 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import re
+import sys
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks.check_copyright import ScanPolicy, check_files
+from mirageoscience.hooks.check_copyright import main as check_copyright_main
+from mirageoscience.hooks.copyright_cache import CopyrightCache
+from mirageoscience.hooks.copyright_scan import (
+    CopyrightScanner,
+    FileStatus,
+    ScanResult,
+)
+from mirageoscience.hooks.regex_rules import Rule, RuleSet, load_rules
+
+
+RELINT_CONFIG = r"""
+- name: No import shutil.rmtree
+  pattern: 'from shutil import\b.*\brmtree\b'
+  hint: Use the cleanup helpers
+  filePattern: .*\.pyi?
+  error: false
+- name: No shutil.rmtree
+  pattern: '\bshutil\.rmtree\b'
+  hint: |
+    Use the cleanup helpers
+    instead
+  filePattern: .*\.pyi?
+  error: false
+- name: No print
+  pattern: '^\s*print\('
+"""
+
+
+@pytest.fixture(name="rules_file")
+def rules_file_fixture(tmp_path: Path) -> Path:
+    rules_file = tmp_path / ".relint.yml"
+    rules_file.write_text(RELINT_CONFIG, encoding="utf-8")
+    return rules_file
+
+
+def test_load_rules(rules_file: Path):
+    rules = load_rules(rules_file)
+    assert [rule.name for rule in rules] == [
+        "No import shutil.rmtree",
+        "No shutil.rmtree",
+        "No print",
+    ]
+    assert rules[1].hint == "Use the cleanup helpers\ninstead\n"
+    assert not rules[1].error
+    assert rules[2].error
+    assert rules[2].file_pattern.pattern == ".*"
+
+
+def test_load_rules_from_documents(tmp_path: Path):
+    rules_file = tmp_path / ".relint.yml"
+    rules_file.write_text(
+        "name: first\npattern: a\n---\nname: second\npattern: b\n", encoding="utf-8"
+    )
+    assert [rule.name for rule in load_rules(rules_file)] == ["first", "second"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["- name: no pattern\n", "- pattern: no name\n", "- name: bad\n  pattern: '('\n"],
+)
+def test_load_invalid_rules(tmp_path: Path, content: str):
+    rules_file = tmp_path / ".relint.yml"
+    rules_file.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_rules(rules_file)
+
+
+def test_rules_for_file_pattern(rules_file: Path):
+    rule_set = RuleSet(load_rules(rules_file))
+    assert rule_set.rules_for(Path("src/module.py")) == (0, 1, 2)
+    assert rule_set.rules_for(Path("src/module.pyi")) == (0, 1, 2)
+    assert rule_set.rules_for(Path("README.rst")) == (2,)
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["ab", "cd"],
+        # cannot be combined: back-reference, inline flags, same group names
+        [r"(a)\1", "cd"],
+        ["(?i)AB", "cd"],
+        ["(?P<x>ab)", "(?P<x>cd)"],
+    ],
+)
+def test_scan_finds_all_matches(patterns: list[str]):
+    rule_set = RuleSet(
+        Rule(str(index), re.compile(pattern, re.MULTILINE))
+        for index, pattern in enumerate(patterns)
+    )
+    text = "xx\nabcd\n\nab cd aa\n"
+    violations = rule_set.scan(text, (0, 1))
+    found = sorted((v.rule.name, v.line, v.offset) for v in violations)
+    expected = sorted(
+        (str(index), text.count("\n", 0, match.start()) + 1, match.start())
+        for index, pattern in enumerate(patterns)
+        for match in re.finditer(pattern, text, re.MULTILINE)
+    )
+    assert found == expected
+    assert not rule_set.scan("nothing to see\n", (0, 1))
+
+
+def test_overlapping_matches_are_all_found():
+    rule_set = RuleSet(
+        [
+            Rule("import", re.compile(r"from shutil import\b.*\brmtree\b")),
+            Rule("shutil.rmtree", re.compile(r"\bshutil\.rmtree\b")),
+        ]
+    )
+    violations = rule_set.scan("from shutil import rmtree; shutil.rmtree\n", (0, 1))
+    assert [v.rule.name for v in violations] == ["import", "shutil.rmtree"]
+
+
+def test_fingerprint_depends_on_rules():
+    first = RuleSet([Rule("a", re.compile("a"))])
+    assert first.fingerprint == RuleSet([Rule("b", re.compile("a"))]).fingerprint
+    assert first.fingerprint != RuleSet([Rule("a", re.compile("b"))]).fingerprint
+
+
+def test_check_files_reports_rules(tmp_path: Path, rules_file: Path, capsys):
+    current_year = date.today().year
+    module = tmp_path / "module.py"
+    module.write_text(
+        f"# Copyright (c) {current_year}\nimport shutil\nshutil.rmtree('a')\n",
+        encoding="utf-8",
+    )
+    readme = tmp_path / "README.rst"
+    readme.write_text(f"Copyright (c) {current_year - 1}\nprint(1)\n", "utf-8")
+    rules = RuleSet(load_rules(rules_file))
+    files = [str(module), str(readme)]
+
+    assert not check_files(files, policy=ScanPolicy(rules=rules))
+    assert capsys.readouterr().err == (
+        f"{module}:3: warning: No shutil.rmtree\n"
+        "    Use the cleanup helpers\n"
+        "    instead\n"
+        f"{readme}: No copyright or invalid year\n"
+        f"{readme}:2: error: No print\n"
+    )
+
+    readme.write_text(f"Copyright (c) {current_year}\n", "utf-8")
+    assert check_files(files, policy=ScanPolicy(rules=rules))
+    assert not check_files(files, policy=ScanPolicy(rules=rules, fail_on_warnings=True))
+
+
+def test_rules_read_each_file_once(tmp_path: Path, rules_file: Path):
+    module = tmp_path / "module.py"
+    module.write_text(f"# Copyright (c) {date.today().year}\nimport shutil\n", "utf-8")
+    scanner = CopyrightScanner(date.today().year, rules=RuleSet(load_rules(rules_file)))
+    with mock.patch("builtins.open", wraps=open) as mock_open:
+        assert scanner.file_report(module) == (
+            ScanResult(
+                FileStatus.VALID, date.today().year, 1, 2, module.stat().st_size
+            ),
+            [],
+        )
+    mock_open.assert_called_once()
+
+
+def test_rules_with_cache(tmp_path: Path, rules_file: Path):
+    cache = CopyrightCache(tmp_path / "cache.json")
+    rules = RuleSet(load_rules(rules_file))
+    scanner = CopyrightScanner(date.today().year, cache=cache, rules=rules)
+    clean = tmp_path / "clean.py"
+    clean.write_text("import pathlib\n", encoding="utf-8")
+    dirty = tmp_path / "dirty.py"
+    dirty.write_text("shutil.rmtree(path)\n", encoding="utf-8")
+
+    for bytes_read in (clean.stat().st_size, 0):
+        assert scanner.file_report(clean) == (
+            ScanResult(FileStatus.MISSING, bytes_read=bytes_read),
+            [],
+        )
+        result, violations = scanner.file_report(dirty)
+        assert result.status == FileStatus.MISSING
+        assert [v.rule.name for v in violations] == ["No shutil.rmtree"]
+
+    # only the verdicts of contents with no violations are cached
+    assert len(cache._verdicts) == 1  # pylint: disable=protected-access
+    # a file with other rules is checked again
+    other_rules = RuleSet([Rule("No pathlib", re.compile("pathlib"))])
+    scanner = CopyrightScanner(date.today().year, cache=cache, rules=other_rules)
+    assert len(scanner.file_report(clean)[1]) == 1
+
+
+def test_main_with_rules(rules_file: Path):
+    test_args = ["script_name", "file1.py", "--rules", str(rules_file), "-W"]
+    with mock.patch.object(sys, "argv", test_args):
+        with mock.patch(
+            "mirageoscience.hooks.check_copyright.check_files"
+        ) as mock_check_files:
+            mock_check_files.return_value = True
+            check_copyright_main()
+            policy = mock_check_files.call_args.kwargs["policy"]
+            assert [rule.name for rule in policy.rules.rules] == [
+                "No import shutil.rmtree",
+                "No shutil.rmtree",
+                "No print",
+            ]
+            assert policy.fail_on_warnings
+
+
+@pytest.mark.parametrize("extra_args", [["--fix"], []])
+def test_main_with_invalid_rules(tmp_path: Path, capsys, extra_args: list[str]):
+    rules_file = tmp_path / ".relint.yml"
+    rules_file.write_text("- name: bad\n  pattern: '('\n", encoding="utf-8")
+    test_args = ["script_name", "file1.py", "--rules", str(rules_file), *extra_args]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+    assert e.value.code == 2
+    assert ("--fix" if extra_args else "invalid pattern") in capsys.readouterr().err
@@ -0,0 +1,186 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+from __future__ import annotations
+
+import io
+import json
+import re
+import sys
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks.check_copyright import (
+    ScanPolicy,
+    iter_check_results,
+)
+from mirageoscience.hooks.check_copyright import main as check_copyright_main
+from mirageoscience.hooks.regex_rules import Rule, RuleSet
+from mirageoscience.hooks.report_formats import (
+    write_json_lines,
+    write_report,
+    write_sarif,
+)
+
+
+RULES = RuleSet(
+    [
+        Rule("No print", re.compile(r"^print\(", re.MULTILINE), "Use logging"),
+        Rule("No TODO", re.compile("TODO"), error=False),
+    ]
+)
+
+
+@pytest.fixture(name="files")
+def files_fixture(tmp_path: Path) -> list[str]:
+    current_year = date.today().year
+    contents = {
+        "valid.py": f"# Copyright (c) {current_year}\n",
+        "outdated.py": "\n# Copyright (c) 2019\n",
+        "missing.py": "# nothing\n",
+        "binary.dat": "\0\1\2",
+        "rules.py": f"# Copyright (c) {current_year}\n# TODO\nprint('x')\n",
+    }
+    for name, content in contents.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    return [str(tmp_path / name) for name in contents]
+
+
+def test_json_lines(files: list[str]):
+    policy = ScanPolicy(report_unscannable=True, rules=RULES)
+    stream = io.StringIO()
+    assert not write_json_lines(
+        iter_check_results(files, policy=policy), policy, stream
+    )
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [Path(record["path"]).name for record in records] == [
+        Path(f).name for f in files
+    ]
+    assert [
+        (record["status"], record["failure"], record["year"], record["line"])
+        for record in records
+    ] == [
+        ("valid", None, date.today().year, 1),
+        ("outdated", "outdated", 2019, 2),
+        ("missing", "missing", None, None),
+        ("binary", "binary", None, None),
+        ("valid", "rules", date.today().year, 1),
+    ]
+    assert records[1]["offset"] == 3
+    assert [record["bytes_read"] for record in records] == [
+        Path(f).stat().st_size for f in files
+    ]
+    assert all(record["scan_time"] >= 0 for record in records)
+    assert records[4]["violations"] == [
+        {"rule": "No print", "level": "error", "line": 3, "offset": 28},
+        {"rule": "No TODO", "level": "warning", "line": 2, "offset": 23},
+    ]
+
+
+def test_outdated_not_failing(files: list[str]):
+    outdated = Path(files[1])
+    policy = ScanPolicy(current_year_files=set())
+    stream = io.StringIO()
+    assert write_json_lines(
+        iter_check_results([str(outdated)], policy=policy), policy, stream
+    )
+    record = json.loads(stream.getvalue())
+    assert (record["status"], record["failure"]) == ("outdated", None)
+
+
+def test_sarif(files: list[str]):
+    policy = ScanPolicy(rules=RULES)
+    stream = io.StringIO()
+    assert not write_sarif(iter_check_results(files, policy=policy), policy, stream)
+
+    log = json.loads(stream.getvalue())
+    assert log["version"] == "2.1.0"
+    run = log["runs"][0]
+    rule_ids = [rule["id"] for rule in run["tool"]["driver"]["rules"]]
+    assert {"copyright/missing", "copyright/outdated", "No print", "No TODO"} <= set(
+        rule_ids
+    )
+    results = run["results"]
+    assert [(result["ruleId"], result["level"]) for result in results] == [
+        ("copyright/outdated", "error"),
+        ("copyright/missing", "error"),
+        ("No print", "error"),
+        ("No TODO", "warning"),
+    ]
+    outdated = results[0]
+    assert outdated["message"]["text"] == (
+        "Copyright statement for 2019, not the current year"
+    )
+    location = outdated["locations"][0]["physicalLocation"]
+    assert location["artifactLocation"]["uri"] == Path(files[1]).as_posix()
+    assert location["region"] == {"startLine": 2, "byteOffset": 3}
+    assert outdated["properties"]["year"] == 2019
+    assert outdated["properties"]["bytesRead"] == Path(files[1]).stat().st_size
+    assert "region" not in results[1]["locations"][0]["physicalLocation"]
+    assert results[2]["locations"][0]["physicalLocation"]["region"] == {
+        "startLine": 3,
+        "charOffset": 28,
+    }
+    assert results[2]["message"]["text"] == "Use logging"
+
+
+def test_sarif_without_failures(files: list[str]):
+    stream = io.StringIO()
+    assert write_report(iter_check_results(files[:1]), "sarif", ScanPolicy(), stream)
+    assert json.loads(stream.getvalue())["runs"][0]["results"] == []
+
+
+def test_sarif_is_streamed(files: list[str]):
+    stream = io.StringIO()
+
+    def results():
+        yield from iter_check_results(files[1:2])
+        # the result of the first file is written before the next one is checked
+        assert "copyright/outdated" in stream.getvalue().split('"results"')[1]
+        yield from iter_check_results(files[2:3])
+
+    assert not write_sarif(results(), ScanPolicy(), stream)
+    assert len(json.loads(stream.getvalue())["runs"][0]["results"]) == 2
+
+
+@pytest.mark.parametrize("report_format", ["json", "sarif"])
+def test_main_with_format(files: list[str], capsys, report_format: str):
+    test_args = ["script_name", *files[:3], "--format", report_format, "--fail-fast"]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+    assert e.value.code == 1
+
+    output = capsys.readouterr()
+    assert output.err == ""
+    if report_format == "json":
+        records = [json.loads(line) for line in output.out.splitlines()]
+        # stopped at the first failure
+        assert [record["status"] for record in records] == ["valid", "outdated"]
+    else:
+        results = json.loads(output.out)["runs"][0]["results"]
+        assert [result["ruleId"] for result in results] == ["copyright/outdated"]
+
+
+def test_main_with_format_and_fix():
+    test_args = ["script_name", "file1.py", "--format", "json", "--fix"]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 2
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError, match="unknown report format"):
+        write_report([], "xml", ScanPolicy(), io.StringIO())
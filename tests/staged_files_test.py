@@ -0,0 +1,118 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import re
+import subprocess
+from datetime import date
+from pathlib import Path
+
+from mirageoscience.hooks.check_copyright import ScanPolicy, check_files
+from mirageoscience.hooks.copyright_cache import git_blob_sha
+from mirageoscience.hooks.regex_rules import Rule, RuleSet
+from mirageoscience.hooks.staged_files import iter_staged_blobs, staged_blob_shas
+
+
+def test_staged_blob_shas(git_repo: Path):
+    staged_file = git_repo / "staged.py"
+    staged_file.write_text("staged content\n", encoding="utf-8")
+    unstaged_file = git_repo / "unstaged.py"
+    unstaged_file.write_text("unstaged content\n", encoding="utf-8")
+    subprocess.run(["git", "add", "staged.py"], check=True)
+
+    blob_shas = staged_blob_shas(["staged.py", "unstaged.py"])
+    assert blob_shas == {Path("staged.py"): git_blob_sha(staged_file)}
+
+
+def test_iter_staged_blobs(git_repo: Path):
+    contents = {f"file_{i}.txt": f"content {i}\n".encode() * i for i in range(5)}
+    for name, content in contents.items():
+        (git_repo / name).write_bytes(content)
+    subprocess.run(["git", "add", *contents], check=True)
+
+    file_paths = [Path(name) for name in contents] + [Path("not_staged.txt")]
+    for f, blob in iter_staged_blobs(file_paths):
+        if f.name == "not_staged.txt":
+            assert blob is None
+            continue
+        assert blob is not None
+        assert blob.size == len(contents[f.name])
+        # partially read blobs do not shift the following ones
+        assert blob.stream.read(9) == contents[f.name][:9]
+
+
+def test_iter_staged_blobs_lazily(git_repo: Path):
+    names = [f"file_{i}.txt" for i in range(600)]
+    for name in names:
+        (git_repo / name).write_text(f"content of {name}\n", encoding="utf-8")
+    subprocess.run(["git", "add", "."], check=True)
+
+    consumed = []
+
+    def file_paths():
+        for name in names:
+            consumed.append(name)
+            yield Path(name)
+
+    blobs = iter_staged_blobs(file_paths())
+    f, blob = next(blobs)
+    assert f == Path(names[0])
+    assert blob is not None and blob.stream.read() == b"content of file_0.txt\n"
+    # the files are requested a bounded number ahead of the one being read
+    assert len(consumed) < len(names)
+    assert [blob.stream.read().decode() if blob else None for _, blob in blobs] == [
+        f"content of {name}\n" for name in names[1:]
+    ]
+
+
+def test_check_staged_content(git_repo: Path):
+    current_year = date.today().year
+    test_file = git_repo / "test_file.py"
+    test_file.write_text(f"# Copyright (c) {current_year}\n", encoding="utf-8")
+    subprocess.run(["git", "add", "test_file.py"], check=True)
+    test_file.write_text("# No copyright in working tree\n", encoding="utf-8")
+
+    assert check_files(["test_file.py"], staged=True)
+    assert not check_files(["test_file.py"])
+
+    subprocess.run(["git", "add", "test_file.py"], check=True)
+    test_file.write_text(f"# Copyright (c) {current_year}\n", encoding="utf-8")
+    assert not check_files(["test_file.py"], staged=True)
+
+
+def test_check_staged_full_scan(git_repo: Path):
+    current_year = date.today().year
+    file_name = "README.rst"
+    test_file = git_repo / file_name
+    test_file.write_text(
+        "\n Not Here" * 200_000 + f"# Copyright (c) {current_year}\n", encoding="utf-8"
+    )
+    other_file = git_repo / "other.py"
+    other_file.write_text(f"# Copyright (c) {current_year}\n", encoding="utf-8")
+    subprocess.run(["git", "add", "."], check=True)
+
+    files = [file_name, "other.py"]
+    assert check_files(files, full_scan_files=[file_name], staged=True)
+    assert not check_files(files, staged=True)
+
+
+def test_check_staged_rules(git_repo: Path, capsys):
+    test_file = git_repo / "test_file.py"
+    test_file.write_text(
+        f"# Copyright (c) {date.today().year}\nshutil.rmtree\n", encoding="utf-8"
+    )
+    subprocess.run(["git", "add", "test_file.py"], check=True)
+    test_file.write_text("# No copyright in working tree\n", encoding="utf-8")
+
+    policy = ScanPolicy(
+        rules=RuleSet([Rule("No shutil.rmtree", re.compile(r"shutil\.rmtree"))])
+    )
+    assert not check_files(["test_file.py"], policy=policy, staged=True)
+    assert capsys.readouterr().err == "test_file.py:2: error: No shutil.rmtree\n"
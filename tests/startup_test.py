@@ -0,0 +1,123 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+
+"""Start-up budget of the hooks: what they import, and how long it takes, on a cold
+interpreter."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+
+# modules each entry point must not import at start-up, as only some options need them
+FORBIDDEN_MODULES = {
+    "mirageoscience.hooks.hook_client": {
+        "json",
+        "pathlib",
+        "socket",
+        "subprocess",
+        "typing",
+    },
+    "mirageoscience.hooks.check_copyright": {
+        "concurrent.futures",
+        "dataclasses",
+        "hashlib",
+        "json",
+        "sqlite3",
+        "subprocess",
+        "tempfile",
+        "tomllib",
+    },
+    "mirageoscience.hooks.git_message_hook": {
+        "concurrent.futures",
+        "csv",
+        "dataclasses",
+        "hashlib",
+        "shlex",
+        "sqlite3",
+        "subprocess",
+        "tempfile",
+        "tomllib",
+    },
+}
+# cumulative import time of each entry point, in milliseconds: generous, so that
+# only actual regressions fail (typical values are 3 to 5 times lower)
+IMPORT_BUDGET_MS = {
+    "mirageoscience.hooks.hook_client": 25,
+    "mirageoscience.hooks.check_copyright": 150,
+    "mirageoscience.hooks.git_message_hook": 150,
+}
+# wall-clock time of the start-up of a hook, beyond the one of a bare interpreter
+STARTUP_BUDGET_MS = 300
+_RUNS = 5
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    # no bytecode written, but the one already compiled is used
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def _import_time_us(module: str) -> int:
+    """:return: the cumulative import time of the module, in microseconds, as
+    reported by `python -X importtime`."""
+    output = _python("-X", "importtime", "-c", f"import {module}").stderr
+    for line in output.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise AssertionError(f"no import time reported for {module}")
+
+
+def _wall_time(*args: str) -> float:
+    """:return: the best wall-clock time of the given interpreter run, in seconds."""
+    best = float("inf")
+    for _ in range(_RUNS):
+        start = time.perf_counter()
+        _python(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("module", sorted(FORBIDDEN_MODULES))
+def test_lazy_imports(module: str):
+    code = (
+        "import sys; before = set(sys.modules); "
+        f"import {module}; print(' '.join(set(sys.modules) - before))"
+    )
+    imported = set(_python("-c", code).stdout.split())
+    assert not imported & FORBIDDEN_MODULES[module]
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_MS))
+def test_import_time_budget(module: str):
+    _python("-c", f"import {module}")  # warm up the bytecode and OS caches
+    best_us = min(_import_time_us(module) for _ in range(_RUNS))
+    assert best_us / 1000 < IMPORT_BUDGET_MS[module]
+
+
+@pytest.mark.parametrize(
+    "command", [["check-copyright", "--help"], ["git-message-hook", "--help"]]
+)
+def test_startup_budget(command: list[str]):
+    bare = _wall_time("-c", "pass")
+    hook = _wall_time("-m", "mirageoscience.hooks.hook_client", *command)
+    assert (hook - bare) * 1000 < STARTUP_BUDGET_MS
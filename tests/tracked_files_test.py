@@ -0,0 +1,88 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2026 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of mirageoscience.pre-commit-hooks package.                    '
+#                                                                                   '
+#  mirageoscience.pre-commit-hooks is distributed under the terms and conditions    '
+#  of the MIT License (see LICENSE file at the root of this source code package).   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mirageoscience.hooks.check_copyright import main as check_copyright_main
+from mirageoscience.hooks.tracked_files import iter_tracked_files
+
+
+@pytest.fixture
+def tracked_repo(git_repo: Path) -> Path:
+    (git_repo / ".gitattributes").write_text(
+        "generated/* linguist-generated\n*.txt -copyright\n", encoding="utf-8"
+    )
+    (git_repo / "generated").mkdir()
+    (git_repo / "src").mkdir()
+    for name in ["generated/data.py", "src/module.py", "src/notes.txt", "top.py"]:
+        (git_repo / name).write_text("content\n", encoding="utf-8")
+    (git_repo / "untracked.py").write_text("content\n", encoding="utf-8")
+    subprocess.run(
+        ["git", "add", ".gitattributes", "generated", "src", "top.py"], check=True
+    )
+    return git_repo
+
+
+def test_iter_tracked_files(tracked_repo: Path):
+    assert list(iter_tracked_files()) == [".gitattributes", "src/module.py", "top.py"]
+
+
+def test_iter_tracked_files_with_globs(tracked_repo: Path):
+    assert list(iter_tracked_files(include=["*.py"])) == ["src/module.py", "top.py"]
+    assert list(iter_tracked_files(include=["*.py"], exclude=["src/*"])) == ["top.py"]
+
+
+def test_iter_tracked_files_skips_deleted(tracked_repo: Path):
+    (tracked_repo / "top.py").unlink()
+    assert list(iter_tracked_files(include=["*.py"])) == ["src/module.py"]
+
+
+def test_iter_tracked_files_stops_early(tracked_repo: Path):
+    for i in range(1000):
+        (tracked_repo / "src" / f"file_{i}.py").write_text(
+            "content\n", encoding="utf-8"
+        )
+    subprocess.run(["git", "add", "src"], check=True)
+    tracked_files = iter_tracked_files()
+    assert next(tracked_files) == ".gitattributes"
+    tracked_files.close()
+
+
+def test_main_with_all(tracked_repo: Path, capsys):
+    current_year = date.today().year
+    (tracked_repo / "top.py").write_text(
+        f"# Copyright (c) {current_year}\n", encoding="utf-8"
+    )
+    test_args = ["script_name", "--all", "--include", "*.py"]
+    with mock.patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 1
+    assert capsys.readouterr().err == "src/module.py: No copyright or invalid year\n"
+
+
+def test_all_out_of_git_repo(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(subprocess.CalledProcessError):
+        list(iter_tracked_files())
+
+    with mock.patch.object(sys, "argv", ["script_name", "--all"]):
+        with pytest.raises(SystemExit) as e:
+            check_copyright_main()
+        assert e.value.code == 2
+    assert "--all cannot list the files tracked by git" in capsys.readouterr().err